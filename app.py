@@ -11,15 +11,24 @@ Access: http://localhost:5000
 import os
 import re
 import json
+import queue
+import random
+import hashlib
+import itertools
 import sqlite3
 import secrets
 import threading
 import time
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from functools import wraps
+from functools import lru_cache, wraps
+from html import escape as escape_html
 
-from flask import Flask, request, jsonify, send_from_directory, session, render_template_string
+from flask import Flask, Response, request, jsonify, send_from_directory, session, stream_with_context
+from markupsafe import Markup, escape
 import bcrypt
 
 # Optional: dateutil for flexible date parsing
@@ -56,6 +65,33 @@ except ImportError:
     HAS_AIRTABLE = False
     print("INFO: Airtable integration not available.")
 
+# Optional: Flask-Compress for brotli/gzip compression of HTML, CSS and JS responses
+try:
+    from flask_compress import Compress
+    HAS_FLASK_COMPRESS = True
+except ImportError:
+    HAS_FLASK_COMPRESS = False
+    print("INFO: Flask-Compress not installed. Responses will be sent uncompressed.")
+    print("Install with: pip install flask-compress")
+
+# Optional: orjson for faster parsing of form response files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Optional: watchdog so the folder watcher reacts to new response files
+# instead of walking the whole project folder on every pass
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    HAS_WATCHDOG = True
+except ImportError:
+    HAS_WATCHDOG = False
+    print("INFO: watchdog not installed. Response folders will be polled.")
+    print("Install with: pip install watchdog")
+
 # Optional: openpyxl for Excel file updates
 try:
     from openpyxl import load_workbook, Workbook
@@ -145,6 +181,14 @@ def get_qcr_review_days():
     settings = CONFIG.get('due_date_settings', {})
     return settings.get('qcr_review_days', 2)
 
+# Bump when calculate_review_due_dates changes so init_db recalculates every item
+DUE_DATE_LOGIC_VERSION = 1
+
+def due_date_fingerprint():
+    """Get a hash identifying the due date logic version and the settings it uses."""
+    settings = json.dumps(CONFIG.get('due_date_settings', {}), sort_keys=True)
+    return hashlib.md5(f'{DUE_DATE_LOGIC_VERSION}:{settings}'.encode('utf-8')).hexdigest()
+
 # Legacy constants for backward compatibility
 PRIORITY_MIN_DAYS = {
     'High': 5,
@@ -163,6 +207,21 @@ QCR_REVIEW_DAYS = 2
 # WORKDAY HELPER FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_part):
+    """Parse a 'YYYY-MM-DD' string to a date, or None.
+    
+    Cached because the same due dates recur across every item in a batch;
+    fromisoformat handles the usual zero-padded form without strptime's
+    format parsing, and strptime still covers anything else it accepted.
+    """
+    try:
+        if len(date_part) == 10 and date_part[4] == date_part[7] == '-':
+            return datetime.fromisoformat(date_part).date()
+        return datetime.strptime(date_part, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
 def parse_date_string(date_str):
     """Safely parse a date string to a date object.
     
@@ -179,15 +238,15 @@ def parse_date_string(date_str):
         return date_str.date()
     if isinstance(date_str, str):
         # Strip time component if present
-        date_part = date_str.split('T')[0].split(' ')[0]
-        try:
-            return datetime.strptime(date_part, '%Y-%m-%d').date()
-        except:
-            return None
+        return _parse_ymd(date_str.split('T')[0].split(' ')[0])
     return None
 
+@lru_cache(maxsize=1024)
 def format_date_for_email(date_str):
-    """Format a date string for display in emails (e.g., 'Wed, 1/19/26')."""
+    """Format a date string for display in emails (e.g., 'Wed, 1/19/26').
+    
+    Reminder runs format the same few due dates many times, so results are cached.
+    """
     if not date_str:
         return 'N/A'
     try:
@@ -815,6 +874,19 @@ app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
 app.config['SESSION_COOKIE_HTTPONLY'] = True
 app.config['SESSION_COOKIE_SECURE'] = False  # Set True if using HTTPS
 
+# Compress the large magic-link form pages and their stylesheet (brotli first, gzip fallback)
+if HAS_FLASK_COMPRESS:
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'text/javascript', 'application/javascript']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    # Moderate levels keep CPU per response low: COMPRESS_LEVEL is gzip's,
+    # brotli (what browsers negotiate first) has its own setting
+    app.config['COMPRESS_LEVEL'] = 5
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    # Streamed pages (the QC review forms) go out uncompressed: compressing them
+    # would buffer the whole generator and lose the early chunks
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+
 # =============================================================================
 # EMAIL RETRY QUEUE - For handling failed email sends
 # =============================================================================
@@ -823,6 +895,14 @@ app.config['SESSION_COOKIE_SECURE'] = False  # Set True if using HTTPS
 PENDING_EMAILS = []
 PENDING_EMAILS_LOCK = threading.Lock()
 MAX_EMAIL_RETRIES = 3
+# Queued emails are retried after EMAIL_RETRY_BASE_SECONDS, then twice as long
+# after each further failure, so an Outlook outage is not retried every pass
+EMAIL_RETRY_BASE_SECONDS = 30
+
+def _email_retry_time(retries):
+    """When to retry an email that has failed retries times, with jitter so queued emails spread out."""
+    delay = EMAIL_RETRY_BASE_SECONDS * 2 ** retries + random.uniform(0, EMAIL_RETRY_BASE_SECONDS)
+    return datetime.now() + timedelta(seconds=delay)
 
 def queue_pending_email(email_type, item_id, **kwargs):
     """Add an email to the retry queue."""
@@ -836,7 +916,7 @@ def queue_pending_email(email_type, item_id, **kwargs):
             'email_type': email_type,
             'item_id': item_id,
             'retries': 0,
-            'last_attempt': None,
+            'next_attempt': _email_retry_time(0),
             'kwargs': kwargs
         })
         print(f"  [EmailQueue] Queued {email_type} for item {item_id}")
@@ -878,16 +958,15 @@ def process_pending_emails():
         if not PENDING_EMAILS:
             return
         
+        now = datetime.now()
         to_remove = []
         for pending in PENDING_EMAILS:
-            # Skip if attempted recently (wait at least 30 seconds between attempts)
-            if pending['last_attempt']:
-                elapsed = (datetime.now() - pending['last_attempt']).total_seconds()
-                if elapsed < 30:
-                    continue
+            # Skip until its backoff has passed
+            if pending['next_attempt'] > now:
+                continue
             
-            pending['last_attempt'] = datetime.now()
             pending['retries'] += 1
+            pending['next_attempt'] = _email_retry_time(pending['retries'])
             
             email_type = pending['email_type']
             item_id = pending['item_id']
@@ -932,304 +1011,144 @@ def process_pending_emails():
 # HTML TEMPLATES FOR MAGIC-LINK RESPONSE PAGES
 # =============================================================================
 
-BASE_PAGE_STYLE = '''
-<style>
-    * { box-sizing: border-box; margin: 0; padding: 0; }
-    body {
-        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        min-height: 100vh;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        padding: 20px;
-    }
-    .container {
-        background: white;
-        border-radius: 16px;
-        box-shadow: 0 25px 50px rgba(0,0,0,0.15);
-        padding: 40px;
-        max-width: 700px;
-        width: 100%;
-    }
-    h1 {
-        color: #1a1a2e;
-        font-size: 24px;
-        margin-bottom: 8px;
-    }
-    .subtitle {
-        color: #666;
-        font-size: 14px;
-        margin-bottom: 24px;
-    }
-    .info-box {
-        background: #f8f9fa;
-        border-radius: 8px;
-        padding: 16px;
-        margin-bottom: 24px;
-    }
-    .info-row {
-        display: flex;
-        margin-bottom: 8px;
-    }
-    .info-row:last-child { margin-bottom: 0; }
-    .info-label {
-        font-weight: 600;
-        color: #444;
-        width: 140px;
-        flex-shrink: 0;
-    }
-    .info-value {
-        color: #666;
-    }
-    .section-title {
-        font-size: 16px;
-        font-weight: 600;
-        color: #1a1a2e;
-        margin-bottom: 12px;
-    }
-    .form-group {
-        margin-bottom: 20px;
-    }
-    label {
-        display: block;
-        font-weight: 500;
-        color: #444;
-        margin-bottom: 6px;
-    }
-    select, textarea {
-        width: 100%;
-        padding: 10px 12px;
-        border: 1px solid #ddd;
-        border-radius: 8px;
-        font-size: 14px;
-        font-family: inherit;
-    }
-    select:focus, textarea:focus {
-        outline: none;
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102,126,234,0.1);
-    }
-    textarea { resize: vertical; min-height: 100px; }
-    .file-list {
-        background: #f8f9fa;
-        border-radius: 8px;
-        padding: 12px;
-        max-height: 200px;
-        overflow-y: auto;
-    }
-    .file-item {
-        display: flex;
-        align-items: center;
-        padding: 8px;
-        border-radius: 6px;
-        margin-bottom: 4px;
-    }
-    .file-item:hover { background: #e9ecef; }
-    .file-item input { margin-right: 10px; }
-    .file-item label {
-        margin-bottom: 0;
-        font-weight: normal;
-        color: #333;
-        cursor: pointer;
-    }
-    .btn {
-        display: inline-block;
-        padding: 12px 24px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        font-size: 16px;
-        font-weight: 600;
-        cursor: pointer;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
-    .btn:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 5px 20px rgba(102,126,234,0.4);
-    }
-    .reviewer-notes-box {
-        background: #fff3cd;
-        border: 1px solid #ffc107;
-        border-radius: 8px;
-        padding: 16px;
-        margin-bottom: 24px;
-    }
-    .reviewer-notes-box h3 {
-        font-size: 14px;
-        color: #856404;
-        margin-bottom: 8px;
-    }
-    .reviewer-notes-box p {
-        color: #856404;
-        font-size: 14px;
-        white-space: pre-wrap;
-    }
-    .error-container {
-        text-align: center;
-    }
-    .error-icon {
-        font-size: 64px;
-        margin-bottom: 20px;
-    }
-    .success-container {
-        text-align: center;
-    }
-    .success-icon {
-        font-size: 64px;
-        margin-bottom: 20px;
-    }
-</style>
-'''
+# Page styles and the QC form script live in static/qcr.css and static/qcr.js.
+# Their URLs carry a content hash so both can be served as immutable and
+# cached by the browser.
+def _asset_url(filename):
+    """Return a content-hashed URL for a file in static/."""
+    digest = hashlib.md5((BASE_DIR / "static" / filename).read_bytes()).hexdigest()[:12]
+    return f'/static/{filename}?v={digest}'
 
-ERROR_PAGE_TEMPLATE = '''
+PAGE_CSS_URL = _asset_url('qcr.css')
+PAGE_JS_URL = _asset_url('qcr.js')
+PAGE_CSS_LINK = f'<link rel="stylesheet" href="{PAGE_CSS_URL}">'
+
+ERROR_PAGE_TEMPLATE = f'''
 <!DOCTYPE html>
 <html>
 <head>
     <title>Error - LEB Tracker</title>
-    ''' + BASE_PAGE_STYLE + '''
+    {PAGE_CSS_LINK}
 </head>
 <body>
     <div class="container error-container">
         <div class="error-icon">❌</div>
         <h1>Error</h1>
-        <p style="color: #666; margin-top: 12px;">{{ error }}</p>
+        <p style="color: #666; margin-top: 12px;">$error</p>
     </div>
 </body>
 </html>
 '''
 
-ALREADY_RESPONDED_TEMPLATE = '''
+ALREADY_RESPONDED_TEMPLATE = f'''
 <!DOCTYPE html>
 <html>
 <head>
     <title>Already Submitted - LEB Tracker</title>
-    ''' + BASE_PAGE_STYLE + '''
+    {PAGE_CSS_LINK}
 </head>
 <body>
     <div class="container success-container">
         <div class="success-icon">✅</div>
         <h1>Already Submitted</h1>
         <p style="color: #666; margin-top: 12px;">
-            This {{ 'review' if response_type == 'reviewer' else 'QC review' }} for 
-            <strong>{{ item.type }} {{ item.identifier }}</strong> has already been submitted.
+            This $response_label for 
+            <strong>$item_type $item_identifier</strong> has already been submitted.
         </p>
     </div>
 </body>
 </html>
 '''
 
-SUCCESS_TEMPLATE = '''
+SUCCESS_TEMPLATE = f'''
 <!DOCTYPE html>
 <html>
 <head>
     <title>Success - LEB Tracker</title>
-    ''' + BASE_PAGE_STYLE + '''
+    {PAGE_CSS_LINK}
 </head>
 <body>
     <div class="container success-container">
         <div class="success-icon">✅</div>
-        <h1>{{ message }}</h1>
-        <p style="color: #666; margin-top: 12px;">{{ details }}</p>
+        <h1>$message</h1>
+        <p style="color: #666; margin-top: 12px;">$details</p>
     </div>
 </body>
 </html>
 '''
 
+# The three status pages only substitute a few plain-text values, so they skip
+# Jinja entirely: each is split once at import into pre-encoded UTF-8 chunks
+# around its $placeholders, and rendering just joins bytes.
+def _split_page(template):
+    """Split a $placeholder page into static byte chunks and field names."""
+    parts = re.split(r'\$(\w+)', template)
+    return [part.encode('utf-8') for part in parts[0::2]], parts[1::2]
+
+def _render_page(page, **values):
+    """Build an HTML response from a split page, escaping each value."""
+    chunks, names = page
+    body = [chunks[0]]
+    for name, chunk in zip(names, chunks[1:]):
+        body.append(escape_html(values[name]).encode('utf-8'))
+        body.append(chunk)
+    return Response(b''.join(body), mimetype='text/html')
+
+_ERROR_PAGE = _split_page(ERROR_PAGE_TEMPLATE)
+_ALREADY_RESPONDED_PAGE = _split_page(ALREADY_RESPONDED_TEMPLATE)
+_SUCCESS_PAGE = _split_page(SUCCESS_TEMPLATE)
+
+def render_error_page(error):
+    """Render the magic-link error page."""
+    return _render_page(_ERROR_PAGE, error=error)
+
+def render_already_responded_page(item, response_type):
+    """Render the page shown when a response was already submitted."""
+    return _render_page(_ALREADY_RESPONDED_PAGE,
+        response_label='review' if response_type == 'reviewer' else 'QC review',
+        item_type=item['type'] or '',
+        item_identifier=item['identifier'] or ''
+    )
+
+def render_success_page(message, details):
+    """Render the magic-link success page."""
+    return _render_page(_SUCCESS_PAGE, message=message, details=details)
+
+def multiline_html(text):
+    """Escape multi-line text for a form page, turning newlines into <br>."""
+    if not text:
+        return Markup('')
+    return Markup('<br>').join(escape(line) for line in text.split('\n'))
+
 REVIEWER_RESPONSE_TEMPLATE = '''
 <!DOCTYPE html>
 <html>
 <head>
     <title>Review Response - {{ item.type }} {{ item.identifier }}</title>
-    ''' + BASE_PAGE_STYLE + '''
-    <style>
-        .version-badge {
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-left: 10px;
-        }
-        .resubmit-notice {
-            background: #fef3c7;
-            border: 1px solid #f59e0b;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .resubmit-notice h3 {
-            margin: 0 0 8px 0;
-            color: #92400e;
-        }
-        .previous-response {
-            background: #f0f9ff;
-            border: 1px solid #bae6fd;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .previous-response h4 {
-            margin: 0 0 10px 0;
-            color: #0369a1;
-        }
-        .qcr-feedback {
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .qcr-feedback h4 {
-            margin: 0 0 10px 0;
-            color: #991b1b;
-        }
-        .version-history {
-            font-size: 12px;
-            color: #666;
-            margin-top: 10px;
-        }
-        .closed-notice {
-            background: #f3f4f6;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-        }
-        .closed-notice h3 {
-            color: #6b7280;
-            margin: 0 0 10px 0;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ page_css_url }}">
 </head>
-<body>
+<body class="page-reviewer">
+    {% macro notice(kind, title, body='') %}
+    <div class="notice notice-{{ kind }}">
+        <h3>{{ title }}</h3>
+        {% if caller %}{{ caller() }}{% else %}<p>{{ body|safe }}</p>{% endif %}
+    </div>
+    {% endmacro %}
     <div class="container">
         <h1>Initial Review Response <span class="version-badge">v{{ version }}</span></h1>
         <p class="subtitle">{{ item.type }} {{ item.identifier }}</p>
         
-        {% if is_closed %}
-        <div class="closed-notice">
-            <h3>🔒 This Item Has Been Closed</h3>
-            <p>No further changes can be submitted. Contact the project administrator if this is unexpected.</p>
-        </div>
-        {% elif not can_submit %}
-        <div class="closed-notice">
-            <h3>⚠️ Submission Not Allowed</h3>
-            <p>This item has been finalized in QC. Contact the project administrator if additional changes are required.</p>
-        </div>
+        {% if lock_notice %}
+        {{ notice('closed', lock_notice.title, lock_notice.body) }}
         {% else %}
         
-        {% if is_resubmit and qcr_feedback %}
-        <div class="qcr-feedback">
-            <h4>↩️ QC Reviewer Requested Revisions</h4>
+        {% if is_resubmit and qcr_feedback_html %}
+        {% call notice('qcr', '↩️ QC Reviewer Requested Revisions') %}
             <p><strong>Feedback on your v{{ version - 1 }} response:</strong></p>
-            <div style="background: white; padding: 10px; border-radius: 4px; margin-top: 8px;">
-                {{ qcr_feedback|replace('\n', '<br>')|safe }}
+            <div class="notice-body">
+                {{ qcr_feedback_html }}
             </div>
-        </div>
+        {% endcall %}
         {% endif %}
         
         {% if is_resubmit and previous_response %}
@@ -1238,7 +1157,7 @@ REVIEWER_RESPONSE_TEMPLATE = '''
             <p><strong>Category:</strong> {{ previous_response.category or 'N/A' }}</p>
             <p><strong>Notes:</strong></p>
             <div style="background: white; padding: 10px; border-radius: 4px; margin-top: 8px;">
-                {{ (previous_response.text or 'No notes')|replace('\n', '<br>')|safe }}
+                {{ previous_response.text_html }}
             </div>
             {% if version_history %}
             <div class="version-history">
@@ -1249,10 +1168,7 @@ REVIEWER_RESPONSE_TEMPLATE = '''
         {% endif %}
         
         {% if is_resubmit %}
-        <div class="resubmit-notice">
-            <h3>📝 Resubmitting Response</h3>
-            <p>You are updating your response to version {{ version }}. The QC Reviewer will be notified of your changes.</p>
-        </div>
+        {{ notice('resubmit', '📝 Resubmitting Response', 'You are updating your response to version %d. The QC Reviewer will be notified of your changes.' % version) }}
         {% endif %}
         
         <div class="info-box">
@@ -1279,14 +1195,7 @@ REVIEWER_RESPONSE_TEMPLATE = '''
             
             <div class="form-group">
                 <label for="response_category">Response Category *</label>
-                <select name="response_category" id="response_category" required>
-                    <option value="">-- Select --</option>
-                    <option value="Approved" {% if previous_response and previous_response.category == 'Approved' %}selected{% endif %}>Approved</option>
-                    <option value="Approved as Noted" {% if previous_response and previous_response.category == 'Approved as Noted' %}selected{% endif %}>Approved as Noted</option>
-                    <option value="For Record Only" {% if previous_response and previous_response.category == 'For Record Only' %}selected{% endif %}>For Record Only</option>
-                    <option value="Rejected" {% if previous_response and previous_response.category == 'Rejected' %}selected{% endif %}>Rejected</option>
-                    <option value="Revise and Resubmit" {% if previous_response and previous_response.category == 'Revise and Resubmit' %}selected{% endif %}>Revise and Resubmit</option>
-                </select>
+                {{ category_select(previous_response.category if previous_response else '') }}
             </div>
             
             <div class="form-group">
@@ -1328,105 +1237,24 @@ QCR_RESPONSE_TEMPLATE = '''
 <html>
 <head>
     <title>QC Review - {{ item.type }} {{ item.identifier }}</title>
-    ''' + BASE_PAGE_STYLE + '''
-    <style>
-        .reviewer-response-box {
-            background: #f0fdf4;
-            border: 1px solid #86efac;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 20px 0;
-        }
-        .reviewer-response-box h3 {
-            margin: 0 0 12px 0;
-            color: #166534;
-        }
-        .action-group {
-            background: #fef3c7;
-            border: 1px solid #fbbf24;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 20px 0;
-        }
-        .action-group h3 {
-            margin: 0 0 12px 0;
-            color: #92400e;
-        }
-        .radio-group {
-            display: flex;
-            flex-direction: column;
-            gap: 10px;
-        }
-        .radio-option {
-            display: flex;
-            align-items: flex-start;
-            gap: 10px;
-            padding: 10px;
-            background: white;
-            border-radius: 6px;
-            border: 1px solid #e5e7eb;
-            cursor: pointer;
-        }
-        .radio-option:hover {
-            border-color: #667eea;
-        }
-        .radio-option input[type="radio"] {
-            margin-top: 3px;
-        }
-        .radio-option-content {
-            flex: 1;
-        }
-        .radio-option-label {
-            font-weight: 600;
-            color: #333;
-        }
-        .radio-option-desc {
-            font-size: 12px;
-            color: #666;
-            margin-top: 4px;
-        }
-        .response-text-container {
-            margin-top: 15px;
-        }
-        .response-text-label {
-            font-weight: 600;
-            margin-bottom: 8px;
-            color: #333;
-        }
-        .response-text-readonly {
-            background: #f9fafb;
-            border: 1px solid #e5e7eb;
-            border-radius: 6px;
-            padding: 12px;
-            white-space: pre-wrap;
-            color: #666;
-            min-height: 80px;
-        }
-        #response_text_area {
-            display: none;
-        }
-        .send-back-warning {
-            display: none;
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 8px;
-            padding: 12px;
-            margin-top: 15px;
-            color: #991b1b;
-        }
-        .version-badge {
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-left: 10px;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ page_css_url }}">
 </head>
-<body>
+<body class="page-qcr">
+    {% macro info_row(label, value, style='') %}
+            <div class="info-row">
+                <span class="info-label">{{ label }}:</span>
+                <span class="info-value"{% if style %} style="{{ style }}"{% endif %}>{{ value }}</span>
+            </div>
+    {%- endmacro %}
+    {% macro radio_opt(name, value, label, desc, required=False, checked=False, error='') %}
+                    <label class="radio-option">
+                        <input type="radio" name="{{ name }}" value="{{ value }}"{% if required %} required{% endif %}{% if checked %} checked{% endif %}{% if error %} data-error="{{ error }}"{% endif %}>
+                        <div class="radio-option-content">
+                            <div class="radio-option-label">{{ label }}</div>
+                            <div class="radio-option-desc">{{ desc }}</div>
+                        </div>
+                    </label>
+    {%- endmacro %}
     <div class="container">
         <h1>QC Review <span class="version-badge">v{{ version }}</span></h1>
         <p class="subtitle">{{ item.type }} {{ item.identifier }}</p>
@@ -1434,46 +1262,22 @@ QCR_RESPONSE_TEMPLATE = '''
         {% if version_history %}
         <div style="background: #f0f9ff; border: 1px solid #bae6fd; border-radius: 8px; padding: 12px; margin-bottom: 15px; font-size: 13px;">
             <strong>📋 Reviewer Response Version History:</strong><br>
-            Current: <strong>v{{ version }}</strong> ({{ item.reviewer_response_at[:16]|replace('T', ' ') if item.reviewer_response_at else 'N/A' }})<br>
+            Current: <strong>v{{ version }}</strong> ({{ reviewer_response_when }})<br>
             {% for v in version_history %}
-            Previous: v{{ v.version }} ({{ v.submitted_at[:16]|replace('T', ' ') }}) - {{ v.response_category or 'N/A' }}{% if not loop.last %}<br>{% endif %}
+            Previous: v{{ v.version }} ({{ v.when }}) - {{ v.category }}{% if not loop.last %}<br>{% endif %}
             {% endfor %}
         </div>
         {% endif %}
         
         <div class="info-box">
-            <div class="info-row">
-                <span class="info-label">Title:</span>
-                <span class="info-value">{{ item.title or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">Date Received:</span>
-                <span class="info-value">{{ item.date_received or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">Priority:</span>
-                <span class="info-value">{{ item.priority or 'Normal' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">Initial Reviewer:</span>
-                <span class="info-value">{{ item.reviewer_name or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">QC Reviewer:</span>
-                <span class="info-value">{{ item.qcr_name or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">QC Due Date:</span>
-                <span class="info-value" style="color: #d97706;">{{ item.qcr_due_date or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">Contractor Due Date:</span>
-                <span class="info-value">{{ item.due_date or 'N/A' }}</span>
-            </div>
-            <div class="info-row">
-                <span class="info-label">Folder:</span>
-                <span class="info-value">{{ item.folder_link or 'N/A' }}</span>
-            </div>
+            {{- info_row('Title', item.title or 'N/A') }}
+            {{- info_row('Date Received', item.date_received or 'N/A') }}
+            {{- info_row('Priority', item.priority or 'Normal') }}
+            {{- info_row('Initial Reviewer', item.reviewer_name or 'N/A') }}
+            {{- info_row('QC Reviewer', item.qcr_name or 'N/A') }}
+            {{- info_row('QC Due Date', item.qcr_due_date or 'N/A', 'color: #d97706;') }}
+            {{- info_row('Contractor Due Date', item.due_date or 'N/A') }}
+            {{- info_row('Folder', item.folder_link or 'N/A') }}
         </div>
         
         <!-- Reviewer's Response Section -->
@@ -1514,83 +1318,40 @@ QCR_RESPONSE_TEMPLATE = '''
             <div class="action-group">
                 <h3>🎯 Your QC Decision</h3>
                 <div class="radio-group">
-                    <label class="radio-option">
-                        <input type="radio" name="qc_action" value="Approve" required>
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">✅ Approve</div>
-                            <div class="radio-option-desc">Accept the reviewer's response as final. No changes needed.</div>
-                        </div>
-                    </label>
-                    <label class="radio-option">
-                        <input type="radio" name="qc_action" value="Modify" required>
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">✏️ Modify</div>
-                            <div class="radio-option-desc">Make adjustments to the response. You can tweak or revise the text.</div>
-                        </div>
-                    </label>
-                    <label class="radio-option">
-                        <input type="radio" name="qc_action" value="Send Back" required>
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">↩️ Send Back to Reviewer</div>
-                            <div class="radio-option-desc">Return to the reviewer for revisions. You'll specify what needs to change.</div>
-                        </div>
-                    </label>
+                    {{- radio_opt('qc_action', 'Approve', '✅ Approve', "Accept the reviewer's response as final. No changes needed.", required=True, error='Please select a QC decision.') }}
+                    {{- radio_opt('qc_action', 'Modify', '✏️ Modify', 'Make adjustments to the response. You can tweak or revise the text.', required=True, error='Please select a QC decision.') }}
+                    {{- radio_opt('qc_action', 'Send Back', '↩️ Send Back to Reviewer', "Return to the reviewer for revisions. You'll specify what needs to change.", required=True, error='Please select a QC decision.') }}
                 </div>
             </div>
             
-            <div class="send-back-warning" id="send-back-warning">
+            <div class="send-back-warning hidden" id="send-back-warning">
                 ⚠️ <strong>Sending Back:</strong> The item will be returned to the Initial Reviewer for revision. They will receive an email with your notes explaining what changes are needed.
             </div>
             
             <!-- Response Text Handling (shown only for Approve/Modify) -->
-            <div class="form-group" id="response-mode-group" style="display: none;">
+            <div class="form-group hidden" id="response-mode-group">
                 <label style="font-weight: 600; margin-bottom: 12px; display: block;">📄 Response Text Handling</label>
                 <div class="radio-group">
-                    <label class="radio-option">
-                        <input type="radio" name="response_mode" value="Keep" checked>
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">Keep as is</div>
-                            <div class="radio-option-desc">Use the reviewer's original response text without changes.</div>
-                        </div>
-                    </label>
-                    <label class="radio-option">
-                        <input type="radio" name="response_mode" value="Tweak">
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">Tweak</div>
-                            <div class="radio-option-desc">Start with the reviewer's text and make minor edits.</div>
-                        </div>
-                    </label>
-                    <label class="radio-option">
-                        <input type="radio" name="response_mode" value="Revise">
-                        <div class="radio-option-content">
-                            <div class="radio-option-label">Revise</div>
-                            <div class="radio-option-desc">Write a completely new response from scratch.</div>
-                        </div>
-                    </label>
+                    {{- radio_opt('response_mode', 'Keep', 'Keep as is', "Use the reviewer's original response text without changes.", checked=True) }}
+                    {{- radio_opt('response_mode', 'Tweak', 'Tweak', "Start with the reviewer's text and make minor edits.") }}
+                    {{- radio_opt('response_mode', 'Revise', 'Revise', 'Write a completely new response from scratch.') }}
                 </div>
                 
                 <div class="response-text-container" id="response-text-container">
-                    <div class="response-text-label">Description (Final Response Text): <span id="notes-required-hint" style="display: none; color: #dc2626;">* Required for Send Back</span></div>
+                    <div class="response-text-label">Description (Final Response Text): <span id="notes-required-hint" class="hidden" style="color: #dc2626;">* Required for Send Back</span></div>
                     <div class="response-text-readonly" id="response_text_readonly">{{ item.reviewer_response_text or item.reviewer_notes or '' }}</div>
-                    <textarea name="response_text" id="response_text_area" placeholder="Enter your response text...">{{ item.reviewer_response_text or item.reviewer_notes or '' }}</textarea>
+                    <textarea name="response_text" id="response_text_area" class="hidden" placeholder="Enter your response text..." data-error="Please provide a description explaining what revisions are needed.">{{ item.reviewer_response_text or item.reviewer_notes or '' }}</textarea>
                 </div>
             </div>
             
             <!-- Final Response Category (shown only for Approve/Modify) -->
-            <div class="form-group" id="category-group" style="display: none;">
+            <div class="form-group hidden" id="category-group">
                 <label for="response_category">Final Response Category *</label>
-                <select name="response_category" id="response_category">
-                    <option value="">-- Select --</option>
-                    <option value="Approved" {% if item.reviewer_response_category == 'Approved' %}selected{% endif %}>Approved</option>
-                    <option value="Approved as Noted" {% if item.reviewer_response_category == 'Approved as Noted' %}selected{% endif %}>Approved as Noted</option>
-                    <option value="For Record Only" {% if item.reviewer_response_category == 'For Record Only' %}selected{% endif %}>For Record Only</option>
-                    <option value="Rejected" {% if item.reviewer_response_category == 'Rejected' %}selected{% endif %}>Rejected</option>
-                    <option value="Revise and Resubmit" {% if item.reviewer_response_category == 'Revise and Resubmit' %}selected{% endif %}>Revise and Resubmit</option>
-                </select>
+                {{ category_select(item.reviewer_response_category, required=False, error='Please select a final response category.') }}
             </div>
             
             <!-- File Selection (shown only for Approve/Modify) -->
-            <div class="form-group" id="files-group" style="display: none;">
+            <div class="form-group hidden" id="files-group">
                 <p class="section-title">Confirm Files to Include in Response</p>
                 <p style="color: #666; font-size: 13px; margin-bottom: 8px;">Files selected by the Initial Reviewer are pre-checked. You can adjust as needed.</p>
                 <div class="file-list">
@@ -1618,105 +1379,8 @@ QCR_RESPONSE_TEMPLATE = '''
         </form>
     </div>
     
-    <script>
-        const reviewerText = document.getElementById('reviewer_original_text')?.innerText || '{{ (item.reviewer_response_text or item.reviewer_notes or "")|e }}';
-        const responseModeGroup = document.getElementById('response-mode-group');
-        const categoryGroup = document.getElementById('category-group');
-        const filesGroup = document.getElementById('files-group');
-        const sendBackWarning = document.getElementById('send-back-warning');
-        const notesRequiredHint = document.getElementById('notes-required-hint');
-        const responseTextReadonly = document.getElementById('response_text_readonly');
-        const responseTextArea = document.getElementById('response_text_area');
-        const submitBtn = document.getElementById('submit-btn');
-        const categorySelect = document.getElementById('response_category');
-        
-        // Handle QC Action change
-        document.querySelectorAll('input[name="qc_action"]').forEach(radio => {
-            radio.addEventListener('change', function() {
-                const action = this.value;
-                
-                if (action === 'Send Back') {
-                    responseModeGroup.style.display = 'none';
-                    categoryGroup.style.display = 'none';
-                    filesGroup.style.display = 'none';
-                    sendBackWarning.style.display = 'block';
-                    notesRequiredHint.style.display = 'inline';
-                    categorySelect.required = false;
-                    submitBtn.textContent = '↩️ Send Back to Reviewer';
-                    submitBtn.style.background = '#f59e0b';
-                    // Show textarea for Send Back explanation
-                    responseTextReadonly.style.display = 'none';
-                    responseTextArea.style.display = 'block';
-                    responseTextArea.value = '';
-                    responseTextArea.placeholder = 'Explain what revisions are needed...';
-                } else {
-                    responseModeGroup.style.display = 'block';
-                    categoryGroup.style.display = 'block';
-                    filesGroup.style.display = 'block';
-                    sendBackWarning.style.display = 'none';
-                    notesRequiredHint.style.display = 'none';
-                    categorySelect.required = true;
-                    // Reset to Keep mode display
-                    responseTextReadonly.style.display = 'block';
-                    responseTextArea.style.display = 'none';
-                    responseTextArea.value = reviewerText;
-                    
-                    if (action === 'Approve') {
-                        submitBtn.textContent = '✅ Approve & Complete';
-                        submitBtn.style.background = '#10b981';
-                    } else {
-                        submitBtn.textContent = '✏️ Submit Modifications';
-                        submitBtn.style.background = 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)';
-                    }
-                }
-            });
-        });
-        
-        // Handle Response Mode change
-        document.querySelectorAll('input[name="response_mode"]').forEach(radio => {
-            radio.addEventListener('change', function() {
-                const mode = this.value;
-                
-                if (mode === 'Keep') {
-                    responseTextReadonly.style.display = 'block';
-                    responseTextArea.style.display = 'none';
-                    responseTextArea.value = reviewerText;
-                } else if (mode === 'Tweak') {
-                    responseTextReadonly.style.display = 'none';
-                    responseTextArea.style.display = 'block';
-                    responseTextArea.value = reviewerText;
-                } else if (mode === 'Revise') {
-                    responseTextReadonly.style.display = 'none';
-                    responseTextArea.style.display = 'block';
-                    responseTextArea.value = '';
-                    responseTextArea.placeholder = 'Write your new response text here...';
-                }
-            });
-        });
-        
-        // Form validation
-        document.getElementById('qcr-form').addEventListener('submit', function(e) {
-            const action = document.querySelector('input[name="qc_action"]:checked')?.value;
-            
-            if (!action) {
-                e.preventDefault();
-                alert('Please select a QC decision.');
-                return false;
-            }
-            
-            if (action === 'Send Back' && !responseTextArea.value.trim()) {
-                e.preventDefault();
-                alert('Please provide a description explaining what revisions are needed.');
-                return false;
-            }
-            
-            if ((action === 'Approve' || action === 'Modify') && !categorySelect.value) {
-                e.preventDefault();
-                alert('Please select a final response category.');
-                return false;
-            }
-        });
-    </script>
+    <script src="{{ page_js_url }}"></script>
+    <script>QCR.initQCForm({form: '#qcr-form', reviewerText: {{ (item.reviewer_response_text or item.reviewer_notes or "")|tojson }}});</script>
 </body>
 </html>
 '''
@@ -1730,92 +1394,9 @@ MULTI_REVIEWER_RESPONSE_TEMPLATE = '''
 <html>
 <head>
     <title>Review Response - {{ item.type }} {{ item.identifier }}</title>
-    ''' + BASE_PAGE_STYLE + '''
-    <style>
-        .version-badge {
-            display: inline-block;
-            background: #667eea;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-left: 10px;
-        }
-        .reviewer-badge {
-            display: inline-block;
-            background: #10b981;
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-        .bluebeam-notice {
-            background: #dbeafe;
-            border: 1px solid #3b82f6;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 24px;
-        }
-        .bluebeam-notice h3 {
-            margin: 0 0 8px 0;
-            color: #1e40af;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .bluebeam-notice p {
-            color: #1e40af;
-            margin: 0;
-        }
-        .qcr-feedback {
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .qcr-feedback h4 {
-            margin: 0 0 10px 0;
-            color: #991b1b;
-        }
-        .previous-response {
-            background: #f0f9ff;
-            border: 1px solid #bae6fd;
-            border-radius: 8px;
-            padding: 15px;
-            margin-bottom: 20px;
-        }
-        .previous-response h4 {
-            margin: 0 0 10px 0;
-            color: #0369a1;
-        }
-        .waiting-notice {
-            background: #fef3c7;
-            border: 1px solid #f59e0b;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 24px;
-        }
-        .waiting-notice h3 {
-            margin: 0 0 8px 0;
-            color: #92400e;
-        }
-        .closed-notice {
-            background: #f3f4f6;
-            border: 1px solid #d1d5db;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-        }
-        .closed-notice h3 {
-            color: #6b7280;
-            margin: 0 0 10px 0;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ page_css_url }}">
 </head>
-<body>
+<body class="page-multi-reviewer">
     <div class="container">
         <h1>Initial Review Response <span class="version-badge">v{{ version }}</span></h1>
         <p class="subtitle">{{ item.type }} {{ item.identifier }}</p>
@@ -1833,12 +1414,12 @@ MULTI_REVIEWER_RESPONSE_TEMPLATE = '''
         </div>
         {% else %}
         
-        {% if is_resubmit and qcr_feedback %}
+        {% if is_resubmit and qcr_feedback_html %}
         <div class="qcr-feedback">
             <h4>↩️ QC Reviewer Requested Revisions</h4>
             <p><strong>Feedback:</strong></p>
             <div style="background: white; padding: 10px; border-radius: 4px; margin-top: 8px;">
-                {{ qcr_feedback|replace('\\n', '<br>')|safe }}
+                {{ qcr_feedback_html }}
             </div>
         </div>
         {% endif %}
@@ -1850,7 +1431,7 @@ MULTI_REVIEWER_RESPONSE_TEMPLATE = '''
             {% if previous_response.notes %}
             <p><strong>Internal Notes:</strong></p>
             <div style="background: white; padding: 10px; border-radius: 4px; margin-top: 8px;">
-                {{ previous_response.notes|replace('\\n', '<br>')|safe }}
+                {{ previous_response.notes_html }}
             </div>
             {% endif %}
         </div>
@@ -1887,14 +1468,7 @@ MULTI_REVIEWER_RESPONSE_TEMPLATE = '''
             
             <div class="form-group">
                 <label for="response_category">Response Category *</label>
-                <select name="response_category" id="response_category" required>
-                    <option value="">-- Select --</option>
-                    <option value="Approved" {% if previous_response and previous_response.category == 'Approved' %}selected{% endif %}>Approved</option>
-                    <option value="Approved as Noted" {% if previous_response and previous_response.category == 'Approved as Noted' %}selected{% endif %}>Approved as Noted</option>
-                    <option value="For Record Only" {% if previous_response and previous_response.category == 'For Record Only' %}selected{% endif %}>For Record Only</option>
-                    <option value="Rejected" {% if previous_response and previous_response.category == 'Rejected' %}selected{% endif %}>Rejected</option>
-                    <option value="Revise and Resubmit" {% if previous_response and previous_response.category == 'Revise and Resubmit' %}selected{% endif %}>Revise and Resubmit</option>
-                </select>
+                {{ category_select(previous_response.category if previous_response else '') }}
             </div>
             
             <div class="form-group">
@@ -1909,11 +1483,7 @@ MULTI_REVIEWER_RESPONSE_TEMPLATE = '''
         <div class="waiting-notice" style="margin-top: 24px;">
             <h3>⏳ Other Reviewers</h3>
             <p>This item is assigned to multiple reviewers. The QC Reviewer will be notified once all reviewers submit.</p>
-            <ul style="margin-top: 8px; color: #92400e;">
-                {% for r in all_reviewers %}
-                <li>{{ r.reviewer_name }} - {% if r.response_at %}✅ Submitted{% else %}⏳ Pending{% endif %}</li>
-                {% endfor %}
-            </ul>
+            {{ reviewers_list_html }}
         </div>
         {% endif %}
         {% endif %}
@@ -1927,124 +1497,9 @@ MULTI_REVIEWER_QCR_TEMPLATE = '''
 <html>
 <head>
     <title>QC Review - {{ item.type }} {{ item.identifier }}</title>
-    ''' + BASE_PAGE_STYLE + '''
-    <style>
-        .reviewer-response-box {
-            background: #f0fdf4;
-            border: 1px solid #86efac;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 15px 0;
-        }
-        .reviewer-response-box h4 {
-            margin: 0 0 12px 0;
-            color: #166534;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }
-        .reviewer-badge {
-            display: inline-block;
-            background: #10b981;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-        }
-        .category-chip {
-            display: inline-block;
-            background: #e0e7ff;
-            color: #3730a3;
-            padding: 4px 10px;
-            border-radius: 12px;
-            font-size: 12px;
-            font-weight: 600;
-        }
-        .bluebeam-notice {
-            background: #dbeafe;
-            border: 1px solid #3b82f6;
-            border-radius: 8px;
-            padding: 16px;
-            margin-bottom: 24px;
-        }
-        .bluebeam-notice h3 {
-            margin: 0 0 8px 0;
-            color: #1e40af;
-        }
-        .action-group {
-            background: #fef3c7;
-            border: 1px solid #fbbf24;
-            border-radius: 8px;
-            padding: 15px;
-            margin: 20px 0;
-        }
-        .action-group h3 {
-            margin: 0 0 12px 0;
-            color: #92400e;
-        }
-        .radio-group {
-            display: flex;
-            flex-direction: column;
-            gap: 10px;
-        }
-        .radio-option {
-            display: flex;
-            align-items: flex-start;
-            gap: 10px;
-            padding: 10px;
-            background: white;
-            border-radius: 6px;
-            border: 1px solid #e5e7eb;
-            cursor: pointer;
-        }
-        .radio-option:hover {
-            border-color: #667eea;
-        }
-        .radio-option input[type="radio"] {
-            margin-top: 3px;
-        }
-        .radio-option-content {
-            flex: 1;
-        }
-        .radio-option-label {
-            font-weight: 600;
-            color: #333;
-        }
-        .radio-option-desc {
-            font-size: 12px;
-            color: #666;
-            margin-top: 4px;
-        }
-        .send-back-warning {
-            display: none;
-            background: #fef2f2;
-            border: 1px solid #fecaca;
-            border-radius: 8px;
-            padding: 12px;
-            margin-top: 15px;
-            color: #991b1b;
-        }
-        .internal-notes-box {
-            background: #fff8e6;
-            border: 1px solid #ffd966;
-            border-radius: 6px;
-            padding: 10px;
-            margin-top: 10px;
-        }
-        .internal-notes-box h5 {
-            margin: 0 0 6px 0;
-            color: #744210;
-            font-size: 12px;
-        }
-        .internal-notes-content {
-            color: #744210;
-            font-size: 13px;
-            white-space: pre-wrap;
-        }
-    </style>
+    <link rel="stylesheet" href="{{ page_css_url }}">
 </head>
-<body>
+<body class="page-multi-qcr">
     <div class="container">
         <h1>QC Review</h1>
         <p class="subtitle">{{ item.type }} {{ item.identifier }}</p>
@@ -2083,13 +1538,13 @@ MULTI_REVIEWER_QCR_TEMPLATE = '''
         </div>
         
         <!-- All Reviewer Responses -->
-        <h3 style="margin: 20px 0 10px 0;">📝 Reviewer Responses ({{ reviewer_responses|length }})</h3>
+        <h3 style="margin: 20px 0 10px 0;">📝 Reviewer Responses ({{ reviewer_count }})</h3>
         {% for reviewer in reviewer_responses %}
         <div class="reviewer-response-box">
             <h4>
                 <span class="reviewer-badge">{{ loop.index }}</span>
                 {{ reviewer.reviewer_name }}
-                <span class="category-chip">{{ reviewer.response_category or 'Pending' }}</span>
+                <span class="category-chip">{{ reviewer.category_chip }}</span>
             </h4>
             {% if reviewer.internal_notes %}
             <div class="internal-notes-box">
@@ -2110,14 +1565,14 @@ MULTI_REVIEWER_QCR_TEMPLATE = '''
                 <h3>🎯 Your QC Decision</h3>
                 <div class="radio-group">
                     <label class="radio-option">
-                        <input type="radio" name="qc_action" value="Complete" required>
+                        <input type="radio" name="qc_action" value="Complete" required data-error="Please select a QC decision.">
                         <div class="radio-option-content">
                             <div class="radio-option-label">✅ Complete Response</div>
                             <div class="radio-option-desc">Write the final response to be sent to the contractor. You'll select a category and provide the official response text.</div>
                         </div>
                     </label>
                     <label class="radio-option">
-                        <input type="radio" name="qc_action" value="Send Back" required>
+                        <input type="radio" name="qc_action" value="Send Back" required data-error="Please select a QC decision.">
                         <div class="radio-option-content">
                             <div class="radio-option-label">↩️ Send Back to All Reviewers</div>
                             <div class="radio-option-desc">Return to all reviewers for revisions. They will all receive an email with your feedback.</div>
@@ -2126,35 +1581,28 @@ MULTI_REVIEWER_QCR_TEMPLATE = '''
                 </div>
             </div>
             
-            <div class="send-back-warning" id="send-back-warning">
+            <div class="send-back-warning hidden" id="send-back-warning">
                 ⚠️ <strong>Sending Back:</strong> The item will be returned to ALL Initial Reviewers for revision. Each reviewer will receive an email with your notes explaining what changes are needed.
             </div>
             
             <!-- Response fields (shown only for Complete) -->
-            <div id="complete-fields" style="display: none;">
+            <div id="complete-fields" class="hidden">
                 <div class="form-group">
                     <label for="response_category">Final Response Category *</label>
-                    <select name="response_category" id="response_category">
-                        <option value="">-- Select --</option>
-                        <option value="Approved">Approved</option>
-                        <option value="Approved as Noted">Approved as Noted</option>
-                        <option value="For Record Only">For Record Only</option>
-                        <option value="Rejected">Rejected</option>
-                        <option value="Revise and Resubmit">Revise and Resubmit</option>
-                    </select>
+                    {{ category_select(required=False, error='Please select a final response category.') }}
                 </div>
                 
                 <div class="form-group">
                     <label for="response_text">Final Response Description *</label>
-                    <textarea name="response_text" id="response_text" placeholder="Write the official response text to be sent to the contractor..." style="min-height: 150px;"></textarea>
+                    <textarea name="response_text" id="response_text" placeholder="Write the official response text to be sent to the contractor..." style="min-height: 150px;" data-error="Please provide the final response description."></textarea>
                 </div>
             </div>
             
             <!-- Send back notes (shown only for Send Back) -->
-            <div id="sendback-fields" style="display: none;">
+            <div id="sendback-fields" class="hidden">
                 <div class="form-group">
                     <label for="sendback_notes">Feedback for Reviewers * <span style="font-weight: normal; color: #888;">(will be sent to all reviewers)</span></label>
-                    <textarea name="sendback_notes" id="sendback_notes" placeholder="Explain what revisions are needed from the reviewers..." style="min-height: 120px;"></textarea>
+                    <textarea name="sendback_notes" id="sendback_notes" placeholder="Explain what revisions are needed from the reviewers..." style="min-height: 120px;" data-error="Please provide feedback explaining what revisions are needed."></textarea>
                 </div>
             </div>
             
@@ -2168,91 +1616,130 @@ MULTI_REVIEWER_QCR_TEMPLATE = '''
         </form>
     </div>
     
-    <script>
-        const completeFields = document.getElementById('complete-fields');
-        const sendbackFields = document.getElementById('sendback-fields');
-        const sendBackWarning = document.getElementById('send-back-warning');
-        const submitBtn = document.getElementById('submit-btn');
-        const categorySelect = document.getElementById('response_category');
-        const responseText = document.getElementById('response_text');
-        const sendbackNotes = document.getElementById('sendback_notes');
-        
-        // Handle QC Action change
-        document.querySelectorAll('input[name="qc_action"]').forEach(radio => {
-            radio.addEventListener('change', function() {
-                const action = this.value;
-                
-                if (action === 'Send Back') {
-                    completeFields.style.display = 'none';
-                    sendbackFields.style.display = 'block';
-                    sendBackWarning.style.display = 'block';
-                    categorySelect.required = false;
-                    responseText.required = false;
-                    sendbackNotes.required = true;
-                    submitBtn.textContent = '↩️ Send Back to All Reviewers';
-                    submitBtn.style.background = '#f59e0b';
-                } else {
-                    completeFields.style.display = 'block';
-                    sendbackFields.style.display = 'none';
-                    sendBackWarning.style.display = 'none';
-                    categorySelect.required = true;
-                    responseText.required = true;
-                    sendbackNotes.required = false;
-                    submitBtn.textContent = '✅ Submit Final Response';
-                    submitBtn.style.background = '#10b981';
-                }
-            });
-        });
-        
-        // Form validation
-        document.getElementById('qcr-form').addEventListener('submit', function(e) {
-            const action = document.querySelector('input[name="qc_action"]:checked')?.value;
-            
-            if (!action) {
-                e.preventDefault();
-                alert('Please select a QC decision.');
-                return false;
-            }
-            
-            if (action === 'Send Back' && !sendbackNotes.value.trim()) {
-                e.preventDefault();
-                alert('Please provide feedback explaining what revisions are needed.');
-                return false;
-            }
-            
-            if (action === 'Complete') {
-                if (!categorySelect.value) {
-                    e.preventDefault();
-                    alert('Please select a final response category.');
-                    return false;
-                }
-                if (!responseText.value.trim()) {
-                    e.preventDefault();
-                    alert('Please provide the final response description.');
-                    return false;
-                }
-            }
-        });
-    </script>
+    <script src="{{ page_js_url }}"></script>
+    <script>QCR.initMultiQCForm({form: '#qcr-form'});</script>
 </body>
 </html>
 '''
 
+# Macros shared by the form page templates, exposed to them as Jinja globals
+RESPONSE_CATEGORIES = ('Approved', 'Approved as Noted', 'For Record Only', 'Rejected', 'Revise and Resubmit')
+
+PAGE_MACROS_TEMPLATE = '''
+{% macro category_select(current='', required=True, error='') -%}
+<select name="response_category" id="response_category"{% if required %} required{% endif %}{% if error %} data-error="{{ error }}"{% endif %}>
+                    <option value="">-- Select --</option>
+                    {%- for category in response_categories %}
+                    <option value="{{ category }}"{% if category == current %} selected{% endif %}>{{ category }}</option>
+                    {%- endfor %}
+                </select>
+{%- endmacro %}
+'''
+
+# Compile the form page templates once at import; Flask's render_template_string
+# would otherwise lex, parse and compile the whole source on every request.
+app.jinja_env.globals['page_css_url'] = PAGE_CSS_URL
+app.jinja_env.globals['page_js_url'] = PAGE_JS_URL
+app.jinja_env.globals['response_categories'] = RESPONSE_CATEGORIES
+app.jinja_env.globals['category_select'] = app.jinja_env.from_string(PAGE_MACROS_TEMPLATE).module.category_select
+_REVIEWER_RESPONSE_TMPL = app.jinja_env.from_string(REVIEWER_RESPONSE_TEMPLATE)
+_QCR_RESPONSE_TMPL = app.jinja_env.from_string(QCR_RESPONSE_TEMPLATE)
+_MULTI_REVIEWER_RESPONSE_TMPL = app.jinja_env.from_string(MULTI_REVIEWER_RESPONSE_TEMPLATE)
+_MULTI_REVIEWER_QCR_TMPL = app.jinja_env.from_string(MULTI_REVIEWER_QCR_TEMPLATE)
+
+def stream_page(template, **context):
+    """Stream a compiled page template so the head reaches the client while the body renders.
+
+    The context must be fully loaded beforehand: the DB connection is closed
+    by the time the generator runs.
+    """
+    stream = template.stream(**context)
+    stream.enable_buffering(size=5)
+    return Response(stream_with_context(stream), mimetype='text/html')
+
 # =============================================================================
 # DATABASE INITIALIZATION
 # =============================================================================
 
+# Closed connections go back to a small idle pool instead of being torn down,
+# so get_db() usually skips the file open and schema load. Each caller still
+# gets a connection of its own, so nested get_db() calls stay independent.
+DB_POOL_SIZE = 8
+_idle_connections = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+# Seconds a connection waits for another writer's lock (PRAGMA busy_timeout)
+# before raising "database is locked"
+DB_BUSY_TIMEOUT = 5.0
+
+# WAL pages a commit may leave behind before that commit checkpoints them
+# itself; the folder watcher checkpoints during quiet passes instead
+WAL_AUTOCHECKPOINT_PAGES = 10000
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection that returns itself to the idle pool on close()."""
+    
+    in_pool = False
+    
+    def close(self):
+        if self.in_pool:
+            return
+        # Discard anything left uncommitted, as a real close would
+        self.rollback()
+        self.in_pool = True
+        try:
+            _idle_connections.put_nowait(self)
+        except queue.Full:
+            super().close()
+
 def get_db():
     """Get database connection with row factory."""
-    conn = sqlite3.connect(str(DATABASE_PATH), check_same_thread=False)
+    try:
+        conn = _idle_connections.get_nowait()
+        conn.in_pool = False
+        return conn
+    except queue.Empty:
+        pass
+    # Pooled connections live long, so give them room for every hot statement
+    conn = sqlite3.connect(str(DATABASE_PATH), timeout=DB_BUSY_TIMEOUT, check_same_thread=False,
+                           factory=PooledConnection, cached_statements=256)
     conn.row_factory = sqlite3.Row
+    # The database runs in WAL mode (set in init_db), where NORMAL only
+    # fsyncs at checkpoints instead of on every commit
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    # ~20 MB page cache (negative values are KiB) instead of the 2 MB default
+    conn.execute('PRAGMA cache_size=-20000')
+    # Read the database through a memory map (up to 256 MB) instead of read() calls
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute(f'PRAGMA wal_autocheckpoint={WAL_AUTOCHECKPOINT_PAGES}')
     return conn
 
-def init_db():
-    """Initialize database tables."""
-    conn = get_db()
-    cursor = conn.cursor()
+# Most ids bound into one IN (...) list; SQLite builds before 3.32 allow only
+# 999 variables per statement, so longer lists are split into chunks
+SQL_IN_CHUNK_SIZE = 500
+
+def chunked(values, size=SQL_IN_CHUNK_SIZE):
+    """Split a sequence into consecutive lists of at most size values."""
+    values = list(values)
+    return [values[i:i + size] for i in range(0, len(values), size)]
+
+def add_missing_columns(cursor, table, columns):
+    """Add any of the (name, definition) columns that the table does not have yet."""
+    cursor.execute(f'PRAGMA table_info({table})')
+    existing = {row[1] for row in cursor.fetchall()}
+    for col_name, col_def in columns:
+        if col_name not in existing:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {col_name} {col_def}')
+
+# Bump whenever create_schema changes so existing databases get migrated
+SCHEMA_VERSION = 1
+
+def create_schema(cursor, from_version):
+    """Create any missing tables, columns and indexes, and run data migrations.
     
+    from_version is the database's previous user_version (0 for databases
+    created before schema versioning), used to skip migrations already applied.
+    """
     # ==========================================================================
     # PROJECT TABLE - Multi-project support
     # ==========================================================================
@@ -2365,17 +1852,8 @@ def init_db():
     # MIGRATIONS - Add columns for multi-project support
     # ==========================================================================
     
-    # Add project_id column to item table
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN project_id INTEGER REFERENCES project(id)')
-    except:
-        pass
-    
-    # Add current_project_id column to user table
-    try:
-        cursor.execute('ALTER TABLE user ADD COLUMN current_project_id INTEGER REFERENCES project(id)')
-    except:
-        pass
+    add_missing_columns(cursor, 'item', [('project_id', 'INTEGER REFERENCES project(id)')])
+    add_missing_columns(cursor, 'user', [('current_project_id', 'INTEGER REFERENCES project(id)')])
     
     # Create default LEB project if no projects exist
     cursor.execute('SELECT COUNT(*) FROM project')
@@ -2437,85 +1915,20 @@ def init_db():
         print(f"Associated all existing users with default LEB project as admins")
     
     # Migration: Add new columns to existing databases
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN response_category TEXT')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN response_text TEXT')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN response_files TEXT')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN closed_at TIMESTAMP')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN read_by TEXT')
-    except:
-        pass
-    # New columns for two-level review system
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN date_received DATE')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN initial_reviewer_id INTEGER REFERENCES user(id)')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN qcr_id INTEGER REFERENCES user(id)')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN initial_reviewer_due_date DATE')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN qcr_due_date DATE')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN is_contractor_window_insufficient INTEGER DEFAULT 0')
-    except:
-        pass
-    
-    # Backfill date_received for existing items that don't have it
-    cursor.execute('''
-        UPDATE item 
-        SET date_received = DATE(created_at)
-        WHERE date_received IS NULL AND created_at IS NOT NULL
-    ''')
-    
-    # Recalculate review due dates for ALL items that have date_received and due_date
-    # This ensures the calculation is always correct with the latest logic
-    cursor.execute('''
-        SELECT id, date_received, due_date, priority, type 
-        FROM item 
-        WHERE date_received IS NOT NULL 
-        AND due_date IS NOT NULL
-    ''')
-    items_to_update = cursor.fetchall()
-    for item_id, date_received, due_date, priority, item_type in items_to_update:
-        try:
-            due_dates = calculate_review_due_dates(date_received, due_date, priority, item_type or 'Submittal')
-            cursor.execute('''
-                UPDATE item SET 
-                    initial_reviewer_due_date = ?,
-                    qcr_due_date = ?,
-                    is_contractor_window_insufficient = ?
-                WHERE id = ?
-            ''', (
-                due_dates['initial_reviewer_due_date'],
-                due_dates['qcr_due_date'],
-                1 if due_dates['is_contractor_window_insufficient'] else 0,
-                item_id
-            ))
-        except Exception as e:
-            print(f"Could not calculate due dates for item {item_id}: {e}")
+    add_missing_columns(cursor, 'item', [
+        ('response_category', 'TEXT'),
+        ('response_text', 'TEXT'),
+        ('response_files', 'TEXT'),
+        ('closed_at', 'TIMESTAMP'),
+        ('read_by', 'TEXT'),
+        # New columns for two-level review system
+        ('date_received', 'DATE'),
+        ('initial_reviewer_id', 'INTEGER REFERENCES user(id)'),
+        ('qcr_id', 'INTEGER REFERENCES user(id)'),
+        ('initial_reviewer_due_date', 'DATE'),
+        ('qcr_due_date', 'DATE'),
+        ('is_contractor_window_insufficient', 'INTEGER DEFAULT 0'),
+    ])
     
     # Email workflow columns
     email_workflow_columns = [
@@ -2545,25 +1958,12 @@ def init_db():
         ('final_response_category', 'TEXT'),
         ('final_response_text', 'TEXT'),
         ('final_response_files', 'TEXT'),
+        # Version tracking: first submission is v0, revisions are v1, v2, etc.
+        ('reviewer_response_version', 'INTEGER DEFAULT 0'),
+        # For opening the original email
+        ('email_entry_id', 'TEXT'),
     ]
-    for col_name, col_type in email_workflow_columns:
-        try:
-            cursor.execute(f'ALTER TABLE item ADD COLUMN {col_name} {col_type}')
-        except:
-            pass
-    
-    # Add reviewer_response_version column for version tracking
-    # First submission is v0, revisions are v1, v2, etc.
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN reviewer_response_version INTEGER DEFAULT 0')
-    except:
-        pass
-    
-    # Add email_entry_id column for opening original email
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN email_entry_id TEXT')
-    except:
-        pass
+    add_missing_columns(cursor, 'item', email_workflow_columns)
     
     # Reviewer response history table for version tracking
     cursor.execute('''
@@ -2582,14 +1982,10 @@ def init_db():
     ''')
     
     # Add missing columns to reviewer_response_history if they don't exist
-    try:
-        cursor.execute('ALTER TABLE reviewer_response_history ADD COLUMN notes TEXT')
-    except:
-        pass
-    try:
-        cursor.execute('ALTER TABLE reviewer_response_history ADD COLUMN selected_files TEXT')
-    except:
-        pass
+    add_missing_columns(cursor, 'reviewer_response_history', [
+        ('notes', 'TEXT'),
+        ('selected_files', 'TEXT'),
+    ])
     
     # ==========================================================================
     # MULTI-REVIEWER SUPPORT - item_reviewers table
@@ -2615,23 +2011,13 @@ def init_db():
         )
     ''')
     
-    # Add multi_reviewer_mode column to item table
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN multi_reviewer_mode INTEGER DEFAULT 0')
-    except:
-        pass
+    add_missing_columns(cursor, 'item', [
+        ('multi_reviewer_mode', 'INTEGER DEFAULT 0'),
+        ('rfi_question', 'TEXT'),
+    ])
     
     # Add needs_response column to item_reviewers table (for selective send-back)
-    try:
-        cursor.execute('ALTER TABLE item_reviewers ADD COLUMN needs_response INTEGER DEFAULT 1')
-    except:
-        pass
-    
-    # Add rfi_question column to item table
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN rfi_question TEXT')
-    except:
-        pass
+    add_missing_columns(cursor, 'item_reviewers', [('needs_response', 'INTEGER DEFAULT 1')])
     
     # Notification table
     cursor.execute('''
@@ -2666,77 +2052,76 @@ def init_db():
     ''')
     
     # Add item_reviewer_id column to reminder_log for multi-reviewer tracking
-    try:
-        cursor.execute('ALTER TABLE reminder_log ADD COLUMN item_reviewer_id INTEGER')
-    except:
-        pass
+    add_missing_columns(cursor, 'reminder_log', [('item_reviewer_id', 'INTEGER')])
     
-    # Migration: Update reminder_log CHECK constraint to allow 'manual' stage
-    # SQLite doesn't support ALTER TABLE to modify constraints, so we recreate the table
-    try:
-        # Check if we need to migrate (old constraint doesn't allow 'manual')
-        cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'reminder_log'")
-        table_sql = cursor.fetchone()
-        if table_sql and "'manual'" not in table_sql[0]:
-            # Need to migrate - recreate table with new constraint
-            cursor.execute('ALTER TABLE reminder_log RENAME TO reminder_log_old')
-            cursor.execute('''
-                CREATE TABLE reminder_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    item_id INTEGER NOT NULL,
-                    reminder_type TEXT NOT NULL,
-                    recipient_email TEXT NOT NULL,
-                    recipient_role TEXT NOT NULL,
-                    due_date DATE NOT NULL,
-                    reminder_stage TEXT NOT NULL CHECK(reminder_stage IN ('due_today', 'overdue', 'manual')),
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    item_reviewer_id INTEGER,
-                    FOREIGN KEY (item_id) REFERENCES item(id) ON DELETE CASCADE,
-                    UNIQUE(item_id, recipient_email, recipient_role, reminder_stage, due_date)
-                )
-            ''')
-            cursor.execute('''
-                INSERT INTO reminder_log (id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id)
-                SELECT id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id
-                FROM reminder_log_old
-            ''')
-            cursor.execute('DROP TABLE reminder_log_old')
-            print("Migrated reminder_log table to support 'manual' reminder stage")
-    except Exception as e:
-        print(f"Note: reminder_log migration skipped or failed: {e}")
+    # reminder_log constraint rebuilds, already applied to any database at schema v1+
+    if from_version < 1:
+        # Migration: Update reminder_log CHECK constraint to allow 'manual' stage
+        # SQLite doesn't support ALTER TABLE to modify constraints, so we recreate the table
+        try:
+            # Check if we need to migrate (old constraint doesn't allow 'manual')
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'reminder_log'")
+            table_sql = cursor.fetchone()
+            if table_sql and "'manual'" not in table_sql[0]:
+                # Need to migrate - recreate table with new constraint
+                cursor.execute('ALTER TABLE reminder_log RENAME TO reminder_log_old')
+                cursor.execute('''
+                    CREATE TABLE reminder_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        item_id INTEGER NOT NULL,
+                        reminder_type TEXT NOT NULL,
+                        recipient_email TEXT NOT NULL,
+                        recipient_role TEXT NOT NULL,
+                        due_date DATE NOT NULL,
+                        reminder_stage TEXT NOT NULL CHECK(reminder_stage IN ('due_today', 'overdue', 'manual')),
+                        sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        item_reviewer_id INTEGER,
+                        FOREIGN KEY (item_id) REFERENCES item(id) ON DELETE CASCADE,
+                        UNIQUE(item_id, recipient_email, recipient_role, reminder_stage, due_date)
+                    )
+                ''')
+                cursor.execute('''
+                    INSERT INTO reminder_log (id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id)
+                    SELECT id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id
+                    FROM reminder_log_old
+                ''')
+                cursor.execute('DROP TABLE reminder_log_old')
+                print("Migrated reminder_log table to support 'manual' reminder stage")
+        except Exception as e:
+            print(f"Note: reminder_log migration skipped or failed: {e}")
     
-    # Migration: Update reminder_log UNIQUE constraint to include due_date
-    # This allows reminders to be sent again if due date changes
-    try:
-        cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'reminder_log'")
-        table_sql = cursor.fetchone()
-        if table_sql and 'due_date)' not in table_sql[0]:
-            # Need to migrate - add due_date to unique constraint
-            cursor.execute('ALTER TABLE reminder_log RENAME TO reminder_log_old_v2')
-            cursor.execute('''
-                CREATE TABLE reminder_log (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    item_id INTEGER NOT NULL,
-                    reminder_type TEXT NOT NULL,
-                    recipient_email TEXT NOT NULL,
-                    recipient_role TEXT NOT NULL,
-                    due_date DATE NOT NULL,
-                    reminder_stage TEXT NOT NULL CHECK(reminder_stage IN ('due_today', 'overdue', 'manual')),
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    item_reviewer_id INTEGER,
-                    FOREIGN KEY (item_id) REFERENCES item(id) ON DELETE CASCADE,
-                    UNIQUE(item_id, recipient_email, recipient_role, reminder_stage, due_date)
-                )
-            ''')
-            cursor.execute('''
-                INSERT INTO reminder_log (id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id)
-                SELECT id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id
-                FROM reminder_log_old_v2
-            ''')
-            cursor.execute('DROP TABLE reminder_log_old_v2')
-            print("Migrated reminder_log table: added due_date to unique constraint")
-    except Exception as e:
-        print(f"Note: reminder_log due_date migration skipped or failed: {e}")
+        # Migration: Update reminder_log UNIQUE constraint to include due_date
+        # This allows reminders to be sent again if due date changes
+        try:
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'reminder_log'")
+            table_sql = cursor.fetchone()
+            if table_sql and 'due_date)' not in table_sql[0]:
+                # Need to migrate - add due_date to unique constraint
+                cursor.execute('ALTER TABLE reminder_log RENAME TO reminder_log_old_v2')
+                cursor.execute('''
+                    CREATE TABLE reminder_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        item_id INTEGER NOT NULL,
+                        reminder_type TEXT NOT NULL,
+                        recipient_email TEXT NOT NULL,
+                        recipient_role TEXT NOT NULL,
+                        due_date DATE NOT NULL,
+                        reminder_stage TEXT NOT NULL CHECK(reminder_stage IN ('due_today', 'overdue', 'manual')),
+                        sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        item_reviewer_id INTEGER,
+                        FOREIGN KEY (item_id) REFERENCES item(id) ON DELETE CASCADE,
+                        UNIQUE(item_id, recipient_email, recipient_role, reminder_stage, due_date)
+                    )
+                ''')
+                cursor.execute('''
+                    INSERT INTO reminder_log (id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id)
+                    SELECT id, item_id, reminder_type, recipient_email, recipient_role, due_date, reminder_stage, sent_at, item_reviewer_id
+                    FROM reminder_log_old_v2
+                ''')
+                cursor.execute('DROP TABLE reminder_log_old_v2')
+                print("Migrated reminder_log table: added due_date to unique constraint")
+        except Exception as e:
+            print(f"Note: reminder_log due_date migration skipped or failed: {e}")
     
     # ==========================================================================
     # CONTRACTOR UPDATE TRACKING - for handling ACC updates during/after review
@@ -2756,12 +2141,10 @@ def init_db():
         ('reopened_from_closed', 'INTEGER DEFAULT 0'),  # If item was reopened from Closed
         ('status_before_update', 'TEXT'),  # Status before the update came in
         ('reopen_count', 'INTEGER DEFAULT 0'),  # How many times item has been reopened (R2, R3, etc.)
+        # Tracks Excel file updates
+        ('excel_synced', 'INTEGER DEFAULT 0'),
     ]
-    for col_name, col_def in acc_update_columns:
-        try:
-            cursor.execute(f'ALTER TABLE item ADD COLUMN {col_name} {col_def}')
-        except:
-            pass
+    add_missing_columns(cursor, 'item', acc_update_columns)
     
     # Item update history table - tracks all updates from ACC
     cursor.execute('''
@@ -2788,26 +2171,135 @@ def init_db():
         )
     ''')
     
-    # Create default admin user if no users exist
-    cursor.execute('SELECT COUNT(*) FROM user')
-    if cursor.fetchone()[0] == 0:
+    # Key/value markers kept by init_db between starts
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS app_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    ''')
+    
+    # ==========================================================================
+    # INDEXES - for the dashboard filters, per-item lookups and magic-link tokens
+    # ==========================================================================
+    # reminder_log(item_id) is already covered by its UNIQUE constraint
+    for index_sql in [
+        'CREATE INDEX IF NOT EXISTS idx_item_status ON item(status)',
+        'CREATE INDEX IF NOT EXISTS idx_item_bucket_status ON item(bucket, status)',
+        'CREATE INDEX IF NOT EXISTS idx_item_project ON item(project_id)',
+        'CREATE INDEX IF NOT EXISTS idx_item_assignee ON item(assigned_to_user_id) WHERE assigned_to_user_id IS NOT NULL',
+        'CREATE INDEX IF NOT EXISTS idx_item_reviewer_token ON item(email_token_reviewer) WHERE email_token_reviewer IS NOT NULL',
+        'CREATE INDEX IF NOT EXISTS idx_item_qcr_token ON item(email_token_qcr) WHERE email_token_qcr IS NOT NULL',
+        'CREATE INDEX IF NOT EXISTS idx_item_reviewers_item ON item_reviewers(item_id)',
+        'CREATE INDEX IF NOT EXISTS idx_item_reviewers_token ON item_reviewers(email_token) WHERE email_token IS NOT NULL',
+        'CREATE INDEX IF NOT EXISTS idx_comment_item ON comment(item_id)',
+        'CREATE INDEX IF NOT EXISTS idx_response_history_item ON reviewer_response_history(item_id)',
+        'CREATE INDEX IF NOT EXISTS idx_update_history_item ON item_update_history(item_id)',
+        'CREATE INDEX IF NOT EXISTS idx_notification_item ON notification(item_id)',
+        'CREATE INDEX IF NOT EXISTS idx_notification_unread ON notification(read_at) WHERE read_at IS NULL',
+    ]:
+        cursor.execute(index_sql)
+
+def init_db():
+    """Initialize database tables."""
+    conn = get_db()
+    cursor = conn.cursor()
+    
+    # WAL lets readers run alongside a writer; the mode is stored in the
+    # database file, so every later connection picks it up
+    cursor.execute('PRAGMA journal_mode=WAL')
+    
+    # Tables, migrations and indexes only need to run when the schema changed
+    cursor.execute('PRAGMA user_version')
+    schema_version = cursor.fetchone()[0]
+    if schema_version != SCHEMA_VERSION:
+        create_schema(cursor, schema_version)
+        cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        # Give the query planner statistics for the new tables and indexes
+        cursor.execute('ANALYZE')
+    
+    # Backfill date_received for existing items that don't have it
+    cursor.execute('''
+        UPDATE item 
+        SET date_received = DATE(created_at)
+        WHERE date_received IS NULL AND created_at IS NOT NULL
+    ''')
+    
+    # Recalculate review due dates for ALL items that have date_received and due_date
+    # whenever the calculation logic or its settings changed since the last start
+    # (tracked in app_meta); otherwise only fill in missing dates
+    fingerprint = due_date_fingerprint()
+    cursor.execute("SELECT value FROM app_meta WHERE key = 'due_date_fingerprint'")
+    row = cursor.fetchone()
+    recalculate_all = not row or row['value'] != fingerprint
+    # Rows are streamed from their own cursor and written back in chunks,
+    # so memory stays flat however many items there are
+    read_cursor = conn.cursor()
+    read_cursor.execute('''
+        SELECT id, date_received, due_date, priority, type 
+        FROM item 
+        WHERE date_received IS NOT NULL 
+        AND due_date IS NOT NULL
+    ''' + ('' if recalculate_all else 'AND (initial_reviewer_due_date IS NULL OR qcr_due_date IS NULL)'))
+    update_sql = '''
+        UPDATE item SET 
+            initial_reviewer_due_date = ?,
+            qcr_due_date = ?,
+            is_contractor_window_insufficient = ?
+        WHERE id = ?
+    '''
+    due_date_updates = []
+    for item_id, date_received, due_date, priority, item_type in read_cursor:
+        try:
+            due_dates = calculate_review_due_dates(date_received, due_date, priority, item_type or 'Submittal')
+        except Exception as e:
+            print(f"Could not calculate due dates for item {item_id}: {e}")
+            continue
+        due_date_updates.append((
+            due_dates['initial_reviewer_due_date'],
+            due_dates['qcr_due_date'],
+            1 if due_dates['is_contractor_window_insufficient'] else 0,
+            item_id
+        ))
+        if len(due_date_updates) >= 1000:
+            cursor.executemany(update_sql, due_date_updates)
+            due_date_updates = []
+    cursor.executemany(update_sql, due_date_updates)
+    cursor.execute('''
+        INSERT OR REPLACE INTO app_meta (key, value) VALUES ('due_date_fingerprint', ?)
+    ''', (fingerprint,))
+    
+    # Create default admin user if no users exist (stops at the first row
+    # instead of counting the table; OR IGNORE covers a concurrent bootstrap)
+    cursor.execute('SELECT 1 FROM user LIMIT 1')
+    if cursor.fetchone() is None:
         default_password = 'admin123'  # Change this!
         password_hash = bcrypt.hashpw(default_password.encode('utf-8'), bcrypt.gensalt())
         cursor.execute('''
-            INSERT INTO user (email, password_hash, display_name, role)
+            INSERT OR IGNORE INTO user (email, password_hash, display_name, role)
             VALUES (?, ?, ?, ?)
         ''', ('admin@local', password_hash.decode('utf-8'), 'Administrator', 'admin'))
-        print(f"Created default admin user: admin@local / {default_password}")
-    
-    # Migration: Add excel_synced column for tracking Excel file updates
-    try:
-        cursor.execute('ALTER TABLE item ADD COLUMN excel_synced INTEGER DEFAULT 0')
-    except:
-        pass
+        if cursor.rowcount == 1:
+            print(f"Created default admin user: admin@local / {default_password}")
     
     conn.commit()
     conn.close()
 
+def init_db_if_needed():
+    """Run init_db only when the schema or due date settings are out of date.
+    Lets one-shot scripts skip the startup upkeep on an already current database."""
+    conn = get_db()
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA user_version')
+    up_to_date = cursor.fetchone()[0] == SCHEMA_VERSION
+    if up_to_date:
+        cursor.execute("SELECT value FROM app_meta WHERE key = 'due_date_fingerprint'")
+        row = cursor.fetchone()
+        up_to_date = row is not None and row['value'] == due_date_fingerprint()
+    conn.close()
+    if not up_to_date:
+        init_db()
+
 # =============================================================================
 # PROJECT HELPERS
 # =============================================================================
@@ -2922,20 +2414,61 @@ def show_windows_toast(title, message):
         except Exception as e:
             print(f"Toast notification error: {e}")
 
-def create_notification(notification_type, title, message, item_id=None, action_url=None, action_label=None):
-    """Create a new notification and show Windows toast."""
-    conn = get_db()
+# Each winotify toast goes through PowerShell, so toasts are shown one at a time
+# by a background worker and callers only enqueue them. A burst of more than
+# TOAST_BURST_LIMIT pending toasts is collapsed into a single summary toast.
+TOAST_BURST_LIMIT = 3
+_toast_queue = queue.Queue()
+_toast_worker = None
+_toast_worker_lock = threading.Lock()
+
+def queue_windows_toast(title, message):
+    """Queue a Windows toast for the background worker, starting it on first use."""
+    global _toast_worker
+    if not HAS_WINOTIFY:
+        return
+    with _toast_worker_lock:
+        if _toast_worker is None:
+            _toast_worker = threading.Thread(target=_toast_loop, daemon=True)
+            _toast_worker.start()
+    _toast_queue.put_nowait((title, message))
+
+def _toast_loop():
+    """Show queued toasts, collapsing bursts into one summary toast."""
+    while True:
+        pending = [_toast_queue.get()]
+        while True:
+            try:
+                pending.append(_toast_queue.get_nowait())
+            except queue.Empty:
+                break
+        if len(pending) > TOAST_BURST_LIMIT:
+            show_windows_toast(f'{len(pending)} new notifications', 'Open LEB Tracker to review them.')
+        else:
+            for title, message in pending:
+                show_windows_toast(title, message)
+
+def create_notification(notification_type, title, message, item_id=None, action_url=None, action_label=None, conn=None):
+    """Create a new notification and show Windows toast.
+    
+    Pass conn to insert as part of the caller's open transaction; the caller
+    then commits. Otherwise the notification is committed on its own.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_db()
     cursor = conn.cursor()
     cursor.execute('''
         INSERT INTO notification (type, title, message, item_id, action_url, action_label)
         VALUES (?, ?, ?, ?, ?, ?)
     ''', (notification_type, title, message, item_id, action_url, action_label))
-    conn.commit()
     notification_id = cursor.lastrowid
-    conn.close()
+    if own_conn:
+        conn.commit()
+        conn.close()
     
-    # Also show Windows toast notification
-    show_windows_toast(title, message)
+    # Also show Windows toast notification, off the request/poller thread
+    queue_windows_toast(title, message)
     
     return notification_id
 
@@ -2952,35 +2485,69 @@ BUCKET_PATTERNS = [
     (r'LEB', 'ALL'),  # Default fallback
 ]
 
+# Email parsing runs for every polled message, so the fixed patterns below are
+# compiled once here rather than looked up in re's cache on each call
+_BUCKET_RES = [(re.compile(pattern, re.IGNORECASE), bucket) for pattern, bucket in BUCKET_PATTERNS]
+
 def determine_bucket(subject):
     """Determine the bucket from email subject."""
-    for pattern, bucket in BUCKET_PATTERNS:
-        if re.search(pattern, subject, re.IGNORECASE):
+    for pattern, bucket in _BUCKET_RES:
+        if pattern.search(subject):
             return bucket
     return 'ALL'
 
+_SUBMITTAL_RE = re.compile(r'\bSubmittal\b', re.IGNORECASE)
+_RFI_RE = re.compile(r'\bRFI\b', re.IGNORECASE)
+
 def parse_item_type(subject):
     """Determine if this is an RFI or Submittal."""
-    if re.search(r'\bSubmittal\b', subject, re.IGNORECASE):
+    if _SUBMITTAL_RE.search(subject):
         return 'Submittal'
-    elif re.search(r'\bRFI\b', subject, re.IGNORECASE):
+    elif _RFI_RE.search(subject):
         return 'RFI'
     return None
 
+_SUBMITTAL_ID_RE = re.compile(r'Submittal\s*#?([\d\s\-\.]+)', re.IGNORECASE)
+_RFI_ID_RE = re.compile(r'RFI\s*[#\-]?\s*(\d+)', re.IGNORECASE)
+
 def parse_identifier(subject, item_type):
     """Extract the identifier from the subject."""
     if item_type == 'Submittal':
         # Match patterns like "Submittal #13 34 19-2" or "Submittal #123"
-        match = re.search(r'Submittal\s*#?([\d\s\-\.]+)', subject, re.IGNORECASE)
+        match = _SUBMITTAL_ID_RE.search(subject)
         if match:
             return f"Submittal #{match.group(1).strip()}"
     elif item_type == 'RFI':
         # Match patterns like "RFI #123" or "RFI-123"
-        match = re.search(r'RFI\s*[#\-]?\s*(\d+)', subject, re.IGNORECASE)
+        match = _RFI_ID_RE.search(subject)
         if match:
             return f"RFI #{match.group(1).strip()}"
     return None
 
+_ID_NUMBER_RE = re.compile(r'#(.+)$')
+_WHATS_CHANGED_RE = re.compile(r'\s*What(?:\'s changed)?.*$', re.IGNORECASE)
+_CODE_PREFIX_RE = re.compile(r'^[A-Z0-9,]+_\d+_')
+_TITLE_FIELD_RE = re.compile(r'(?:^|\n)\s*Title[:\s\t]+([^\n\r]+)', re.IGNORECASE)
+_SPEC_SECTION_RE = re.compile(r'Spec\s*Section[:\s\t]+([^\n\r]+)', re.IGNORECASE)
+_SUBJECT_PREFIX_RE = re.compile(r'^(Re:\s*)?(Fwd?:\s*)?(Action Required:\s*)?', re.IGNORECASE)
+_PROJECT_PREFIX_RE = re.compile(r'LEB\s*-?\s*[\w\s]*\([^)]+\)\s*-?\s*')
+_SUBMITTAL_NUMBER_RE = re.compile(r'Submittal\s*#?[\d\s\-\.]+', re.IGNORECASE)
+_RFI_NUMBER_RE = re.compile(r'RFI\s*#?[\d\s\-\.]+', re.IGNORECASE)
+_ACC_ACTION_SUFFIX_RE = re.compile(
+    r'\s*(was assigned to you|was assigned to your role|needs your review|requires action|'
+    r'You have been set as ball in court.*|was set as ball in court.*|'
+    r'was assigned to you for co-review|was assigned to you for review).*$',
+    re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def _title_line_res(id_number):
+    """Compile the "item #<id> TITLE" and "Submittal/RFI #<id> TITLE" patterns for an identifier."""
+    escaped = re.escape(id_number)
+    return (
+        re.compile(rf'item\s*#?\s*{escaped}\s+([^\n\r]+)', re.IGNORECASE),
+        re.compile(rf'(?:Submittal|RFI)\s*#?\s*{escaped}\s+([^\n\r]+)', re.IGNORECASE),
+    )
+
 def parse_title(subject, identifier, body=None):
     """Extract a title from the email body (full item name, NOT Spec Section)."""
     title = None
@@ -2993,26 +2560,27 @@ def parse_title(subject, identifier, body=None):
         # Extract just the number portion of the identifier (e.g., "23 00 00-1" from "Submittal #23 00 00-1")
         id_number = identifier
         if identifier:
-            id_match = re.search(r'#(.+)$', identifier)
+            id_match = _ID_NUMBER_RE.search(identifier)
             if id_match:
                 id_number = id_match.group(1).strip()
         
         if id_number:
+            item_re, submittal_re = _title_line_res(id_number)
+            
             # Pattern 1: Look for "item #23 00 00-1 TITLE" in email body
             # Capture everything on the line after identifier, then strip "What's changed" if present
-            item_pattern = rf'item\s*#?\s*{re.escape(id_number)}\s+([^\n\r]+)'
-            item_match = re.search(item_pattern, body, re.IGNORECASE)
+            item_match = item_re.search(body)
             if item_match:
                 title = item_match.group(1).strip()
                 # Remove "What's changed" suffix if present
-                title = re.sub(r'\s*What(?:\'s changed)?.*$', '', title, flags=re.IGNORECASE).strip()
+                title = _WHATS_CHANGED_RE.sub('', title).strip()
                 # Remove any leading code prefix like "LEB1,2,10_230000_"
-                title = re.sub(r'^[A-Z0-9,]+_\d+_', '', title)
+                title = _CODE_PREFIX_RE.sub('', title)
                 if title:
                     return title
         
         # Pattern 2: Look for "Title" field in ACC emails
-        title_match = re.search(r'(?:^|\n)\s*Title[:\s\t]+([^\n\r]+)', body, re.IGNORECASE)
+        title_match = _TITLE_FIELD_RE.search(body)
         if title_match:
             title = title_match.group(1).strip()
             if title and len(title) > 5:  # Make sure it's substantial
@@ -3021,18 +2589,17 @@ def parse_title(subject, identifier, body=None):
         # Pattern 3: Submittal/RFI with full title
         # Capture everything on the line after the identifier, then clean up
         if id_number:
-            submittal_pattern = rf'(?:Submittal|RFI)\s*#?\s*{re.escape(id_number)}\s+([^\n\r]+)'
-            submittal_match = re.search(submittal_pattern, body, re.IGNORECASE)
+            submittal_match = submittal_re.search(body)
             if submittal_match:
                 title = submittal_match.group(1).strip()
                 # Remove "What's changed" suffix if present
-                title = re.sub(r'\s*What(?:\'s changed)?.*$', '', title, flags=re.IGNORECASE).strip()
-                title = re.sub(r'^[A-Z0-9,]+_\d+_', '', title)
+                title = _WHATS_CHANGED_RE.sub('', title).strip()
+                title = _CODE_PREFIX_RE.sub('', title)
                 if title:
                     return title
         
         # Fallback: Use Spec Section if nothing else found
-        spec_match = re.search(r'Spec\s*Section[:\s\t]+([^\n\r]+)', body, re.IGNORECASE)
+        spec_match = _SPEC_SECTION_RE.search(body)
         if spec_match:
             title = spec_match.group(1).strip()
             if title:
@@ -3042,19 +2609,15 @@ def parse_title(subject, identifier, body=None):
     if identifier and subject:
         title = subject
         # Remove common prefixes
-        title = re.sub(r'^(Re:\s*)?(Fwd?:\s*)?(Action Required:\s*)?', '', title, flags=re.IGNORECASE)
+        title = _SUBJECT_PREFIX_RE.sub('', title)
         # Remove project prefix like "LEB - Turner (NB.TypeF2.0) -"
-        title = re.sub(r'LEB\s*-?\s*[\w\s]*\([^)]+\)\s*-?\s*', '', title)
+        title = _PROJECT_PREFIX_RE.sub('', title)
         # Remove the identifier (handle both "Submittal #25 00 00-3" formats)
         title = re.sub(re.escape(identifier), '', title, flags=re.IGNORECASE)
-        title = re.sub(r'Submittal\s*#?[\d\s\-\.]+', '', title, flags=re.IGNORECASE)
-        title = re.sub(r'RFI\s*#?[\d\s\-\.]+', '', title, flags=re.IGNORECASE)
+        title = _SUBMITTAL_NUMBER_RE.sub('', title)
+        title = _RFI_NUMBER_RE.sub('', title)
         # Remove trailing ACC notification actions
-        title = re.sub(
-            r'\s*(was assigned to you|was assigned to your role|needs your review|requires action|'
-            r'You have been set as ball in court.*|was set as ball in court.*|'
-            r'was assigned to you for co-review|was assigned to you for review).*$',
-            '', title, flags=re.IGNORECASE)
+        title = _ACC_ACTION_SUFFIX_RE.sub('', title)
         title = title.strip(' -–—:,')
         # If subject fallback produced nothing useful, return None
         if not title or title.lower() in ('for review', 'for co-review'):
@@ -3062,6 +2625,65 @@ def parse_title(subject, identifier, body=None):
         
     return title if title else None
 
+def _parse_free_date_dateutil(date_str):
+    """Parse a free-form date string with dateutil's fuzzy parser."""
+    try:
+        return date_parser.parse(date_str, fuzzy=True, ignoretz=True).strftime('%Y-%m-%d')
+    except:
+        return None
+
+def _parse_free_date_strptime(date_str):
+    """Parse a free-form date string against a few common formats."""
+    for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%B %d, %Y', '%b %d, %Y', '%b %d %Y']:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except:
+            pass
+    return None
+
+# Parser for dates whose format isn't fixed by the pattern, picked once at import
+_parse_free_date = _parse_free_date_dateutil if HAS_DATEUTIL else _parse_free_date_strptime
+
+def _parse_email_date(date_str, formats=()):
+    """Parse a date captured from an email into YYYY-MM-DD format, or None."""
+    date_str = date_str.strip()
+    # Formats implied by the pattern that matched
+    for fmt in formats:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            pass
+    return _parse_free_date(date_str)
+
+# Each fixed-shape pattern carries the strptime formats its match can take, so
+# the common cases skip dateutil's much slower fuzzy parser
+_MONTH_NAME_DATE = r'([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})'
+_MONTH_NAME_FORMATS = ('%b %d, %Y', '%B %d, %Y', '%b %d %Y', '%B %d %Y')
+_SLASH_DATE = r'(\d{1,2}/\d{1,2}/\d{4})'
+_SLASH_FORMATS = ('%m/%d/%Y',)
+_ISO_DATE = r'(\d{4}-\d{2}-\d{2})'
+_ISO_FORMATS = ('%Y-%m-%d',)
+
+# "What's changed" rows: any text (old date or "Unspecified") → new date
+_DUE_DATE_ARROW_RES = [
+    (re.compile(r"Due\s*Date[:\s\t]+[^\n→>-]*(?:→|->|➔|➜)\s*" + _MONTH_NAME_DATE, re.IGNORECASE), _MONTH_NAME_FORMATS),
+    (re.compile(r"Due\s*Date[:\s\t]+[^\n→>-]*(?:→|->|➔|➜)\s*" + _SLASH_DATE, re.IGNORECASE), _SLASH_FORMATS),
+]
+_ITEM_DETAILS_RE = re.compile(r'Item\s*Details(.+?)(?:Attachments|$)', re.IGNORECASE | re.DOTALL)
+_ITEM_DETAILS_DUE_DATE_RES = [
+    (re.compile(r'Due\s*Date[:\s\t]+' + _MONTH_NAME_DATE, re.IGNORECASE), _MONTH_NAME_FORMATS),
+    (re.compile(r'Due\s*Date[:\s\t]+' + _SLASH_DATE, re.IGNORECASE), _SLASH_FORMATS),
+]
+_DUE_DATE_RES = [(re.compile(pattern, re.IGNORECASE), formats) for pattern, formats in [
+    (r'Due\s*Date[:\s\t]+' + _MONTH_NAME_DATE, _MONTH_NAME_FORMATS),  # "Due Date    Jan 22, 2026"
+    (r'Due\s*Date[:\s\t]+' + _SLASH_DATE, _SLASH_FORMATS),  # "Due Date    01/22/2026"
+    (r'Due\s*Date[:\s\t]+' + _ISO_DATE, _ISO_FORMATS),  # "Due Date    2026-01-22"
+    (r'Due[:\s\t]+' + _MONTH_NAME_DATE, _MONTH_NAME_FORMATS),  # "Due: Jan 22, 2026"
+    (r'Due[:\s\t]+' + _SLASH_DATE, _SLASH_FORMATS),
+    (r'Response\s*Due[:\s\t]+(.+?)(?:\n|$)', ()),
+    (r'Required\s*[Bb]y[:\s\t]+(.+?)(?:\n|$)', ()),
+]]
+
 def parse_due_date(body):
     """Extract due date from email body.
     
@@ -3071,91 +2693,56 @@ def parse_due_date(body):
     if not body:
         return None
     
-    def try_parse_date(date_str):
-        """Helper to parse a date string into YYYY-MM-DD format."""
-        date_str = date_str.strip()
-        if HAS_DATEUTIL:
-            try:
-                parsed_date = date_parser.parse(date_str, fuzzy=True, ignoretz=True)
-                return parsed_date.strftime('%Y-%m-%d')
-            except:
-                pass
-        else:
-            for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%B %d, %Y', '%b %d, %Y', '%b %d %Y']:
-                try:
-                    parsed_date = datetime.strptime(date_str, fmt)
-                    return parsed_date.strftime('%Y-%m-%d')
-                except:
-                    pass
-        return None
-    
     # FIRST: Check for "What's changed" section with arrow pattern
     # This handles: "Due Date    Jan 30, 2026 → Feb 04, 2026" or "Unspecified → Feb 04, 2026"
     # We want the NEW date (after the arrow)
-    arrow_patterns = [
-        # Any text (old date or "Unspecified") → new date
-        r"Due\s*Date[:\s\t]+[^\n→>-]*(?:→|->|➔|➜)\s*([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})",
-        r"Due\s*Date[:\s\t]+[^\n→>-]*(?:→|->|➔|➜)\s*(\d{1,2}/\d{1,2}/\d{4})",
-    ]
-    
-    for pattern in arrow_patterns:
-        match = re.search(pattern, body, re.IGNORECASE)
+    for pattern, formats in _DUE_DATE_ARROW_RES:
+        match = pattern.search(body)
         if match:
-            new_date = try_parse_date(match.group(1))
+            new_date = _parse_email_date(match.group(1), formats)
             if new_date:
                 return new_date
     
     # SECOND: Look for "Item Details" section specifically (more reliable)
     # This section has the definitive current values
-    item_details_section = re.search(r'Item\s*Details(.+?)(?:Attachments|$)', body, re.IGNORECASE | re.DOTALL)
+    item_details_section = _ITEM_DETAILS_RE.search(body)
     if item_details_section:
         details_text = item_details_section.group(1)
-        for pattern in [
-            r'Due\s*Date[:\s\t]+([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})',
-            r'Due\s*Date[:\s\t]+(\d{1,2}/\d{1,2}/\d{4})',
-        ]:
-            match = re.search(pattern, details_text, re.IGNORECASE)
+        for pattern, formats in _ITEM_DETAILS_DUE_DATE_RES:
+            match = pattern.search(details_text)
             if match:
-                parsed = try_parse_date(match.group(1))
+                parsed = _parse_email_date(match.group(1), formats)
                 if parsed:
                     return parsed
     
     # THIRD: Standard patterns (fallback for non-ACC emails or simple formats)
-    patterns = [
-        r'Due\s*Date[:\s\t]+([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})',  # "Due Date    Jan 22, 2026"
-        r'Due\s*Date[:\s\t]+(\d{1,2}/\d{1,2}/\d{4})',  # "Due Date    01/22/2026"
-        r'Due\s*Date[:\s\t]+(\d{4}-\d{2}-\d{2})',  # "Due Date    2026-01-22"
-        r'Due[:\s\t]+([A-Za-z]{3,9}\s+\d{1,2},?\s+\d{4})',  # "Due: Jan 22, 2026"
-        r'Due[:\s\t]+(\d{1,2}/\d{1,2}/\d{4})',
-        r'Response\s*Due[:\s\t]+(.+?)(?:\n|$)',
-        r'Required\s*[Bb]y[:\s\t]+(.+?)(?:\n|$)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, body, re.IGNORECASE)
+    for pattern, formats in _DUE_DATE_RES:
+        match = pattern.search(body)
         if match:
             date_str = match.group(1).strip()
-            parsed = try_parse_date(date_str)
+            parsed = _parse_email_date(date_str, formats)
             if parsed:
                 return parsed
     return None
 
+_PRIORITY_RE = re.compile(r'Priority[:\s\t]+(High|Medium|Normal|Low|Urgent|Critical)', re.IGNORECASE)
+# Map ACC priority values to our standard values
+_PRIORITY_MAP = {
+    'Normal': 'Medium',
+    'Urgent': 'High',
+    'Critical': 'High'
+}
+
 def parse_priority(body):
     """Extract priority from email body."""
     if not body:
         return None
     
     # ACC uses tab/whitespace separation and may use "Normal" instead of "Medium"
-    match = re.search(r'Priority[:\s\t]+(High|Medium|Normal|Low|Urgent|Critical)', body, re.IGNORECASE)
+    match = _PRIORITY_RE.search(body)
     if match:
         priority = match.group(1).capitalize()
-        # Map ACC priority values to our standard values
-        priority_map = {
-            'Normal': 'Medium',
-            'Urgent': 'High',
-            'Critical': 'High'
-        }
-        return priority_map.get(priority, priority)
+        return _PRIORITY_MAP.get(priority, priority)
     return None
 
 def parse_rfi_question(body):
@@ -3378,14 +2965,15 @@ def is_user_in_submittal_approvers(body, user_names):
     
     return False
 
+_MULTI_DASH_RE = re.compile(r'-+')
+_FOLDER_NAME_TRANS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '-'))
+
 def sanitize_folder_name(name):
     """Create a filesystem-safe folder name."""
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '-')
+    # Replace invalid characters
+    name = name.translate(_FOLDER_NAME_TRANS)
     # Remove multiple dashes
-    name = re.sub(r'-+', '-', name)
+    name = _MULTI_DASH_RE.sub('-', name)
     # Remove leading/trailing dashes and spaces
     name = name.strip('- ')
     return name
@@ -3505,34 +3093,71 @@ def regenerate_forms_for_item(item_id):
     
     Returns dict with regeneration results.
     """
+    return regenerate_forms_for_items([item_id])[item_id]
+
+
+def regenerate_forms_for_items(item_ids):
+    """Regenerate the active response forms for several items.
+    
+    Single-reviewer reviewer and QCR forms are generated through the batch
+    form generators, so their items are loaded in one pass however many
+    folders were renamed. Returns {item_id: result dict as for one item}.
+    """
     conn = get_db()
     cursor = conn.cursor()
     
-    cursor.execute('SELECT id, status, multi_reviewer_mode, reviewer_response_status, qcr_response_status FROM item WHERE id = ?', (item_id,))
-    item = cursor.fetchone()
-    
-    if not item:
-        conn.close()
-        return {'success': False, 'error': 'Item not found'}
+    rows = {}
+    for chunk in chunked(item_ids):
+        cursor.execute(f'''
+            SELECT id, status, multi_reviewer_mode, reviewer_response_status, qcr_response_status
+            FROM item WHERE id IN ({','.join('?' * len(chunk))})
+        ''', chunk)
+        rows.update((row['id'], row) for row in cursor.fetchall())
     
     # Only regenerate for items that are actively being reviewed
     active_statuses = ('Assigned', 'In Review', 'In QC', 'Ready for Response')
-    if item['status'] not in active_statuses:
-        conn.close()
-        return {'success': True, 'message': 'Item not active, skipping form regeneration', 'regenerated': []}
+    results = {}
+    multi_items = []
+    reviewer_form_ids = []
+    qcr_form_ids = []
+    for item_id in item_ids:
+        item = rows.get(item_id)
+        if not item:
+            results[item_id] = {'success': False, 'error': 'Item not found'}
+            continue
+        if item['status'] not in active_statuses:
+            results[item_id] = {'success': True, 'message': 'Item not active, skipping form regeneration', 'regenerated': []}
+            continue
+        results[item_id] = {'success': True, 'regenerated': [], 'errors': []}
+        if item['multi_reviewer_mode']:
+            multi_items.append(item_id)
+            continue
+        # Single reviewer: regenerate the main response form
+        if item['reviewer_response_status'] in ('Emails Sent', 'Not Sent') and item['status'] in ('Assigned', 'In Review'):
+            reviewer_form_ids.append(item_id)
+        # Regenerate QCR form if in QC phase
+        if item['qcr_response_status'] in ('Emails Sent',) and item['status'] == 'In QC':
+            qcr_form_ids.append(item_id)
     
-    regenerated = []
-    errors = []
+    # Multi-reviewer: regenerate forms for reviewers who haven't responded yet
+    pending_reviewers = {}
+    for chunk in chunked(multi_items):
+        cursor.execute(f'''
+            SELECT * FROM item_reviewers
+            WHERE item_id IN ({','.join('?' * len(chunk))}) AND needs_response = 1
+        ''', chunk)
+        for reviewer in cursor.fetchall():
+            if reviewer['item_id'] not in pending_reviewers:
+                pending_reviewers[reviewer['item_id']] = []
+            pending_reviewers[reviewer['item_id']].append(dict(reviewer))
+    conn.close()
     
-    if item['multi_reviewer_mode']:
-        # Multi-reviewer: regenerate forms for reviewers who haven't responded yet
-        cursor.execute('SELECT * FROM item_reviewers WHERE item_id = ? AND needs_response = 1', (item_id,))
-        pending_reviewers = cursor.fetchall()
-        conn.close()
-        
-        for reviewer in pending_reviewers:
+    for item_id in multi_items:
+        regenerated = results[item_id]['regenerated']
+        errors = results[item_id]['errors']
+        for reviewer in pending_reviewers.get(item_id, []):
             try:
-                result = generate_multi_reviewer_form(item_id, dict(reviewer))
+                result = generate_multi_reviewer_form(item_id, reviewer)
                 if result['success']:
                     regenerated.append({
                         'reviewer': reviewer['reviewer_name'],
@@ -3542,35 +3167,23 @@ def regenerate_forms_for_item(item_id):
                     errors.append(f"{reviewer['reviewer_name']}: {result['error']}")
             except Exception as e:
                 errors.append(f"{reviewer['reviewer_name']}: {str(e)}")
-    else:
-        conn.close()
-        # Single reviewer: regenerate the main response form
-        if item['reviewer_response_status'] in ('Emails Sent', 'Not Sent') and item['status'] in ('Assigned', 'In Review'):
-            try:
-                result = generate_reviewer_form_html(item_id)
-                if result['success']:
-                    regenerated.append({'reviewer': 'single', 'path': result['path']})
-                else:
-                    errors.append(f"Reviewer form: {result['error']}")
-            except Exception as e:
-                errors.append(f"Reviewer form: {str(e)}")
-        
-        # Regenerate QCR form if in QC phase
-        if item['qcr_response_status'] in ('Emails Sent',) and item['status'] == 'In QC':
-            try:
-                result = generate_qcr_form_html(item_id)
-                if result['success']:
-                    regenerated.append({'reviewer': 'qcr', 'path': result['path']})
-                else:
-                    errors.append(f"QCR form: {result['error']}")
-            except Exception as e:
-                errors.append(f"QCR form: {str(e)}")
     
-    return {
-        'success': True,
-        'regenerated': regenerated,
-        'errors': errors
-    }
+    for form_ids, generate_batch, reviewer_label, error_label in (
+            (reviewer_form_ids, generate_reviewer_form_html_batch, 'single', 'Reviewer form'),
+            (qcr_form_ids, generate_qcr_form_html_batch, 'qcr', 'QCR form')):
+        if not form_ids:
+            continue
+        try:
+            batch_results = generate_batch(form_ids)
+        except Exception as e:
+            batch_results = [{'success': False, 'error': str(e)}] * len(form_ids)
+        for item_id, result in zip(form_ids, batch_results):
+            if result['success']:
+                results[item_id]['regenerated'].append({'reviewer': reviewer_label, 'path': result['path']})
+            else:
+                results[item_id]['errors'].append(f"{error_label}: {result['error']}")
+    
+    return results
 
 
 def reconcile_all_folders():
@@ -3631,22 +3244,6 @@ def reconcile_all_folders():
                 'old_path': item['folder_link'],
                 'new_path': found_path
             })
-            
-            # Regenerate active forms so they work correctly with the new folder path
-            try:
-                regen_result = regenerate_forms_for_item(item['id'])
-                if regen_result.get('regenerated'):
-                    results['forms_regenerated'].append({
-                        'id': item['id'],
-                        'identifier': item['identifier'],
-                        'forms': regen_result['regenerated']
-                    })
-                    print(f"  [Folder Reconcile] Regenerated {len(regen_result['regenerated'])} form(s) for {item['identifier']} after folder rename")
-                if regen_result.get('errors'):
-                    for err in regen_result['errors']:
-                        print(f"  [Folder Reconcile] Form regen error for {item['identifier']}: {err}")
-            except Exception as e:
-                print(f"  [Folder Reconcile] Failed to regenerate forms for {item['identifier']}: {e}")
         else:
             results['still_missing'].append({
                 'id': item['id'],
@@ -3654,6 +3251,27 @@ def reconcile_all_folders():
                 'expected_path': item['folder_link']
             })
     
+    # Regenerate active forms so they work correctly with the new folder paths,
+    # all reconciled items in one batch
+    if results['reconciled']:
+        try:
+            regen_results = regenerate_forms_for_items([r['id'] for r in results['reconciled']])
+        except Exception as e:
+            print(f"  [Folder Reconcile] Failed to regenerate forms: {e}")
+            regen_results = {}
+        for reconciled in results['reconciled']:
+            regen_result = regen_results.get(reconciled['id'], {})
+            if regen_result.get('regenerated'):
+                results['forms_regenerated'].append({
+                    'id': reconciled['id'],
+                    'identifier': reconciled['identifier'],
+                    'forms': regen_result['regenerated']
+                })
+                print(f"  [Folder Reconcile] Regenerated {len(regen_result['regenerated'])} form(s) for {reconciled['identifier']} after folder rename")
+            if regen_result.get('errors'):
+                for err in regen_result['errors']:
+                    print(f"  [Folder Reconcile] Form regen error for {reconciled['identifier']}: {err}")
+    
     return results
 
 def reorganize_folder_for_revision(folder_link, current_reopen_count):
@@ -3769,126 +3387,274 @@ def create_item_folder(item_type, identifier, bucket, title=None, base_folder=No
 
 TEMPLATES_DIR = BASE_DIR / "templates"
 
-def generate_reviewer_form_html(item_id):
-    """Generate a self-contained HTML form for reviewer response and save it to the item folder."""
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT i.*, 
-               ir.display_name as reviewer_name, ir.email as reviewer_email,
-               qcr.display_name as qcr_name, qcr.email as qcr_email
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.id = ?
-    ''', (item_id,))
-    item_row = cursor.fetchone()
+_PLACEHOLDER_RE = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+class CompiledTemplate:
+    """A form template split once into literal text and {{NAME}} placeholders."""
+    __slots__ = ('segments',)
+    
+    def __init__(self, text):
+        # Splitting on the capturing pattern alternates literal text (even
+        # positions) with placeholder names (odd positions)
+        self.segments = _PLACEHOLDER_RE.split(text)
+    
+    def render(self, values):
+        """Fill the placeholders from values; unknown names are left as-is."""
+        parts = self.segments[:]
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            parts[i] = values.get(name, '{{' + name + '}}')
+        return ''.join(parts)
+    
+    def render_to(self, fp, values):
+        """Like render(), but write the pieces straight to the open file fp."""
+        write = fp.write
+        for i, segment in enumerate(self.segments):
+            if i % 2:
+                write(values.get(segment, '{{' + segment + '}}'))
+            elif segment:
+                write(segment)
+
+# Form templates are read and compiled once and kept in memory; a template
+# is reloaded only when its file's modification time changes
+_TEMPLATE_CACHE = {}
+
+def _load_template(candidates):
+    """Return (path, CompiledTemplate) for the first template in candidates that exists, or None."""
+    for template_path in candidates:
+        try:
+            mtime = template_path.stat().st_mtime
+        except OSError:
+            continue
+        cached = _TEMPLATE_CACHE.get(template_path)
+        if cached is None or cached[0] != mtime:
+            with open(template_path, 'r', encoding='utf-8') as f:
+                cached = (mtime, CompiledTemplate(f.read()))
+            _TEMPLATE_CACHE[template_path] = cached
+        return template_path, cached[1]
+    return None
+
+# Responses folders this process has already created or seen; skips the
+# mkdir round-trip (slow on network shares) when regenerating forms
+_KNOWN_RESPONSES_DIRS = set()
+
+def _ensure_responses_dir(responses_folder):
+    """Create the Responses folder unless this process already has."""
+    key = str(responses_folder)
+    if key not in _KNOWN_RESPONSES_DIRS:
+        responses_folder.mkdir(exist_ok=True)
+        _KNOWN_RESPONSES_DIRS.add(key)
+
+def _open_response_form(path, responses_folder):
+    """Open a form file in the Responses folder for writing.
     
-    if not item_row:
-        conn.close()
-        return {'success': False, 'error': 'Item not found'}
+    The folder may have been deleted or moved since _ensure_responses_dir
+    cached it; in that case it is created again and the open retried once.
+    """
+    try:
+        return open(path, 'w', encoding='utf-8', buffering=65536)
+    except FileNotFoundError:
+        _KNOWN_RESPONSES_DIRS.discard(str(responses_folder))
+        responses_folder.mkdir(parents=True, exist_ok=True)
+        _KNOWN_RESPONSES_DIRS.add(str(responses_folder))
+        return open(path, 'w', encoding='utf-8', buffering=65536)
+
+# Escape special characters for JavaScript string embedding in one pass
+_JS_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', "'": "\\'", '\n': '\\n', '\r': ''})
+
+def _js_escape(s):
+    """Escape s for a quoted JavaScript string literal ('' for empty values)."""
+    return s.translate(_JS_ESCAPE_TABLE) if s else ''
+
+# JSON for an empty list, used wherever a form or response has no files
+_EMPTY_JSON_LIST = '[]'
+
+def _js_escape_or_na(s):
+    return _js_escape(s) or 'N/A'
+
+# QCR form text shown in the page body rather than a JavaScript literal: line
+# breaks stay as they are, since the HTA reads this text back as the response
+_TEXT_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"', "'": "\\'"})
+
+def _text_escape(s):
+    """Escape s like _js_escape but keep its line breaks ('' for empty values)."""
+    return s.translate(_TEXT_ESCAPE_TABLE) if s else ''
+
+# Form placeholders filled straight from an item column: (placeholder, column,
+# conversion). A conversion of None means the raw value, or '' when empty.
+_FORM_FIELD_MAP = (
+    ('ITEM_ID', 'id', str),
+    ('ITEM_TYPE', 'type', None),
+    ('ITEM_IDENTIFIER', 'identifier', None),
+    ('ITEM_TITLE', 'title', _js_escape_or_na),
+    ('DATE_RECEIVED', 'date_received', format_date_for_email),
+    ('QCR_DUE_DATE', 'qcr_due_date', format_date_for_email),
+    ('CONTRACTOR_DUE_DATE', 'due_date', format_date_for_email),
+    ('REVIEWER_NAME', 'reviewer_name', _js_escape_or_na),
+    ('FOLDER_PATH', 'folder_link', _js_escape),
+    ('RFI_QUESTION', 'rfi_question', _js_escape),
+)
+
+_REVIEWER_FIELD_MAP = _FORM_FIELD_MAP + (
+    ('REVIEWER_DUE_DATE', 'initial_reviewer_due_date', format_date_for_email),
+    ('REVIEWER_EMAIL', 'reviewer_email', None),
+    ('TOKEN', 'email_token_reviewer', None),
+)
+
+_QCR_FIELD_MAP = tuple(f for f in _FORM_FIELD_MAP if f[0] != 'RFI_QUESTION') + (
+    ('RFI_QUESTION', 'rfi_question', _text_escape),
+    ('QCR_NAME', 'qcr_name', _js_escape_or_na),
+    ('QCR_EMAIL', 'qcr_email', None),
+    ('TOKEN', 'email_token_qcr', None),
+    ('REVIEWER_INTERNAL_NOTES', 'reviewer_internal_notes', _text_escape),
+)
+
+def _build_subs(item, field_map, extras):
+    """Placeholder values for a form: the mapped item columns plus extras."""
+    values = {}
+    for key, column, convert in field_map:
+        value = item.get(column)
+        values[key] = convert(value) if convert else (value or '')
+    values.update(extras)
+    return values
+
+# Item rows with their reviewer and QCR names/emails; shared by the single-item
+# and batch lookups below so both always return the same columns
+_SQL_SELECT_ITEM_WITH_USERS = '''
+    SELECT i.*, 
+           ir.display_name as reviewer_name, ir.email as reviewer_email,
+           qcr.display_name as qcr_name, qcr.email as qcr_email
+    FROM item i
+    LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
+    LEFT JOIN user qcr ON i.qcr_id = qcr.id
+'''
+
+_SQL_ITEM_WITH_USERS = _SQL_SELECT_ITEM_WITH_USERS + '''    WHERE i.id = ?
+'''
+
+def _fetch_item_with_users(cursor, item_id):
+    """Return the item row with its reviewer and QCR names/emails, or None."""
+    cursor.execute(_SQL_ITEM_WITH_USERS, (item_id,))
+    return cursor.fetchone()
+
+_SQL_ITEMS_WITH_USERS = _SQL_SELECT_ITEM_WITH_USERS + '''    WHERE i.id IN ({placeholders})
+'''
+
+def _load_form_items(cursor, item_ids, token_column):
+    """Fetch the items a batch of forms is generated for, keyed by id.
     
-    # Convert to dict for .get() access
-    item = dict(item_row)
+    Items without an initial reviewer get the names from item_reviewers, and
+    items with a folder but no token in token_column get a new one. All of it
+    takes one query per step (per SQL_IN_CHUNK_SIZE items).
+    """
+    items = {}
+    for chunk in chunked(item_ids):
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(_SQL_ITEMS_WITH_USERS.format(placeholders=placeholders), chunk)
+        # Convert to dicts for .get() access
+        items.update((row['id'], dict(row)) for row in cursor.fetchall())
     
     # Check for reviewer names in item_reviewers table if reviewer_name is not set
-    if not item.get('reviewer_name'):
-        cursor.execute('''
-            SELECT GROUP_CONCAT(reviewer_name, ', ') as reviewer_names
+    unnamed = [item_id for item_id, item in items.items() if not item.get('reviewer_name')]
+    for chunk in chunked(unnamed):
+        cursor.execute(f'''
+            SELECT item_id, GROUP_CONCAT(reviewer_name, ', ') as reviewer_names
             FROM item_reviewers
-            WHERE item_id = ?
-        ''', (item_id,))
-        result = cursor.fetchone()
-        if result and result['reviewer_names']:
-            item['reviewer_name'] = result['reviewer_names']
+            WHERE item_id IN ({','.join('?' * len(chunk))})
+            GROUP BY item_id
+        ''', chunk)
+        for row in cursor.fetchall():
+            if row['reviewer_names']:
+                items[row['item_id']]['reviewer_name'] = row['reviewer_names']
     
-    if not item['folder_link']:
-        conn.close()
-        return {'success': False, 'error': 'Item has no folder assigned'}
+    # Generate tokens where missing (items without a folder get no form, so no token)
+    new_tokens = []
+    for item in items.values():
+        if item['folder_link'] and not item[token_column]:
+            item[token_column] = generate_token()
+            new_tokens.append((item[token_column], item['id']))
+    if new_tokens:
+        cursor.executemany(f'UPDATE item SET {token_column} = ? WHERE id = ?', new_tokens)
     
-    # Generate token if not exists
-    token = item['email_token_reviewer']
-    if not token:
-        token = generate_token()
-        cursor.execute('UPDATE item SET email_token_reviewer = ? WHERE id = ?', (token, item_id))
-        conn.commit()
+    return items
+
+def generate_reviewer_form_html(item_id):
+    """Generate a self-contained HTML form for reviewer response and save it to the item folder."""
+    return generate_reviewer_form_html_batch([item_id])[0]
+
+def generate_reviewer_form_html_batch(item_ids):
+    """Generate reviewer response forms for several items with one database round-trip.
     
-    # Calculate due dates (formatted for display)
-    reviewer_due = format_date_for_email(item['initial_reviewer_due_date'])
-    qcr_due = format_date_for_email(item['qcr_due_date'])
+    Returns one result dict per item id, in the same order.
+    """
+    if not item_ids:
+        return []
     
+    conn = get_db()
+    cursor = conn.cursor()
+    items = _load_form_items(cursor, item_ids, 'email_token_reviewer')
+    conn.commit()
     conn.close()
     
-    # Note: We no longer pre-populate files - HTA will scan the folder
-    folder_files = []  # Empty - HTA loads files from folder directly
-    
-    # Load template (use HTA template for automatic file saving)
-    template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta"
-    if not template_path.exists():
-        # Fallback to HTML templates
-        template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html"
-        if not template_path.exists():
-            template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v2.html"
-            if not template_path.exists():
-                template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE.html"
-                if not template_path.exists():
-                    return {'success': False, 'error': 'Reviewer form template not found'}
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Escape special characters for JavaScript embedding
-    def js_escape(s):
-        if not s:
-            return ''
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'").replace('\n', '\\n').replace('\r', '')
+    # Load template (use HTA template for automatic file saving, else fall back to HTML)
+    loaded = _load_template((
+        TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta",
+        TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html",
+        TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v2.html",
+        TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE.html",
+    ))
     
+    results = []
+    for item_id in item_ids:
+        item = items.get(item_id)
+        if not item:
+            results.append({'success': False, 'error': 'Item not found'})
+        elif not item['folder_link']:
+            results.append({'success': False, 'error': 'Item has no folder assigned'})
+        elif not loaded:
+            results.append({'success': False, 'error': 'Reviewer form template not found'})
+        else:
+            results.append(_write_reviewer_form(item, *loaded))
+    return results
+
+def _write_reviewer_form(item, template_path, template):
+    """Render one reviewer form into the item's Responses folder."""
     # Escape special characters for HTML content
     def html_escape(s):
         if not s:
             return ''
         return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
     
-    # Create folder path URL for file:// link
-    folder_path_url = str(item['folder_link']).replace('\\', '/')
+    # Callers only pass items with a folder, so folder_link is a non-empty string
+    folder_link = item['folder_link']
     
-    # Replace placeholders
-    html = template.replace('{{ITEM_ID}}', str(item['id']))
-    html = html.replace('{{ITEM_TYPE}}', item['type'] or '')
-    html = html.replace('{{ITEM_IDENTIFIER}}', item['identifier'] or '')
-    html = html.replace('{{ITEM_TITLE}}', js_escape(item['title']) or 'N/A')
-    html = html.replace('{{ITEM_TITLE_HTML}}', html_escape(item['title'] or 'N/A'))
-    html = html.replace('{{DATE_RECEIVED}}', format_date_for_email(item['date_received']))
-    html = html.replace('{{REVIEWER_DUE_DATE}}', reviewer_due)
-    html = html.replace('{{QCR_DUE_DATE}}', qcr_due)
-    html = html.replace('{{CONTRACTOR_DUE_DATE}}', format_date_for_email(item['due_date']))
-    html = html.replace('{{REVIEWER_NAME}}', js_escape(item['reviewer_name']) or 'N/A')
-    html = html.replace('{{REVIEWER_EMAIL}}', item['reviewer_email'] or '')
-    html = html.replace('{{TOKEN}}', token)
-    html = html.replace('{{FOLDER_PATH}}', js_escape(item['folder_link']) or '')
-    html = html.replace('{{FOLDER_PATH_RAW}}', html_escape(item['folder_link'] or ''))
-    html = html.replace('{{FOLDER_PATH_URL}}', folder_path_url)
-    html = html.replace('{{FOLDER_FILES_JSON}}', json.dumps(folder_files))
-    html = html.replace('{{RFI_QUESTION}}', js_escape(item.get('rfi_question', '') or ''))
-    html = html.replace('{{IS_RFI}}', 'true' if (item['type'] or '').upper() == 'RFI' else 'false')
+    # Create folder path URL for file:// link
+    folder_path_url = folder_link.replace('\\', '/')
     
     # Save to Responses subfolder (use .hta extension if HTA template, else .html)
     # Use versioned folder names for reopened items (Responses R2, Responses R3, etc.)
-    folder_path = Path(item['folder_link'])
+    folder_path = Path(folder_link)
     reopen_count = item.get('reopen_count') or 0
     if reopen_count > 0:
         responses_folder = folder_path / f"Responses R{reopen_count + 1}"
     else:
         responses_folder = folder_path / "Responses"
     
-    # Add responses folder path and reopen count to template
-    html = html.replace('{{RESPONSES_FOLDER}}', js_escape(str(responses_folder)))
-    html = html.replace('{{REOPEN_COUNT}}', str(reopen_count))
+    # Replace placeholders
+    values = _build_subs(item, _REVIEWER_FIELD_MAP, {
+        'ITEM_TITLE_HTML': html_escape(item['title'] or 'N/A'),
+        'FOLDER_PATH_RAW': html_escape(folder_link),
+        'FOLDER_PATH_URL': folder_path_url,
+        # Always empty - we no longer pre-populate files, the HTA scans the folder itself
+        'FOLDER_FILES_JSON': _EMPTY_JSON_LIST,
+        'IS_RFI': 'true' if (item['type'] or '').upper() == 'RFI' else 'false',
+        'RESPONSES_FOLDER': _js_escape(str(responses_folder)),
+        'REOPEN_COUNT': str(reopen_count),
+    })
     
     # Create Responses subfolder if it doesn't exist
     try:
-        responses_folder.mkdir(exist_ok=True)
+        _ensure_responses_dir(responses_folder)
     except Exception as e:
         return {'success': False, 'error': f'Failed to create Responses folder: {e}'}
     
@@ -3898,8 +3664,8 @@ def generate_reviewer_form_html(item_id):
         form_path = responses_folder / "_RESPONSE_FORM.html"
     
     try:
-        with open(form_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        with _open_response_form(form_path, responses_folder) as f:
+            template.render_to(f, values)
         return {'success': True, 'path': str(form_path)}
     except Exception as e:
         return {'success': False, 'error': f'Failed to save form: {e}'}
@@ -3907,49 +3673,44 @@ def generate_reviewer_form_html(item_id):
 
 def generate_qcr_form_html(item_id):
     """Generate a self-contained HTML form for QCR response and save it to the item folder."""
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT i.*, 
-               ir.display_name as reviewer_name, ir.email as reviewer_email,
-               qcr.display_name as qcr_name, qcr.email as qcr_email
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.id = ?
-    ''', (item_id,))
-    item = cursor.fetchone()
-    
-    if not item:
-        conn.close()
-        return {'success': False, 'error': 'Item not found'}
-    
-    # Convert to dict for easier handling (supports .get() method)
-    item = dict(item)
+    return generate_qcr_form_html_batch([item_id])[0]
+
+def generate_qcr_form_html_batch(item_ids):
+    """Generate QCR response forms for several items with one database round-trip.
     
-    # Check for reviewer names in item_reviewers table if reviewer_name is not set
-    if not item.get('reviewer_name'):
-        cursor.execute('''
-            SELECT GROUP_CONCAT(reviewer_name, ', ') as reviewer_names
-            FROM item_reviewers
-            WHERE item_id = ?
-        ''', (item_id,))
-        result = cursor.fetchone()
-        if result and result['reviewer_names']:
-            item['reviewer_name'] = result['reviewer_names']
+    Returns one result dict per item id, in the same order.
+    """
+    if not item_ids:
+        return []
     
-    if not item['folder_link']:
-        conn.close()
-        return {'success': False, 'error': 'Item has no folder assigned'}
+    conn = get_db()
+    cursor = conn.cursor()
+    items = _load_form_items(cursor, item_ids, 'email_token_qcr')
+    conn.commit()
+    conn.close()
     
-    # Generate token if not exists
-    token = item['email_token_qcr']
-    if not token:
-        token = generate_token()
-        cursor.execute('UPDATE item SET email_token_qcr = ? WHERE id = ?', (token, item_id))
-        conn.commit()
+    # Load template (use HTA template for automatic file saving, else fall back to HTML)
+    loaded = _load_template((
+        TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v3.hta",
+        TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v2.html",
+        TEMPLATES_DIR / "_QCR_FORM_TEMPLATE.html",
+    ))
     
+    results = []
+    for item_id in item_ids:
+        item = items.get(item_id)
+        if not item:
+            results.append({'success': False, 'error': 'Item not found'})
+        elif not item['folder_link']:
+            results.append({'success': False, 'error': 'Item has no folder assigned'})
+        elif not loaded:
+            results.append({'success': False, 'error': 'QCR form template not found'})
+        else:
+            results.append(_write_qcr_form(item, *loaded))
+    return results
+
+def _write_qcr_form(item, template_path, template):
+    """Render one QCR form into the item's Responses folder."""
     # Parse reviewer selected files
     reviewer_files = []
     if item['reviewer_selected_files']:
@@ -3958,27 +3719,6 @@ def generate_qcr_form_html(item_id):
         except:
             pass
     
-    conn.close()
-    
-    # Load template (use HTA template for automatic file saving)
-    template_path = TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v3.hta"
-    if not template_path.exists():
-        # Fall back to HTML templates
-        template_path = TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v2.html"
-        if not template_path.exists():
-            template_path = TEMPLATES_DIR / "_QCR_FORM_TEMPLATE.html"
-            if not template_path.exists():
-                return {'success': False, 'error': 'QCR form template not found'}
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Escape special characters for JavaScript embedding
-    def js_escape(s):
-        if not s:
-            return ''
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'")
-    
     # Escape special characters for HTML content
     def html_escape(s):
         if not s:
@@ -3986,47 +3726,14 @@ def generate_qcr_form_html(item_id):
         return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
     
     # Format reviewer selected files as HTML list items
-    reviewer_files_html = ''
-    reviewer_files_text = 'None selected'
-    reviewer_files_js = ''
-    if reviewer_files:
-        for f in reviewer_files:
-            reviewer_files_html += f'<li>{f}</li>'
-        reviewer_files_text = '; '.join(reviewer_files)
-        reviewer_files_js = ', '.join([f'"{js_escape(f)}"' for f in reviewer_files])
-    else:
-        reviewer_files_html = '<li><em>None selected</em></li>'
+    reviewer_files_html = ''.join(f'<li>{escape_html(f)}</li>' for f in reviewer_files) or '<li><em>None selected</em></li>'
+    reviewer_files_text = '; '.join(reviewer_files) if reviewer_files else 'None selected'
+    # JSON string literals are valid JavaScript; strip the brackets, the template supplies them
+    reviewer_files_js = json.dumps(reviewer_files)[1:-1] if reviewer_files else ''
     
     # Get response version
     response_version = item['reviewer_response_version'] if item['reviewer_response_version'] else 1
     
-    # Replace placeholders
-    html = template.replace('{{ITEM_ID}}', str(item['id']))
-    html = html.replace('{{ITEM_TYPE}}', item['type'] or '')
-    html = html.replace('{{ITEM_IDENTIFIER}}', item['identifier'] or '')
-    html = html.replace('{{ITEM_TITLE}}', js_escape(item['title']) or 'N/A')
-    html = html.replace('{{ITEM_TITLE_HTML}}', html_escape(item['title'] or 'N/A'))
-    html = html.replace('{{DATE_RECEIVED}}', format_date_for_email(item['date_received']))
-    html = html.replace('{{QCR_DUE_DATE}}', format_date_for_email(item['qcr_due_date']))
-    html = html.replace('{{CONTRACTOR_DUE_DATE}}', format_date_for_email(item['due_date']))
-    html = html.replace('{{PRIORITY}}', item['priority'] or 'Normal')
-    html = html.replace('{{REVIEWER_NAME}}', js_escape(item['reviewer_name']) or 'N/A')
-    html = html.replace('{{QCR_NAME}}', js_escape(item['qcr_name']) or 'N/A')
-    html = html.replace('{{QCR_EMAIL}}', item['qcr_email'] or '')
-    html = html.replace('{{TOKEN}}', token)
-    html = html.replace('{{FOLDER_PATH}}', js_escape(item['folder_link']) or '')
-    html = html.replace('{{FOLDER_PATH_RAW}}', html_escape(item['folder_link'] or ''))
-    html = html.replace('{{REVIEWER_RESPONSE_CATEGORY}}', item['reviewer_response_category'] or 'Not specified')
-    html = html.replace('{{REVIEWER_NOTES}}', js_escape(item['reviewer_notes'] or item['reviewer_response_text'] or 'No notes provided'))
-    html = html.replace('{{REVIEWER_INTERNAL_NOTES}}', js_escape(item['reviewer_internal_notes'] or ''))
-    html = html.replace('{{REVIEWER_INTERNAL_NOTES_DISPLAY}}', 'block' if item['reviewer_internal_notes'] else 'none')
-    html = html.replace('{{REVIEWER_SELECTED_FILES}}', reviewer_files_html)
-    html = html.replace('{{REVIEWER_SELECTED_FILES_TEXT}}', reviewer_files_text)
-    html = html.replace('{{REVIEWER_SELECTED_FILES_JS}}', reviewer_files_js)
-    html = html.replace('{{RESPONSE_VERSION}}', str(response_version))
-    html = html.replace('{{RFI_QUESTION}}', js_escape(item.get('rfi_question', '') or ''))
-    html = html.replace('{{IS_RFI}}', 'true' if (item['type'] or '').upper() == 'RFI' else 'false')
-    
     # Save to Responses subfolder (use .hta extension if HTA template, else .html)
     # Use versioned folder names for reopened items (Responses R2, Responses R3, etc.)
     folder_path = Path(item['folder_link'])
@@ -4036,13 +3743,26 @@ def generate_qcr_form_html(item_id):
     else:
         responses_folder = folder_path / "Responses"
     
-    # Add responses folder path and reopen count to template
-    html = html.replace('{{RESPONSES_FOLDER}}', js_escape(str(responses_folder)))
-    html = html.replace('{{REOPEN_COUNT}}', str(reopen_count))
+    # Replace placeholders
+    values = _build_subs(item, _QCR_FIELD_MAP, {
+        'ITEM_TITLE_HTML': html_escape(item['title'] or 'N/A'),
+        'PRIORITY': item['priority'] or 'Normal',
+        'FOLDER_PATH_RAW': html_escape(item['folder_link'] or ''),
+        'REVIEWER_RESPONSE_CATEGORY': item['reviewer_response_category'] or 'Not specified',
+        'REVIEWER_NOTES': _text_escape(item['reviewer_notes'] or item['reviewer_response_text'] or 'No notes provided'),
+        'REVIEWER_INTERNAL_NOTES_DISPLAY': 'block' if item['reviewer_internal_notes'] else 'none',
+        'REVIEWER_SELECTED_FILES': reviewer_files_html,
+        'REVIEWER_SELECTED_FILES_TEXT': reviewer_files_text,
+        'REVIEWER_SELECTED_FILES_JS': reviewer_files_js,
+        'RESPONSE_VERSION': str(response_version),
+        'IS_RFI': 'true' if (item['type'] or '').upper() == 'RFI' else 'false',
+        'RESPONSES_FOLDER': _js_escape(str(responses_folder)),
+        'REOPEN_COUNT': str(reopen_count),
+    })
     
     # Create Responses subfolder if it doesn't exist
     try:
-        responses_folder.mkdir(exist_ok=True)
+        _ensure_responses_dir(responses_folder)
     except Exception as e:
         return {'success': False, 'error': f'Failed to create Responses folder: {e}'}
     
@@ -4052,8 +3772,8 @@ def generate_qcr_form_html(item_id):
         form_path = responses_folder / "_QCR_FORM.html"
     
     try:
-        with open(form_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        with _open_response_form(form_path, responses_folder) as f:
+            template.render_to(f, values)
         return {'success': True, 'path': str(form_path)}
     except Exception as e:
         return {'success': False, 'error': f'Failed to save form: {e}'}
@@ -4120,11 +3840,204 @@ def update_hta_folder_paths(folder_path, old_path, new_path):
     }
 
 
+# Response files are imported on a small thread pool so file reads, renames
+# and Outlook sends overlap. Each importer holds _DB_WRITE_LOCK for its
+# database read-check-write, so two responses for one item never interleave.
+RESPONSE_IMPORT_WORKERS = 4
+_PROCESS_POOL = ThreadPoolExecutor(max_workers=RESPONSE_IMPORT_WORKERS, thread_name_prefix='response-import')
+_DB_WRITE_LOCK = threading.Lock()
+
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+def _read_response_json(json_path):
+    """Parse a response file in one call, with or without a UTF-8 BOM.
+    
+    Uses orjson when installed; its JSONDecodeError subclasses
+    json.JSONDecodeError, so callers handle both parsers the same way.
+    """
+    data = json_path.read_bytes()
+    if HAS_ORJSON:
+        # orjson only accepts bare UTF-8, so drop the BOM that HTA forms may write
+        return orjson.loads(data[3:] if data.startswith(_UTF8_BOM) else data)
+    # json.loads() detects the encoding of bytes itself and skips the BOM
+    return json.loads(data)
+
+# Processed-file names carry the PID and a per-process counter, so two
+# responses handled within the same microsecond still get distinct names
+_rename_counter = itertools.count()
+
+def _mark_response_processed(json_path, prefix, now_compact):
+    """Move an imported response file aside so the watcher skips it from now on."""
+    processed_path = json_path.parent / f"{prefix}_{now_compact}_{os.getpid()}_{next(_rename_counter)}.json"
+    os.replace(json_path, processed_path)
+
+class _StaleResponse(Exception):
+    """Raised in an importer's database section for a response from an earlier iteration."""
+
+def _mark_response_stale(json_path):
+    """Move a response from an earlier iteration aside, replacing any older one of the same name."""
+    os.replace(json_path, json_path.parent / f"_old_iteration_{json_path.name}")
+
+# SQL for the response watcher, built once at import so each JSON import only
+# binds parameters (sqlite3 also keeps the compiled statements per connection)
+_SQL_INSERT_REVIEWER_HISTORY = '''
+    INSERT INTO reviewer_response_history 
+    (item_id, version, response_category, response_text, notes, selected_files, submitted_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_UPDATE_REVIEWER_RESPONSE = '''
+    UPDATE item SET
+        reviewer_response_category = ?,
+        reviewer_notes = ?,
+        reviewer_internal_notes = ?,
+        reviewer_selected_files = ?,
+        reviewer_response_at = ?,
+        reviewer_response_status = 'Responded',
+        reviewer_response_version = ?
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_ITEM_REVIEWER_RESPONSE = '''
+    UPDATE item_reviewers SET
+        response_at = ?,
+        response_category = ?,
+        internal_notes = ?,
+        response_version = ?,
+        needs_response = 0
+    WHERE id = ?
+'''
+
+_SQL_COUNT_REVIEWER_RESPONSES = '''
+    SELECT COUNT(*) as total, SUM(CASE WHEN response_at IS NOT NULL THEN 1 ELSE 0 END) as responded
+    FROM item_reviewers
+    WHERE item_id = ?
+'''
+
+_SQL_UPDATE_QCR_SEND_BACK = '''
+    UPDATE item SET
+        qcr_action = 'Send Back',
+        qcr_notes = ?,
+        qcr_internal_notes = ?,
+        qcr_response_at = ?,
+        qcr_response_status = 'Waiting for Revision',
+        reviewer_response_status = 'Revision Requested',
+        status = 'In Review'
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_QCR_APPROVE = '''
+    UPDATE item SET
+        qcr_action = ?,
+        qcr_notes = ?,
+        qcr_internal_notes = ?,
+        qcr_response_at = ?,
+        qcr_response_status = 'Responded',
+        qcr_response_mode = ?,
+        qcr_response_text = ?,
+        qcr_response_category = ?,
+        final_response_category = ?,
+        final_response_text = ?,
+        final_response_files = ?,
+        status = 'Ready for Response'
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_MR_RESPONSE = '''
+    UPDATE item_reviewers SET
+        response_at = ?,
+        response_category = ?,
+        internal_notes = ?,
+        response_version = ?,
+        needs_response = 0,
+        attached_files = ?
+    WHERE id = ?
+'''
+
+# Response progress plus the item's QCR status in one read; run inside the
+# write transaction so the status cannot change before the commit
+_SQL_MR_RESPONSE_PROGRESS = '''
+    SELECT
+        (SELECT COUNT(*) FROM item_reviewers WHERE item_id = i.id) as total,
+        (SELECT COUNT(*) FROM item_reviewers WHERE item_id = i.id AND response_at IS NOT NULL) as responded,
+        i.qcr_response_status
+    FROM item i
+    WHERE i.id = ?
+'''
+
+_SQL_UPDATE_MR_STATUS_INQC = '''
+    UPDATE item SET 
+        status = 'In QC',
+        reviewer_response_status = 'All Responded'
+    WHERE id = ?
+'''
+
+_SQL_UPDATE_MR_QCR_COMPLETE = '''
+    UPDATE item SET
+        qcr_action = 'Approve',
+        qcr_notes = ?,
+        qcr_internal_notes = ?,
+        qcr_response_at = ?,
+        qcr_response_status = 'Responded',
+        qcr_response_mode = 'Revise',
+        qcr_response_text = ?,
+        qcr_response_category = ?,
+        final_response_category = ?,
+        final_response_text = ?,
+        qcr_attached_files = ?,
+        status = 'Ready for Response'
+    WHERE id = ?
+'''
+
+# Also resets QCR notification tracking, so the QCR is emailed again once
+# the reviewers respond
+_SQL_UPDATE_MR_QCR_SEND_BACK = '''
+    UPDATE item SET
+        qcr_action = 'Send Back',
+        qcr_notes = ?,
+        qcr_internal_notes = ?,
+        qcr_response_at = ?,
+        qcr_response_status = 'Revision Requested',
+        qcr_notified_at = NULL,
+        status = 'In Review'
+    WHERE id = ?
+'''
+
+# Reviewers left out of a send back; the selected ones are reset separately
+_SQL_CLEAR_MR_UNSELECTED_NEEDS_RESPONSE = '''
+    UPDATE item_reviewers SET needs_response = 0
+    WHERE item_id = ? AND id NOT IN ({placeholders})
+'''
+
+_SQL_RESET_MR_REVIEWERS = '''
+    UPDATE item_reviewers SET
+        response_at = NULL,
+        response_category = NULL,
+        internal_notes = NULL,
+        response_version = response_version + 1,
+        needs_response = 1
+    WHERE item_id = ?
+'''
+
+_SQL_RESET_MR_SENDBACK_REVIEWER = '''
+    UPDATE item_reviewers SET
+        response_at = NULL,
+        response_category = NULL,
+        internal_notes = NULL,
+        response_version = response_version + 1,
+        needs_response = 1
+    WHERE item_id = ? AND id = ?
+'''
+
 def process_reviewer_response_json(json_path):
     """Process a _reviewer_response.json or _RESPONSE_*.json file and import it into the database."""
     try:
-        with open(json_path, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+        data = _read_response_json(json_path)
+        
+        # One timestamp per response, shared by the DB write and the processed filename
+        now = datetime.now()
+        submitted_at = data.get('_submitted_at', now.isoformat())
+        now_compact = now.strftime('%Y%m%d_%H%M%S%f')
         
         # Validate it's the right type (accept both reviewer_response and rfi_response)
         form_type = data.get('_form_type')
@@ -4138,170 +4051,153 @@ def process_reviewer_response_json(json_path):
         # Get reopen_count from form - None if not present (old forms may not have it)
         response_reopen_count = data.get('reopen_count')
         
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # Find item by token - check both item table and item_reviewers table
-        cursor.execute('SELECT id, reviewer_response_version, reopen_count FROM item WHERE email_token_reviewer = ?', (token,))
-        item = cursor.fetchone()
-        
-        # Track if this came from item_reviewers table (for updating that record too)
-        item_reviewer_id = None
-        
-        # If not found in item table, check item_reviewers table (multi-reviewer mode)
-        if not item:
-            cursor.execute('SELECT id, item_id FROM item_reviewers WHERE email_token = ?', (token,))
-            reviewer_row = cursor.fetchone()
-            if reviewer_row:
-                item_reviewer_id = reviewer_row['id']
-                # Get item details
-                cursor.execute('SELECT id, reviewer_response_version, reopen_count FROM item WHERE id = ?', (reviewer_row['item_id'],))
-                item = cursor.fetchone()
-        
-        if not item:
-            conn.close()
-            return {'success': False, 'error': 'Invalid token - item not found'}
-        
-        # Check if response is from an old iteration (skip stale responses)
-        item_reopen_count = item['reopen_count'] or 0
-        if response_reopen_count is not None and response_reopen_count < item_reopen_count:
-            conn.close()
-            # Rename to indicate it's from old iteration
-            try:
-                old_iter_path = json_path.parent / f"_old_iteration_{json_path.name}"
-                json_path.rename(old_iter_path)
-            except:
-                pass
-            return {'success': False, 'error': f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}'}
-        
-        item_id = item['id']
-        current_version = item['reviewer_response_version'] or 0
-        
-        # Save to history if there's an existing response
-        cursor.execute('SELECT reviewer_response_at FROM item WHERE id = ?', (item_id,))
-        existing = cursor.fetchone()
-        if existing and existing['reviewer_response_at']:
-            cursor.execute('''
-                INSERT INTO reviewer_response_history 
-                (item_id, version, response_category, response_text, notes, selected_files, submitted_at)
-                SELECT id, reviewer_response_version, reviewer_response_category, 
-                       reviewer_response_text, reviewer_notes, reviewer_selected_files, reviewer_response_at
-                FROM item WHERE id = ?
-            ''', (item_id,))
-            current_version += 1
-        
-        # Update item with new response
-        selected_files_json = json.dumps(data.get('selected_files', []))
-        
-        # Handle both field naming conventions (notes vs response_text)
-        response_notes = data.get('notes') or data.get('response_text', '')
-        
-        cursor.execute('''
-            UPDATE item SET
-                reviewer_response_category = ?,
-                reviewer_notes = ?,
-                reviewer_internal_notes = ?,
-                reviewer_selected_files = ?,
-                reviewer_response_at = ?,
-                reviewer_response_status = 'Responded',
-                reviewer_response_version = ?
-            WHERE id = ?
-        ''', (
-            data.get('response_category'),
-            response_notes,
-            data.get('internal_notes'),
-            selected_files_json,
-            data.get('_submitted_at', datetime.now().isoformat()),
-            current_version,
-            item_id
-        ))
-        
-
-        # If this response came from item_reviewers, also update that record
-        # Also handle the case where token was found in item.email_token_reviewer
-        # but item_reviewers entries exist (single-reviewer items using item_reviewers table)
-        all_responded = False
-        if not item_reviewer_id:
-            # Token was found in item table, not item_reviewers - check if there are
-            # item_reviewers entries that need to be updated too
-            cursor.execute('''
-                SELECT id FROM item_reviewers WHERE item_id = ? AND needs_response = 1
-            ''', (item_id,))
-            pending_reviewers = cursor.fetchall()
-            if len(pending_reviewers) == 1:
-                # Single pending reviewer - this is the one who just responded
-                item_reviewer_id = pending_reviewers[0]['id']
-                print(f"  [Watcher] Token was in item table, also found matching item_reviewers record {item_reviewer_id}")
-
-        if item_reviewer_id:
-            cursor.execute('''
-                UPDATE item_reviewers SET
-                    response_at = ?,
-                    response_category = ?,
-                    internal_notes = ?,
-                    response_version = ?,
-                    needs_response = 0
-                WHERE id = ?
-            ''', (
-                data.get('_submitted_at', datetime.now().isoformat()),
+        # Only one importer at a time reads and writes the database
+        with _DB_WRITE_LOCK:
+            conn = get_db()
+            cursor = conn.cursor()
+            
+            # Columns read up front: iteration check, versioning, and the current
+            # response to archive in history
+            item_columns = '''id, reopen_count, reviewer_response_version, reviewer_response_at,
+                reviewer_response_category, reviewer_response_text, reviewer_notes, reviewer_selected_files'''
+            
+            # Find item by token - check both item table and item_reviewers table
+            cursor.execute(f'SELECT {item_columns} FROM item WHERE email_token_reviewer = ?', (token,))
+            item = cursor.fetchone()
+            
+            # Track if this came from item_reviewers table (for updating that record too)
+            item_reviewer_id = None
+            
+            # If not found in item table, check item_reviewers table (multi-reviewer mode)
+            if not item:
+                cursor.execute('SELECT id, item_id FROM item_reviewers WHERE email_token = ?', (token,))
+                reviewer_row = cursor.fetchone()
+                if reviewer_row:
+                    item_reviewer_id = reviewer_row['id']
+                    # Get item details
+                    cursor.execute(f'SELECT {item_columns} FROM item WHERE id = ?', (reviewer_row['item_id'],))
+                    item = cursor.fetchone()
+            
+            if not item:
+                conn.close()
+                return {'success': False, 'error': 'Invalid token - item not found'}
+            
+            # Check if response is from an old iteration (skip stale responses)
+            item_reopen_count = item['reopen_count'] or 0
+            if response_reopen_count is not None and response_reopen_count < item_reopen_count:
+                conn.close()
+                raise _StaleResponse(f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}')
+            
+            item_id = item['id']
+            current_version = item['reviewer_response_version'] or 0
+            
+            # Save to history if there's an existing response
+            if item['reviewer_response_at']:
+                cursor.execute(_SQL_INSERT_REVIEWER_HISTORY, (
+                    item_id,
+                    item['reviewer_response_version'],
+                    item['reviewer_response_category'],
+                    item['reviewer_response_text'],
+                    item['reviewer_notes'],
+                    item['reviewer_selected_files'],
+                    item['reviewer_response_at']
+                ))
+                current_version += 1
+            
+            # Update item with new response
+            selected_files = data.get('selected_files')
+            selected_files_json = json.dumps(selected_files) if selected_files else _EMPTY_JSON_LIST
+            
+            # Handle both field naming conventions (notes vs response_text)
+            response_notes = data.get('notes') or data.get('response_text', '')
+            
+            cursor.execute(_SQL_UPDATE_REVIEWER_RESPONSE, (
                 data.get('response_category'),
+                response_notes,
                 data.get('internal_notes'),
+                selected_files_json,
+                submitted_at,
                 current_version,
-                item_reviewer_id
+                item_id
             ))
-            print(f"  [Watcher] Also updated item_reviewers record {item_reviewer_id}")
-
-            # Check if all reviewers have responded (even if only one)
-            cursor.execute('''
-                SELECT COUNT(*) as total, SUM(CASE WHEN response_at IS NOT NULL THEN 1 ELSE 0 END) as responded
-                FROM item_reviewers
-                WHERE item_id = ?
-            ''', (item_id,))
-            count_result = cursor.fetchone()
-            all_responded = (count_result['total'] > 0 and count_result['total'] == count_result['responded'])
+            
 
-            # If all responded, update item status and trigger QCR email
-            if all_responded:
+            # If this response came from item_reviewers, also update that record
+            # Also handle the case where token was found in item.email_token_reviewer
+            # but item_reviewers entries exist (single-reviewer items using item_reviewers table)
+            all_responded = False
+            send_qcr_email = False
+            if not item_reviewer_id:
+                # Token was found in item table, not item_reviewers - check if there are
+                # item_reviewers entries that need to be updated too
                 cursor.execute('''
-                    UPDATE item SET status = 'In QC', reviewer_response_status = 'All Responded' WHERE id = ?
+                    SELECT id FROM item_reviewers WHERE item_id = ? AND needs_response = 1
                 ''', (item_id,))
-                conn.commit()
-                try:
-                    is_revision = current_version > 1
-                    qcr_result = send_qcr_assignment_email(item_id, is_revision=is_revision, version=current_version)
-                    if qcr_result['success']:
-                        print(f"  [Watcher] QCR email sent for item {item_id}")
-                    else:
-                        print(f"  [Watcher] Failed to send QCR email: {qcr_result.get('error')}")
-                except Exception as e:
-                    print(f"  [Watcher] Error sending QCR email: {e}")
-        else:
-            # No item_reviewers entries at all - still need to trigger QCR for legacy items
-            # (items that only use item.email_token_reviewer without item_reviewers table)
-            cursor.execute('''
-                UPDATE item SET status = 'In QC', reviewer_response_status = 'Responded' WHERE id = ?
-            ''', (item_id,))
+                pending_reviewers = cursor.fetchall()
+                if len(pending_reviewers) == 1:
+                    # Single pending reviewer - this is the one who just responded
+                    item_reviewer_id = pending_reviewers[0]['id']
+                    print(f"  [Watcher] Token was in item table, also found matching item_reviewers record {item_reviewer_id}")
+
+            if item_reviewer_id:
+                cursor.execute(_SQL_UPDATE_ITEM_REVIEWER_RESPONSE, (
+                    submitted_at,
+                    data.get('response_category'),
+                    data.get('internal_notes'),
+                    current_version,
+                    item_reviewer_id
+                ))
+                print(f"  [Watcher] Also updated item_reviewers record {item_reviewer_id}")
+
+                # Check if all reviewers have responded (even if only one)
+                cursor.execute(_SQL_COUNT_REVIEWER_RESPONSES, (item_id,))
+                count_result = cursor.fetchone()
+                all_responded = (count_result['total'] > 0 and count_result['total'] == count_result['responded'])
+
+                # If all responded, update item status and trigger QCR email
+                if all_responded:
+                    cursor.execute('''
+                        UPDATE item SET status = 'In QC', reviewer_response_status = 'All Responded' WHERE id = ?
+                    ''', (item_id,))
+                    send_qcr_email = True
+            else:
+                # No item_reviewers entries at all - still need to trigger QCR for legacy items
+                # (items that only use item.email_token_reviewer without item_reviewers table)
+                cursor.execute('''
+                    UPDATE item SET status = 'In QC', reviewer_response_status = 'Responded' WHERE id = ?
+                ''', (item_id,))
+                send_qcr_email = True
+                all_responded = True
+
             conn.commit()
+            item_info = _fetch_item_with_users(cursor, item_id) if send_qcr_email else None
+            conn.close()
+        
+        if send_qcr_email:
             try:
                 is_revision = current_version > 1
-                qcr_result = send_qcr_assignment_email(item_id, is_revision=is_revision, version=current_version)
+                qcr_result = send_qcr_assignment_email(item_id, is_revision=is_revision, version=current_version,
+                                                       item_row=item_info)
                 if qcr_result['success']:
-                    print(f"  [Watcher] QCR email sent for item {item_id} (legacy single-reviewer)")
+                    legacy_note = '' if item_reviewer_id else ' (legacy single-reviewer)'
+                    print(f"  [Watcher] QCR email sent for item {item_id}{legacy_note}")
                 else:
                     print(f"  [Watcher] Failed to send QCR email: {qcr_result.get('error')}")
             except Exception as e:
                 print(f"  [Watcher] Error sending QCR email: {e}")
-            all_responded = True
-
-        conn.commit()
-        conn.close()
 
         # Rename processed file
-        processed_path = json_path.parent / f"_reviewer_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        json_path.rename(processed_path)
+        _mark_response_processed(json_path, '_reviewer_response_processed', now_compact)
 
         return {'success': True, 'item_id': item_id, 'version': current_version, 'all_responded': all_responded}
         
+    except _StaleResponse as e:
+        # Rename to indicate it's from old iteration, after the database lock is released
+        try:
+            _mark_response_stale(json_path)
+        except OSError:
+            pass
+        return {'success': False, 'error': str(e)}
     except json.JSONDecodeError:
         return {'success': False, 'error': 'Invalid JSON file'}
     except Exception as e:
@@ -4311,8 +4207,12 @@ def process_reviewer_response_json(json_path):
 def process_qcr_response_json(json_path):
     """Process a _qcr_response.json file and import it into the database."""
     try:
-        with open(json_path, 'r', encoding='utf-8-sig') as f:
-            data = json.load(f)
+        data = _read_response_json(json_path)
+        
+        # One timestamp per response, shared by the DB write and the processed filename
+        now = datetime.now()
+        submitted_at = data.get('_submitted_at', now.isoformat())
+        now_compact = now.strftime('%Y%m%d_%H%M%S%f')
         
         # Validate it's the right type
         if data.get('_form_type') != 'qcr_response':
@@ -4325,126 +4225,96 @@ def process_qcr_response_json(json_path):
         # Get reopen_count from form - None if not present (old forms may not have it)
         response_reopen_count = data.get('reopen_count')
         
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # Find item by token
-        cursor.execute('SELECT id, reopen_count FROM item WHERE email_token_qcr = ?', (token,))
-        item = cursor.fetchone()
-        
-        if not item:
-            conn.close()
-            return {'success': False, 'error': 'Invalid token - item not found'}
-        
-        # Check if response is from an old iteration (skip stale responses)
-        item_reopen_count = item['reopen_count'] or 0
-        if response_reopen_count is not None and response_reopen_count < item_reopen_count:
+        # Only one importer at a time reads and writes the database
+        with _DB_WRITE_LOCK:
+            conn = get_db()
+            cursor = conn.cursor()
+            
+            # Find item by token
+            cursor.execute('SELECT id, reopen_count FROM item WHERE email_token_qcr = ?', (token,))
+            item = cursor.fetchone()
+            
+            if not item:
+                conn.close()
+                return {'success': False, 'error': 'Invalid token - item not found'}
+            
+            # Check if response is from an old iteration (skip stale responses)
+            item_reopen_count = item['reopen_count'] or 0
+            if response_reopen_count is not None and response_reopen_count < item_reopen_count:
+                conn.close()
+                raise _StaleResponse(f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}')
+            
+            item_id = item['id']
+            qc_action = data.get('qc_action')
+            
+            if qc_action == 'Send Back':
+                # Send back to reviewer
+                cursor.execute(_SQL_UPDATE_QCR_SEND_BACK, (
+                    data.get('qcr_notes'),
+                    data.get('qcr_internal_notes'),
+                    submitted_at,
+                    item_id
+                ))
+            else:
+                # Approve or Modify
+                selected_files = data.get('selected_files')
+                selected_files_json = json.dumps(selected_files) if selected_files else _EMPTY_JSON_LIST
+                final_response_text = data.get('response_text', '')  # HTA sends 'response_text'
+                cursor.execute(_SQL_UPDATE_QCR_APPROVE, (
+                    qc_action,
+                    data.get('qcr_notes'),
+                    data.get('qcr_internal_notes'),
+                    submitted_at,
+                    data.get('response_mode'),
+                    final_response_text,
+                    data.get('response_category'),
+                    data.get('response_category'),
+                    final_response_text,
+                    selected_files_json,
+                    item_id
+                ))
+            
+            # Get item details for notifications while the connection is still open
+            item_info = _fetch_item_with_users(cursor, item_id)
+            
+            # Also get reviewer count while connection is open
+            cursor.execute('SELECT COUNT(*) as count FROM item_reviewers WHERE item_id = ?', (item_id,))
+            reviewer_count_result = cursor.fetchone()
+            has_multiple_reviewers = reviewer_count_result and reviewer_count_result['count'] > 1
+            
+            # Create system notifications based on QC action, committed with the QC result
+            if item_info:
+                if qc_action == 'Approve' or qc_action == 'Modify':
+                    create_notification(
+                        'response_ready',
+                        f'Response Ready: {item_info["title"] or item_info["identifier"]}',
+                        f'QC review complete for {item_info["type"]} {item_info["identifier"]}. Final category: {data.get("response_category")}',
+                        item_id=item_id,
+                        action_url=f'/api/items/{item_id}/complete',
+                        action_label='Mark Complete',
+                        conn=conn
+                    )
+                elif qc_action == 'Send Back':
+                    create_notification(
+                        'sent_back',
+                        f'Sent Back: {item_info["title"] or item_info["identifier"]}',
+                        f'{item_info["type"]} {item_info["identifier"]} has been sent back to the reviewer for revisions.',
+                        item_id=item_id,
+                        conn=conn
+                    )
+            
+            conn.commit()
             conn.close()
-            # Rename to indicate it's from old iteration
-            try:
-                old_iter_path = json_path.parent / f"_old_iteration_{json_path.name}"
-                json_path.rename(old_iter_path)
-            except:
-                pass
-            return {'success': False, 'error': f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}'}
-        
-        item_id = item['id']
-        qc_action = data.get('qc_action')
-        
-        if qc_action == 'Send Back':
-            # Send back to reviewer
-            cursor.execute('''
-                UPDATE item SET
-                    qcr_action = 'Send Back',
-                    qcr_notes = ?,
-                    qcr_internal_notes = ?,
-                    qcr_response_at = ?,
-                    qcr_response_status = 'Waiting for Revision',
-                    reviewer_response_status = 'Revision Requested',
-                    status = 'In Review'
-                WHERE id = ?
-            ''', (
-                data.get('qcr_notes'),
-                data.get('qcr_internal_notes'),
-                data.get('_submitted_at', datetime.now().isoformat()),
-                item_id
-            ))
-        else:
-            # Approve or Modify
-            selected_files_json = json.dumps(data.get('selected_files', []))
-            final_response_text = data.get('response_text', '')  # HTA sends 'response_text'
-            cursor.execute('''
-                UPDATE item SET
-                    qcr_action = ?,
-                    qcr_notes = ?,
-                    qcr_internal_notes = ?,
-                    qcr_response_at = ?,
-                    qcr_response_status = 'Responded',
-                    qcr_response_mode = ?,
-                    qcr_response_text = ?,
-                    qcr_response_category = ?,
-                    final_response_category = ?,
-                    final_response_text = ?,
-                    final_response_files = ?,
-                    status = 'Ready for Response'
-                WHERE id = ?
-            ''', (
-                qc_action,
-                data.get('qcr_notes'),
-                data.get('qcr_internal_notes'),
-                data.get('_submitted_at', datetime.now().isoformat()),
-                data.get('response_mode'),
-                final_response_text,
-                data.get('response_category'),
-                data.get('response_category'),
-                final_response_text,
-                selected_files_json,
-                item_id
-            ))
-        
-        conn.commit()
-        conn.close()
         
         # Rename processed file
-        processed_path = json_path.parent / f"_qcr_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        json_path.rename(processed_path)
-        
-        # Get item details for notifications
-        conn = get_db()
-        cursor = conn.cursor()
-        cursor.execute('''
-            SELECT i.*, 
-                   ir.display_name as reviewer_name, ir.email as reviewer_email,
-                   qcr.display_name as qcr_name, qcr.email as qcr_email
-            FROM item i
-            LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-            LEFT JOIN user qcr ON i.qcr_id = qcr.id
-            WHERE i.id = ?
-        ''', (item_id,))
-        item_info = cursor.fetchone()
-        
-        # Also get reviewer count while connection is open
-        cursor.execute('SELECT COUNT(*) as count FROM item_reviewers WHERE item_id = ?', (item_id,))
-        reviewer_count_result = cursor.fetchone()
-        has_multiple_reviewers = reviewer_count_result and reviewer_count_result['count'] > 1
-        conn.close()
+        _mark_response_processed(json_path, '_qcr_response_processed', now_compact)
         
         if item_info:
             qcr_notes = data.get('qcr_notes', '')
             final_category = data.get('response_category')
             final_text = data.get('response_text', '')  # HTA sends 'response_text'
             
-            # Create system notifications based on QC action
             if qc_action == 'Approve' or qc_action == 'Modify':
-                create_notification(
-                    'response_ready',
-                    f'Response Ready: {item_info["title"] or item_info["identifier"]}',
-                    f'QC review complete for {item_info["type"]} {item_info["identifier"]}. Final category: {final_category}',
-                    item_id=item_id,
-                    action_url=f'/api/items/{item_id}/complete',
-                    action_label='Mark Complete'
-                )
-                
                 # Send confirmation emails - use appropriate function based on actual reviewer count
                 try:
                     if has_multiple_reviewers:
@@ -4455,7 +4325,8 @@ def process_qcr_response_json(json_path):
                         email_result = send_qcr_completion_confirmation_email(
                             item_id, qc_action, qcr_notes, 
                             final_category=final_category, 
-                            final_text=final_text
+                            final_text=final_text,
+                            item_row=item_info
                         )
                     if email_result.get('success'):
                         print(f"  [Watcher] QC completion confirmation emails sent for item {item_id}")
@@ -4465,13 +4336,6 @@ def process_qcr_response_json(json_path):
                     print(f"  [Watcher] Error sending QC confirmation emails: {e}")
                 
             elif qc_action == 'Send Back':
-                create_notification(
-                    'sent_back',
-                    f'Sent Back: {item_info["title"] or item_info["identifier"]}',
-                    f'{item_info["type"]} {item_info["identifier"]} has been sent back to the reviewer for revisions.',
-                    item_id=item_id
-                )
-                
                 # Send revision request to reviewer
                 try:
                     reviewer_result = send_reviewer_assignment_email(item_id, is_revision=True, qcr_notes=qcr_notes)
@@ -4484,6 +4348,13 @@ def process_qcr_response_json(json_path):
         
         return {'success': True, 'item_id': item_id, 'action': qc_action}
         
+    except _StaleResponse as e:
+        # Rename to indicate it's from old iteration, after the database lock is released
+        try:
+            _mark_response_stale(json_path)
+        except OSError:
+            pass
+        return {'success': False, 'error': str(e)}
     except json.JSONDecodeError:
         return {'success': False, 'error': 'Invalid JSON file'}
     except Exception as e:
@@ -4493,8 +4364,12 @@ def process_qcr_response_json(json_path):
 def process_multi_reviewer_response_json(json_path):
     """Process a multi-reviewer response JSON file from local HTA form."""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_response_json(json_path)
+        
+        # One timestamp per response, shared by the DB write and the processed filename
+        now = datetime.now()
+        submitted_at = data.get('_submitted_at', now.isoformat())
+        now_compact = now.strftime('%Y%m%d_%H%M%S%f')
         
         # Verify this is a multi-reviewer response
         if data.get('_form_type') != 'multi_reviewer_response':
@@ -4508,86 +4383,79 @@ def process_multi_reviewer_response_json(json_path):
         # Get reopen_count from form - None if not present (old forms may not have it)
         response_reopen_count = data.get('reopen_count')
         
-        if not item_id or not token:
-            return {'success': False, 'error': 'Missing item_id or token'}
-        
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # Find the reviewer by token and get item's current reopen_count
-        cursor.execute('''
-            SELECT ir.*, i.qcr_id, i.qcr_email_sent_at, i.reopen_count as item_reopen_count
-            FROM item_reviewers ir
-            JOIN item i ON ir.item_id = i.id
-            WHERE ir.email_token = ?
-        ''', (token,))
-        reviewer = cursor.fetchone()
-        
-        if not reviewer:
-            conn.close()
-            return {'success': False, 'error': 'Invalid token - reviewer not found'}
-        
-        # Check if response is from an old iteration (skip stale responses)
-        item_reopen_count = reviewer['item_reopen_count'] or 0
-        if response_reopen_count is not None and response_reopen_count < item_reopen_count:
-            conn.close()
-            # Rename to indicate it's from old iteration
-            try:
-                old_iter_path = json_path.parent / f"_old_iteration_{json_path.name}"
-                json_path.rename(old_iter_path)
-            except:
-                pass
-            return {'success': False, 'error': f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}'}
-        
-        # Check if this is a resubmission
-        is_resubmission = reviewer['response_at'] is not None
-        qcr_email_already_sent = reviewer['qcr_email_sent_at'] is not None
-        
-        # Calculate new version
-        new_version = (reviewer['response_version'] or 0) + 1
-        
-        # Get attached files (if any)
-        attached_files = data.get('attached_files', [])
-        attached_files_json = json.dumps(attached_files) if attached_files else None
-        
-        # Update reviewer response (allow resubmissions)
-        cursor.execute('''
-            UPDATE item_reviewers SET
-                response_at = ?,
-                response_category = ?,
-                internal_notes = ?,
-                response_version = ?,
-                needs_response = 0,
-                attached_files = ?
-            WHERE id = ?
-        ''', (
-            data.get('_submitted_at', datetime.now().isoformat()),
-            response_category,
-            internal_notes,
-            new_version,
-            attached_files_json,
-            reviewer['id']
-        ))
-        
-        item_id = reviewer['item_id']
+        if not item_id or not token:
+            return {'success': False, 'error': 'Missing item_id or token'}
         
-        # Check if all reviewers have now responded
-        # Note: needs_response is used for selective send-back, but for initial completion
-        # we check all reviewers regardless of needs_response
-        cursor.execute('''
-            SELECT COUNT(*) as total, SUM(CASE WHEN response_at IS NOT NULL THEN 1 ELSE 0 END) as responded
-            FROM item_reviewers
-            WHERE item_id = ?
-        ''', (item_id,))
-        count_result = cursor.fetchone()
-        all_responded = (count_result['total'] > 0 and count_result['total'] == count_result['responded'])
+        # Only one importer at a time reads and writes the database
+        with _DB_WRITE_LOCK:
+            conn = get_db()
+            cursor = conn.cursor()
+            
+            # Find the reviewer by token and get item's current reopen_count
+            cursor.execute('''
+                SELECT ir.*, i.qcr_id, i.qcr_email_sent_at, i.reopen_count as item_reopen_count
+                FROM item_reviewers ir
+                JOIN item i ON ir.item_id = i.id
+                WHERE ir.email_token = ?
+            ''', (token,))
+            reviewer = cursor.fetchone()
+            
+            if not reviewer:
+                conn.close()
+                return {'success': False, 'error': 'Invalid token - reviewer not found'}
+            
+            # Check if response is from an old iteration (skip stale responses)
+            item_reopen_count = reviewer['item_reopen_count'] or 0
+            if response_reopen_count is not None and response_reopen_count < item_reopen_count:
+                conn.close()
+                raise _StaleResponse(f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}')
+            
+            # Check if this is a resubmission
+            is_resubmission = reviewer['response_at'] is not None
+            qcr_email_already_sent = reviewer['qcr_email_sent_at'] is not None
+            
+            # Calculate new version
+            new_version = (reviewer['response_version'] or 0) + 1
+            
+            # Get attached files (if any)
+            attached_files = data.get('attached_files', [])
+            attached_files_json = json.dumps(attached_files) if attached_files else None
+            
+            # Update reviewer response (allow resubmissions)
+            cursor.execute(_SQL_UPDATE_MR_RESPONSE, (
+                submitted_at,
+                response_category,
+                internal_notes,
+                new_version,
+                attached_files_json,
+                reviewer['id']
+            ))
+            
+            item_id = reviewer['item_id']
+            
+            # Check if all reviewers have now responded
+            # Note: needs_response is used for selective send-back, but for initial completion
+            # we check all reviewers regardless of needs_response
+            cursor.execute(_SQL_MR_RESPONSE_PROGRESS, (item_id,))
+            count_result = cursor.fetchone()
+            all_responded = (count_result['total'] > 0 and count_result['total'] == count_result['responded'])
+            
+            # A resubmission after the QCR was notified leaves the item status alone
+            resubmitted_after_qcr = is_resubmission and qcr_email_already_sent
+            if not resubmitted_after_qcr:
+                if all_responded:
+                    # Update item status to In QC
+                    cursor.execute(_SQL_UPDATE_MR_STATUS_INQC, (item_id,))
+                else:
+                    cursor.execute('''
+                        UPDATE item SET status = 'In Review' WHERE id = ? AND status = 'Assigned'
+                    ''', (item_id,))
+            conn.commit()
+            conn.close()
         
         # Handle resubmission after QCR email was already sent
-        if is_resubmission and qcr_email_already_sent:
+        if resubmitted_after_qcr:
             # This is an updated response after QCR was notified - send updated QCR email
-            conn.commit()
-            conn.close()
-            
             if reviewer['qcr_id']:
                 email_result = send_email_with_retry(
                     send_multi_reviewer_qcr_email, item_id, 'multi_reviewer_qcr'
@@ -4603,8 +4471,7 @@ def process_multi_reviewer_response_json(json_path):
             
             # Rename processed file
             try:
-                processed_path = json_path.parent / f"_multi_reviewer_response_resubmit_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}.json"
-                json_path.rename(processed_path)
+                _mark_response_processed(json_path, '_multi_reviewer_response_resubmit', now_compact)
             except Exception as e:
                 print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
             
@@ -4617,23 +4484,8 @@ def process_multi_reviewer_response_json(json_path):
             }
         
         if all_responded:
-            # Update item status to In QC
-            cursor.execute('''
-                UPDATE item SET 
-                    status = 'In QC',
-                    reviewer_response_status = 'All Responded'
-                WHERE id = ?
-            ''', (item_id,))
-            
-            conn.commit()
-            
-            # Re-check if QCR email was already successfully sent
-            # Only skip if qcr_response_status confirms the email went through
-            cursor.execute('SELECT qcr_email_sent_at, qcr_response_status FROM item WHERE id = ?', (item_id,))
-            current_item = cursor.fetchone()
-            qcr_email_confirmed_sent = (current_item['qcr_response_status'] or '') not in ('Not Sent', '')
-            
-            conn.close()
+            # Only skip the QCR email if qcr_response_status confirms it went through
+            qcr_email_confirmed_sent = (count_result['qcr_response_status'] or '') not in ('Not Sent', '')
             
             # Send QCR assignment email now that all reviewers have responded
             # Only skip if QCR email was already confirmed sent (qcr_response_status updated)
@@ -4651,19 +4503,11 @@ def process_multi_reviewer_response_json(json_path):
             elif qcr_email_confirmed_sent:
                 print(f"  [Watcher] QCR already notified for item {item_id}, skipping duplicate email")
             
-            # Rename processed file (with retry for timestamp collision)
+            # Rename processed file
             try:
-                processed_path = json_path.parent / f"_multi_reviewer_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}.json"
-                json_path.rename(processed_path)
+                _mark_response_processed(json_path, '_multi_reviewer_response_processed', now_compact)
             except Exception as e:
                 print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
-                # Try with a unique suffix
-                try:
-                    import random
-                    processed_path = json_path.parent / f"_multi_reviewer_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{random.randint(1000,9999)}.json"
-                    json_path.rename(processed_path)
-                except:
-                    pass  # File will be reprocessed but that's OK, reviewer already marked as responded
             
             return {
                 'success': True, 
@@ -4672,24 +4516,11 @@ def process_multi_reviewer_response_json(json_path):
                 'all_responded': True
             }
         else:
-            cursor.execute('''
-                UPDATE item SET status = 'In Review' WHERE id = ? AND status = 'Assigned'
-            ''', (item_id,))
-            conn.commit()
-            conn.close()
-            
-            # Rename processed file (with retry for timestamp collision)
+            # Rename processed file
             try:
-                processed_path = json_path.parent / f"_multi_reviewer_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S%f')}.json"
-                json_path.rename(processed_path)
+                _mark_response_processed(json_path, '_multi_reviewer_response_processed', now_compact)
             except Exception as e:
                 print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
-                try:
-                    import random
-                    processed_path = json_path.parent / f"_multi_reviewer_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{random.randint(1000,9999)}.json"
-                    json_path.rename(processed_path)
-                except:
-                    pass
             
             return {
                 'success': True, 
@@ -4700,6 +4531,13 @@ def process_multi_reviewer_response_json(json_path):
                 'total': count_result['total']
             }
         
+    except _StaleResponse as e:
+        # Rename to indicate it's from old iteration, after the database lock is released
+        try:
+            _mark_response_stale(json_path)
+        except OSError:
+            pass
+        return {'success': False, 'error': str(e)}
     except json.JSONDecodeError:
         return {'success': False, 'error': 'Invalid JSON file'}
     except Exception as e:
@@ -4709,8 +4547,12 @@ def process_multi_reviewer_response_json(json_path):
 def process_multi_reviewer_qcr_response_json(json_path):
     """Process a multi-reviewer QCR response JSON file from local HTA form."""
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_response_json(json_path)
+        
+        # One timestamp per response, shared by the DB write and the processed filename
+        now = datetime.now()
+        submitted_at = data.get('_submitted_at', now.isoformat())
+        now_compact = now.strftime('%Y%m%d_%H%M%S%f')
         
         # Verify this is a multi-reviewer QCR response
         if data.get('_form_type') != 'multi_reviewer_qcr_response':
@@ -4725,83 +4567,98 @@ def process_multi_reviewer_qcr_response_json(json_path):
         if not item_id or not token:
             return {'success': False, 'error': 'Missing item_id or token'}
         
-        conn = get_db()
-        cursor = conn.cursor()
-        
-        # Verify token matches
-        cursor.execute('SELECT * FROM item WHERE id = ? AND email_token_qcr = ?', (item_id, token))
-        item = cursor.fetchone()
-        
-        if not item:
-            conn.close()
-            return {'success': False, 'error': 'Invalid token - item not found'}
-        
-        # Check if response is from an old iteration (skip stale responses)
-        item_reopen_count = item['reopen_count'] or 0
-        if response_reopen_count is not None and response_reopen_count < item_reopen_count:
-            conn.close()
-            # Rename to indicate it's from old iteration
-            try:
-                old_iter_path = json_path.parent / f"_old_iteration_{json_path.name}"
-                json_path.rename(old_iter_path)
-            except:
-                pass
-            return {'success': False, 'error': f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}'}
-        
-        if qcr_action == 'Complete':
-            # Complete the response
-            response_category = data.get('response_category')
-            response_text = data.get('response_text', '')
-            qcr_internal_notes = data.get('qcr_internal_notes', '')
+        # Only one importer at a time reads and writes the database
+        with _DB_WRITE_LOCK:
+            conn = get_db()
+            cursor = conn.cursor()
             
-            # Get attached files (if any)
-            attached_files = data.get('attached_files', [])
-            attached_files_json = json.dumps(attached_files) if attached_files else None
+            # Verify token matches
+            cursor.execute('SELECT * FROM item WHERE id = ? AND email_token_qcr = ?', (item_id, token))
+            item = cursor.fetchone()
+            
+            if not item:
+                conn.close()
+                return {'success': False, 'error': 'Invalid token - item not found'}
+            
+            # Check if response is from an old iteration (skip stale responses)
+            item_reopen_count = item['reopen_count'] or 0
+            if response_reopen_count is not None and response_reopen_count < item_reopen_count:
+                conn.close()
+                raise _StaleResponse(f'Response from old iteration (R{response_reopen_count + 1}), item is now on R{item_reopen_count + 1}')
+            
+            if qcr_action == 'Complete':
+                # Complete the response
+                response_category = data.get('response_category')
+                response_text = data.get('response_text', '')
+                qcr_internal_notes = data.get('qcr_internal_notes', '')
+                
+                # Get attached files (if any)
+                attached_files = data.get('attached_files', [])
+                attached_files_json = json.dumps(attached_files) if attached_files else None
+                
+                cursor.execute(_SQL_UPDATE_MR_QCR_COMPLETE, (
+                    response_text,
+                    qcr_internal_notes,
+                    submitted_at,
+                    response_text,
+                    response_category,
+                    response_category,
+                    response_text,
+                    attached_files_json,
+                    item_id
+                ))
+                
+                # Create notification, committed with the QC result
+                create_notification(
+                    'response_ready',
+                    f'Response Ready: {item["title"] or item["identifier"]}',
+                    f'QC review complete for {item["type"]} {item["identifier"]}. Ready to be sent.',
+                    item_id=item_id,
+                    conn=conn
+                )
+            elif qcr_action == 'Send Back':
+                # Send back to selected reviewers (or all if none specified)
+                sendback_notes = data.get('sendback_notes', '')
+                qcr_internal_notes = data.get('qcr_internal_notes', '')
+                sendback_reviewer_ids = data.get('sendback_reviewer_ids', [])  # List of selected reviewer IDs
+                
+                # Take the write lock up front so the item and reviewer resets
+                # land in one transaction with a single commit
+                conn.execute('BEGIN IMMEDIATE')
+                cursor.execute(_SQL_UPDATE_MR_QCR_SEND_BACK, (
+                    sendback_notes,
+                    qcr_internal_notes,
+                    submitted_at,
+                    item_id
+                ))
+                
+                # If specific reviewers selected, only reset and require those
+                if sendback_reviewer_ids and len(sendback_reviewer_ids) > 0:
+                    # First, set the other reviewers to NOT need response
+                    placeholders = ','.join('?' * len(sendback_reviewer_ids))
+                    cursor.execute(_SQL_CLEAR_MR_UNSELECTED_NEEDS_RESPONSE.format(placeholders=placeholders),
+                                   [item_id, *sendback_reviewer_ids])
+                    
+                    # Reset only selected reviewer responses and mark them as needing response
+                    cursor.executemany(_SQL_RESET_MR_SENDBACK_REVIEWER,
+                                       [(item_id, reviewer_id) for reviewer_id in sendback_reviewer_ids])
+                else:
+                    # Reset all reviewer responses (original behavior)
+                    cursor.execute(_SQL_RESET_MR_REVIEWERS, (item_id,))
+            else:
+                conn.close()
+                return {'success': False, 'error': f'Unknown QCR action: {qcr_action}'}
             
-            cursor.execute('''
-                UPDATE item SET
-                    qcr_action = 'Approve',
-                    qcr_notes = ?,
-                    qcr_internal_notes = ?,
-                    qcr_response_at = ?,
-                    qcr_response_status = 'Responded',
-                    qcr_response_mode = 'Revise',
-                    qcr_response_text = ?,
-                    qcr_response_category = ?,
-                    final_response_category = ?,
-                    final_response_text = ?,
-                    qcr_attached_files = ?,
-                    status = 'Ready for Response'
-                WHERE id = ?
-            ''', (
-                response_text,
-                qcr_internal_notes,
-                data.get('_submitted_at', datetime.now().isoformat()),
-                response_text,
-                response_category,
-                response_category,
-                response_text,
-                attached_files_json,
-                item_id
-            ))
             conn.commit()
             conn.close()
-            
-            # Rename processed file
-            try:
-                processed_path = json_path.parent / f"_multi_reviewer_qcr_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                json_path.rename(processed_path)
-            except Exception as e:
-                print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
-            
-            # Create notification
-            create_notification(
-                'response_ready',
-                f'Response Ready: {item["title"] or item["identifier"]}',
-                f'QC review complete for {item["type"]} {item["identifier"]}. Ready to be sent.',
-                item_id=item_id
-            )
-            
+        
+        # Rename processed file
+        try:
+            _mark_response_processed(json_path, '_multi_reviewer_qcr_response_processed', now_compact)
+        except Exception as e:
+            print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
+        
+        if qcr_action == 'Complete':
             # Send completion confirmation email to QCR and ALL reviewers
             try:
                 email_result = send_multi_reviewer_completion_email(item_id, response_category, response_text)
@@ -4813,74 +4670,7 @@ def process_multi_reviewer_qcr_response_json(json_path):
                 print(f"  [Watcher] Error sending completion email: {e}")
             
             return {'success': True, 'item_id': item_id, 'action': 'Complete'}
-            
-        elif qcr_action == 'Send Back':
-            # Send back to selected reviewers (or all if none specified)
-            sendback_notes = data.get('sendback_notes', '')
-            qcr_internal_notes = data.get('qcr_internal_notes', '')
-            sendback_reviewer_ids = data.get('sendback_reviewer_ids', [])  # List of selected reviewer IDs
-            
-            cursor.execute('''
-                UPDATE item SET
-                    qcr_action = 'Send Back',
-                    qcr_notes = ?,
-                    qcr_internal_notes = ?,
-                    qcr_response_at = ?,
-                    qcr_response_status = 'Revision Requested',
-                    status = 'In Review'
-                WHERE id = ?
-            ''', (
-                sendback_notes,
-                qcr_internal_notes,
-                data.get('_submitted_at', datetime.now().isoformat()),
-                item_id
-            ))
-            
-            # If specific reviewers selected, only reset and require those
-            if sendback_reviewer_ids and len(sendback_reviewer_ids) > 0:
-                # First, set all reviewers to NOT need response
-                cursor.execute('''
-                    UPDATE item_reviewers SET needs_response = 0 WHERE item_id = ?
-                ''', (item_id,))
-                
-                # Reset only selected reviewer responses and mark them as needing response
-                for reviewer_id in sendback_reviewer_ids:
-                    cursor.execute('''
-                        UPDATE item_reviewers SET
-                            response_at = NULL,
-                            response_category = NULL,
-                            internal_notes = NULL,
-                            response_version = response_version + 1,
-                            needs_response = 1
-                        WHERE item_id = ? AND id = ?
-                    ''', (item_id, reviewer_id))
-            else:
-                # Reset all reviewer responses (original behavior)
-                cursor.execute('''
-                    UPDATE item_reviewers SET
-                        response_at = NULL,
-                        response_category = NULL,
-                        internal_notes = NULL,
-                        response_version = response_version + 1,
-                        needs_response = 1
-                    WHERE item_id = ?
-                ''', (item_id,))
-            
-            # Reset QCR notification tracking since we're sending back
-            cursor.execute('''
-                UPDATE item SET qcr_notified_at = NULL WHERE id = ?
-            ''', (item_id,))
-            
-            conn.commit()
-            conn.close()
-            
-            # Rename processed file
-            try:
-                processed_path = json_path.parent / f"_multi_reviewer_qcr_response_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                json_path.rename(processed_path)
-            except Exception as e:
-                print(f"  [Watcher] Warning: Could not rename file {json_path.name}: {e}")
-            
+        else:
             # Send sendback emails to selected reviewers (or all if none specified)
             # Use retry logic since Outlook COM can fail intermittently
             reviewer_ids_to_send = sendback_reviewer_ids if sendback_reviewer_ids else None
@@ -4900,18 +4690,73 @@ def process_multi_reviewer_qcr_response_json(json_path):
                 print(f"  [Watcher] Failed to send sendback emails: {email_result.get('error')}")
             
             return {'success': True, 'item_id': item_id, 'action': 'Send Back', 'reviewers_sent_back': len(sendback_reviewer_ids) if sendback_reviewer_ids else 'all'}
-        else:
-            conn.close()
-            return {'success': False, 'error': f'Unknown QCR action: {qcr_action}'}
         
+    except _StaleResponse as e:
+        # Rename to indicate it's from old iteration, after the database lock is released
+        try:
+            _mark_response_stale(json_path)
+        except OSError:
+            pass
+        return {'success': False, 'error': str(e)}
     except json.JSONDecodeError:
         return {'success': False, 'error': 'Invalid JSON file'}
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
 
+# Response file names, one group per kind in the order files are imported.
+# Case-insensitive on Windows, as the per-pattern rglob calls were; processed
+# and resubmitted multi-reviewer responses do not match, and that check stays
+# case-sensitive on every platform as the old substring test was.
+_RESPONSE_FILE_RE = re.compile(
+    r'_(?:(reviewer_response)|(RESPONSE_.*)|(qcr_response)'
+    r'|(multi_reviewer_response(?!.*(?-i:_processed_|_resubmit_))_.*)|(multi_reviewer_qcr_response))\.json',
+    re.IGNORECASE if os.name == 'nt' else 0)
+
+# (kind, importer) for each group of _RESPONSE_FILE_RE
+_RESPONSE_FILE_KINDS = (
+    ('reviewer', process_reviewer_response_json),
+    ('reviewer', process_reviewer_response_json),
+    ('qcr', process_qcr_response_json),
+    ('multi_reviewer', process_multi_reviewer_response_json),
+    ('multi_reviewer_qcr', process_multi_reviewer_qcr_response_json),
+)
+
+def _find_response_files(base_path):
+    """Walk base_path once and return (kind, path, process) for each response file.
+    
+    Files are grouped in the order the old per-pattern scans returned them:
+    reviewer, timestamped reviewer, QCR, multi-reviewer, multi-reviewer QCR.
+    """
+    groups = [[] for _ in _RESPONSE_FILE_KINDS]
+    stack = [str(base_path)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    match = _RESPONSE_FILE_RE.fullmatch(entry.name)
+                    if match is None or not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                groups[match.lastindex - 1].append(Path(entry.path))
+    return [(kind, path, process)
+            for (kind, process), paths in zip(_RESPONSE_FILE_KINDS, groups)
+            for path in paths]
+
 def scan_folders_for_responses():
-    """Scan all item folders for JSON response files and process them."""
+    """Scan all item folders for JSON response files and process them.
+    
+    The files found are imported concurrently on the response import pool;
+    results are reported in the order the files were found.
+    """
     base_path = Path(CONFIG['base_folder_path'])
     results = {
         'reviewer_responses': [],
@@ -4923,61 +4768,35 @@ def scan_folders_for_responses():
     if not base_path.exists():
         return results
     
-    # Scan for _reviewer_response.json files (exact match)
-    for json_file in base_path.rglob('_reviewer_response.json'):
-        result = process_reviewer_response_json(json_file)
-        if result['success']:
-            results['reviewer_responses'].append({
-                'path': str(json_file),
-                'item_id': result.get('item_id'),
-                'version': result.get('version')
-            })
-        else:
+    # Collect every file before importing any, so files renamed by a finished
+    # import are not picked up again
+    found = _find_response_files(base_path)
+    
+    # Each file is imported in its own transaction: in WAL mode with
+    # synchronous=NORMAL a commit does not fsync, and a bad file only rolls
+    # back itself before its emails go out
+    futures = [(kind, json_file, _PROCESS_POOL.submit(process, json_file)) for kind, json_file, process in found]
+    
+    for kind, json_file, future in futures:
+        result = future.result()
+        if not result['success']:
             results['errors'].append({
                 'path': str(json_file),
                 'error': result.get('error')
             })
-    
-    # Scan for timestamped response files (_RESPONSE_*.json)
-    for json_file in base_path.rglob('_RESPONSE_*.json'):
-        # Skip .old files
-        if json_file.suffix == '.old' or '.json.old' in str(json_file):
-            continue
-        result = process_reviewer_response_json(json_file)
-        if result['success']:
+        elif kind == 'reviewer':
             results['reviewer_responses'].append({
                 'path': str(json_file),
                 'item_id': result.get('item_id'),
                 'version': result.get('version')
             })
-        else:
-            results['errors'].append({
-                'path': str(json_file),
-                'error': result.get('error')
-            })
-    
-    # Scan for _qcr_response.json files
-    for json_file in base_path.rglob('_qcr_response.json'):
-        result = process_qcr_response_json(json_file)
-        if result['success']:
+        elif kind == 'qcr':
             results['qcr_responses'].append({
                 'path': str(json_file),
                 'item_id': result.get('item_id'),
                 'action': result.get('action')
             })
-        else:
-            results['errors'].append({
-                'path': str(json_file),
-                'error': result.get('error')
-            })
-    
-    # Scan for _multi_reviewer_response_*.json files
-    for json_file in base_path.rglob('_multi_reviewer_response_*.json'):
-        # Skip already processed files (both _processed_ and _resubmit_ variants)
-        if '_processed_' in json_file.name or '_already_processed_' in json_file.name or '_resubmit_' in json_file.name:
-            continue
-        result = process_multi_reviewer_response_json(json_file)
-        if result['success']:
+        elif kind == 'multi_reviewer':
             results['multi_reviewer_responses'].append({
                 'path': str(json_file),
                 'item_id': result.get('item_id'),
@@ -4985,30 +4804,15 @@ def scan_folders_for_responses():
                 'all_responded': result.get('all_responded')
             })
         else:
-            results['errors'].append({
-                'path': str(json_file),
-                'error': result.get('error')
-            })
-    
-    # Scan for _multi_reviewer_qcr_response.json files
-    for json_file in base_path.rglob('_multi_reviewer_qcr_response.json'):
-        result = process_multi_reviewer_qcr_response_json(json_file)
-        if result['success']:
             results['qcr_responses'].append({
                 'path': str(json_file),
                 'item_id': result.get('item_id'),
                 'action': result.get('action'),
                 'multi_reviewer': True
             })
-        else:
-            results['errors'].append({
-                'path': str(json_file),
-                'error': result.get('error')
-            })
     
     return results
 
-
 def sync_unsynced_items_to_excel():
     """Find closed items that haven't been synced to Excel and sync them.
     
@@ -5091,6 +4895,34 @@ def sync_unsynced_items_to_excel():
     }
 
 
+# With a filesystem observer running, the folders are only walked when it
+# reports a response file, plus this often in case an event was missed
+WATCHER_FALLBACK_SCAN_SECONDS = 300
+# Seconds to let a form finish writing its file before scanning after an event
+WATCHER_EVENT_SETTLE_SECONDS = 2
+# Periodic watcher jobs run on elapsed time rather than pass count, because
+# file events wake the loop early and passes are no longer evenly spaced
+WATCHER_EXCEL_SYNC_SECONDS = 150
+WATCHER_RECONCILE_SECONDS = 300
+# Checkpoint the WAL at most this often, on a pass that imported nothing
+WATCHER_CHECKPOINT_SECONDS = 600
+
+if HAS_WATCHDOG:
+    class _ResponseFileEventHandler(FileSystemEventHandler):
+        """Wakes the folder watcher when a response file is written or moved in."""
+        
+        def __init__(self, wake):
+            super().__init__()
+            self.wake = wake
+        
+        def on_any_event(self, event):
+            if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'closed'):
+                return
+            # Files the importers have already moved aside never need a scan
+            name = os.path.basename(getattr(event, 'dest_path', '') or event.src_path)
+            if _RESPONSE_FILE_RE.fullmatch(name):
+                self.wake.set()
+
 class FolderResponseWatcher:
     """Background watcher for JSON response files in item folders."""
     
@@ -5100,7 +4932,11 @@ class FolderResponseWatcher:
         self.interval = interval_seconds
         self.last_scan = None
         self.scan_count = 0
-        self.logged_errors = {}  # Track logged errors to avoid spam
+        self.logged_errors = OrderedDict()  # Track logged errors to avoid spam, oldest first
+        self._wake = threading.Event()
+        self._observer = None
+        self._observed_path = None
+        self._job_last_run = {}  # job name -> time.monotonic() of its last run
     
     def start(self):
         """Start the watcher thread."""
@@ -5112,16 +4948,71 @@ class FolderResponseWatcher:
     def stop(self):
         """Stop the watcher thread."""
         self.running = False
+        self._wake.set()
         if self.thread:
             self.thread.join(timeout=5)
+        self._stop_observer()
         print("Folder response watcher stopped")
     
+    def _stop_observer(self):
+        """Stop the filesystem observer, if one is running."""
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+            except Exception:
+                pass
+            self._observer = None
+            self._observed_path = None
+    
+    def _ensure_observer(self):
+        """Watch the current base folder for response files, following config changes."""
+        base_folder = CONFIG['base_folder_path']
+        if not HAS_WATCHDOG or base_folder == self._observed_path:
+            return
+        self._stop_observer()
+        try:
+            observer = Observer()
+            observer.daemon = True
+            observer.schedule(_ResponseFileEventHandler(self._wake), base_folder, recursive=True)
+            observer.start()
+        except Exception as e:
+            # Missing or unreachable folder - keep polling and retry next pass
+            print(f"  [Watcher] File notifications unavailable for {base_folder}: {e}")
+            return
+        self._observer = observer
+        self._observed_path = base_folder
+    
+    def _job_due(self, job, period_seconds):
+        """Return True, restarting the job's clock, once period_seconds have passed since it last ran."""
+        now = time.monotonic()
+        if now - self._job_last_run.get(job, float('-inf')) < period_seconds:
+            return False
+        self._job_last_run[job] = now
+        return True
+    
     def _watch_loop(self):
         """Main watch loop."""
+        # Periodic jobs first run one period after startup; the full scan runs right away
+        started = time.monotonic()
+        for job in ('excel_sync', 'reconcile', 'checkpoint'):
+            self._job_last_run[job] = started
         while self.running:
             try:
-                results = scan_folders_for_responses()
-                self.last_scan = datetime.now()
+                self._ensure_observer()
+                woken = self._wake.is_set()
+                if woken:
+                    # A burst of events (create, then write) becomes one scan
+                    time.sleep(WATCHER_EVENT_SETTLE_SECONDS)
+                    self._wake.clear()
+                
+                if self._observer is None or woken or self._job_due('scan', WATCHER_FALLBACK_SCAN_SECONDS):
+                    # Any scan walks every folder, so it also counts as the fallback scan
+                    self._job_last_run['scan'] = time.monotonic()
+                    results = scan_folders_for_responses()
+                    self.last_scan = datetime.now()
+                else:
+                    results = {'reviewer_responses': [], 'qcr_responses': [], 'multi_reviewer_responses': [], 'errors': []}
                 self.scan_count += 1
                 
                 # Log any processed responses
@@ -5144,15 +5035,29 @@ class FolderResponseWatcher:
                         # Limit logged errors to prevent memory growth
                         if len(self.logged_errors) > 100:
                             # Clear oldest half
-                            keys_to_remove = list(self.logged_errors.keys())[:50]
-                            for key in keys_to_remove:
-                                del self.logged_errors[key]
+                            for _ in range(50):
+                                self.logged_errors.popitem(last=False)
                 
                 # Process any pending emails that failed earlier
                 process_pending_emails()
                 
-                # Sync any unsynced closed items to Excel (every 5th scan, ~2.5 min)
-                if self.scan_count % 5 == 0:
+                # Fold the WAL back into the database while nothing is being imported,
+                # so writers rarely pay for a checkpoint themselves. Pooled connections
+                # never really close, so planner statistics are refreshed here too
+                # (optimize only re-analyzes tables whose contents changed a lot)
+                if (not results['reviewer_responses'] and not results['qcr_responses']
+                        and not results['multi_reviewer_responses']
+                        and self._job_due('checkpoint', WATCHER_CHECKPOINT_SECONDS)):
+                    try:
+                        conn = get_db()
+                        conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+                        conn.execute('PRAGMA optimize=0x10002')
+                        conn.close()
+                    except Exception as checkpoint_err:
+                        print(f"  [Watcher] WAL checkpoint error: {checkpoint_err}")
+                
+                # Sync any unsynced closed items to Excel (~2.5 min)
+                if self._job_due('excel_sync', WATCHER_EXCEL_SYNC_SECONDS):
                     try:
                         sync_result = sync_unsynced_items_to_excel()
                         if sync_result.get('synced_count', 0) > 0:
@@ -5166,9 +5071,9 @@ class FolderResponseWatcher:
                     except Exception as excel_err:
                         print(f"  [Watcher] Excel sync exception: {excel_err}")
                 
-                # Reconcile folders (every 10th scan, ~5 min) - detects renamed folders
+                # Reconcile folders (~5 min) - detects renamed folders
                 # and updates DB + regenerates active response forms automatically
-                if self.scan_count % 10 == 0:
+                if self._job_due('reconcile', WATCHER_RECONCILE_SECONDS):
                     try:
                         reconcile_result = reconcile_all_folders()
                         reconciled_count = len(reconcile_result.get('reconciled', []))
@@ -5185,11 +5090,8 @@ class FolderResponseWatcher:
             except Exception as e:
                 print(f"  [Watcher] Scan error: {e}")
             
-            # Sleep in small increments so we can stop quickly
-            for _ in range(self.interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Wait for the next pass; stop() and the observer cut this short
+            self._wake.wait(self.interval)
 
 
 # Global watcher instance
@@ -5199,22 +5101,49 @@ folder_watcher = FolderResponseWatcher(interval_seconds=30)
 # REMINDER EMAIL SYSTEM
 # =============================================================================
 
-# PST timezone offset (UTC-8, or UTC-7 during DST)
-# For simplicity, we'll use 8 AM PST = 16:00 UTC (or 15:00 UTC during DST)
+# Pacific time (UTC-8, or UTC-7 during DST), loaded once. Windows has no system
+# time zone database, so without the tzdata package this falls back to plain UTC-8
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC_TZ = ZoneInfo('America/Los_Angeles')
+except Exception:
+    PACIFIC_TZ = timezone(timedelta(hours=-8))
 REMINDER_HOUR_PST = 8  # 8 AM PST
 
 def get_pst_now():
-    """Get current time in PST (approximate, using UTC-8)."""
-    utc_now = datetime.utcnow()
-    pst_offset = timedelta(hours=-8)
-    return utc_now + pst_offset
+    """Get current time in Pacific time."""
+    return datetime.now(PACIFIC_TZ)
 
 def is_past_reminder_time_today():
     """Check if we're past the reminder time (8 AM PST) today."""
-    pst_now = get_pst_now()
-    return pst_now.hour >= REMINDER_HOUR_PST
+    return datetime.now(PACIFIC_TZ).hour >= REMINDER_HOUR_PST
+
+def load_sent_reminders(item_ids):
+    """Load the reminders already sent for these items, for has_reminder_been_sent.
+    
+    Each row is stored under the key of a due-date check, with and without its
+    reviewer record ID, so one query answers every check in a reminder run.
+    """
+    sent_reminders = set()
+    if not item_ids:
+        return sent_reminders
+    conn = get_db()
+    cursor = conn.cursor()
+    for chunk in chunked(item_ids):
+        placeholders = ','.join('?' * len(chunk))
+        cursor.execute(f'''
+            SELECT item_id, recipient_email, recipient_role, reminder_stage, due_date, item_reviewer_id
+            FROM reminder_log WHERE item_id IN ({placeholders})
+        ''', chunk)
+        for item_id, recipient_email, recipient_role, reminder_stage, due_date, item_reviewer_id in cursor.fetchall():
+            key = (item_id, recipient_email, recipient_role, reminder_stage, due_date)
+            sent_reminders.add(key)
+            sent_reminders.add(key + (item_reviewer_id,))
+    conn.close()
+    return sent_reminders
 
-def has_reminder_been_sent(item_id, recipient_email, recipient_role, reminder_stage, item_reviewer_id=None, due_date=None):
+def has_reminder_been_sent(item_id, recipient_email, recipient_role, reminder_stage, item_reviewer_id=None, due_date=None,
+                           sent_reminders=None):
     """Check if a specific reminder has already been sent.
     
     Args:
@@ -5226,7 +5155,15 @@ def has_reminder_been_sent(item_id, recipient_email, recipient_role, reminder_st
         due_date: The due date for this reminder. If provided, only considers 
                   reminders sent for this specific due date (allows new reminders
                   when due date changes).
+        sent_reminders: Set from load_sent_reminders(); when given with due_date,
+                  it is checked instead of querying the database.
     """
+    if sent_reminders is not None and due_date:
+        key = (item_id, recipient_email, recipient_role, reminder_stage, due_date)
+        if item_reviewer_id:
+            key += (item_reviewer_id,)
+        return key in sent_reminders
+    
     conn = get_db()
     cursor = conn.cursor()
     
@@ -5272,56 +5209,75 @@ def record_reminder_sent(item_id, reminder_type, recipient_email, recipient_role
     finally:
         conn.close()
 
-def check_response_exists_local(item_id, role, reviewer_name=None):
+# Characters replaced by '_' when a reviewer name goes into a response file name
+_SAFE_NAME_RE = re.compile(r'[^a-zA-Z0-9]')
+
+def _list_responses_folder(folder_link, folder_cache=None):
+    """Return the set of file names in an item's Responses folder (None if missing).
+
+    Names are lower-cased on Windows to match its case-insensitive lookups.
+    When folder_cache is given, each folder is listed at most once per run.
+    """
+    if folder_cache is not None and folder_link in folder_cache:
+        return folder_cache[folder_link]
+    try:
+        with os.scandir(os.path.join(folder_link, 'Responses')) as it:
+            names = {entry.name.lower() if os.name == 'nt' else entry.name for entry in it}
+    except OSError:
+        names = None
+    if folder_cache is not None:
+        folder_cache[folder_link] = names
+    return names
+
+def check_response_exists_local(item_id, role, reviewer_name=None, item=None, folder_cache=None):
     """Check if a response file exists for an item in local mode.
     
     Args:
         item_id: The item ID
         role: 'reviewer' or 'qcr'
         reviewer_name: For multi-reviewer mode, the reviewer's name
+        item: Optional row already carrying folder_link and multi_reviewer_mode
+        folder_cache: Optional dict shared across one reminder run
     
     Returns True if response exists, False otherwise.
     """
-    conn = get_db()
-    cursor = conn.cursor()
-    
-    cursor.execute('SELECT folder_link, multi_reviewer_mode FROM item WHERE id = ?', (item_id,))
-    item = cursor.fetchone()
-    conn.close()
+    if item is None:
+        conn = get_db()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT folder_link, multi_reviewer_mode FROM item WHERE id = ?', (item_id,))
+        item = cursor.fetchone()
+        conn.close()
     
     if not item or not item['folder_link']:
         return False
     
-    folder_path = Path(item['folder_link'])
-    responses_folder = folder_path / 'Responses'
-    
-    if not responses_folder.exists():
+    names = _list_responses_folder(item['folder_link'], folder_cache)
+    if not names:
         return False
     
     if item['multi_reviewer_mode']:
         if role == 'reviewer' and reviewer_name:
             # Check for multi-reviewer response file
-            safe_name = re.sub(r'[^a-zA-Z0-9]', '_', reviewer_name)
-            response_file = responses_folder / f'_multi_reviewer_response_{safe_name}.json'
-            # Also check for processed versions
-            processed_file = responses_folder / f'_processed__multi_reviewer_response_{safe_name}.json'
-            return response_file.exists() or processed_file.exists()
+            safe_name = _SAFE_NAME_RE.sub('_', reviewer_name)
+            filename = f'_multi_reviewer_response_{safe_name}.json'
         elif role == 'qcr':
-            response_file = responses_folder / '_multi_reviewer_qcr_response.json'
-            processed_file = responses_folder / '_processed__multi_reviewer_qcr_response.json'
-            return response_file.exists() or processed_file.exists()
+            filename = '_multi_reviewer_qcr_response.json'
+        else:
+            return False
     else:
         # Single reviewer mode
         if role == 'reviewer':
-            response_file = responses_folder / '_reviewer_response.json'
-            processed_file = responses_folder / '_processed__reviewer_response.json'
-            return response_file.exists() or processed_file.exists()
+            filename = '_reviewer_response.json'
         elif role == 'qcr':
-            response_file = responses_folder / '_qcr_response.json'
-            processed_file = responses_folder / '_processed__qcr_response.json'
-            return response_file.exists() or processed_file.exists()
+            filename = '_qcr_response.json'
+        else:
+            return False
     
-    return False
+    if os.name == 'nt':
+        filename = filename.lower()
+    # Also check for processed versions
+    return filename in names or f'_processed_{filename}' in names
 
 def next_business_day(d):
     """Return the next business day after date d (skips weekends)."""
@@ -5339,6 +5295,25 @@ def is_overdue_reminder_day(due_date, today):
     """
     return today == next_business_day(due_date)
 
+# Item columns the reminder senders and response-file check read, so the
+# candidate queries don't copy every item column into each row
+_REMINDER_ITEM_COLUMNS = '''i.id, i.identifier, i.title, i.type, i.bucket, i.priority, i.rfi_question,
+               i.folder_link, i.multi_reviewer_mode, i.due_date, i.initial_reviewer_due_date,
+               i.qcr_due_date, i.email_token_reviewer, i.email_token_qcr'''
+
+def _reminder_stage(due_date, today, late_assignment=False):
+    """Return 'due_today', 'overdue' or None for a due date on or before today.
+    
+    late_assignment: the assignment went out yesterday for an already-overdue
+    item, which earns one overdue reminder today.
+    """
+    if due_date == today:
+        return 'due_today'
+    # Send overdue reminder on the first business day after due date (skips weekends)
+    if is_overdue_reminder_day(due_date, today) or late_assignment:
+        return 'overdue'
+    return None
+
 def get_items_needing_reminders():
     """Get all items that need reminder emails today.
     
@@ -5348,9 +5323,14 @@ def get_items_needing_reminders():
     """
     today = datetime.now().date()
     yesterday = today - timedelta(days=1)
+    today_str = today.strftime('%Y-%m-%d')
     
     conn = get_db()
+    # Candidate rows are streamed from this cursor and only turned into dicts once
+    # they qualify; lookups inside the loops run on conn.execute() cursors of their own
     cursor = conn.cursor()
+    # Responses folder listings, shared by every check in this run
+    folder_cache = {}
     
     result = {
         'single_reviewer': [],  # (item, role, due_date, reminder_stage)
@@ -5361,52 +5341,72 @@ def get_items_needing_reminders():
     # =====================================================================
     # SINGLE REVIEWER MODE
     # =====================================================================
-    # Get items where reviewer hasn't responded and reviewer due date is today or yesterday
-    # Only for items that are open (not closed) and in the reviewer's court
-    cursor.execute('''
-        SELECT i.*, 
+    # One query for both courts, tagged by court:
+    # - reviewer: reviewer hasn't responded and reviewer due date is today or earlier,
+    #   for items that are open (not closed) and in the reviewer's court
+    # - qcr: QCR hasn't responded and QCR due date is today or earlier
+    #   (item must be in 'In QC' status, meaning reviewer has submitted)
+    cursor.execute(f'''
+        SELECT 'reviewer' AS court, DATE(i.initial_reviewer_due_date) AS reminder_due_date,
+               NULL AS reminder_sent_date, {_REMINDER_ITEM_COLUMNS}, 
                ir.email as reviewer_email, ir.display_name as reviewer_name,
-               qcr.email as qcr_email, qcr.display_name as qcr_name
+               qcr.email as qcr_email
+        FROM item i
+        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
+        LEFT JOIN user qcr ON i.qcr_id = qcr.id
+        WHERE i.multi_reviewer_mode = 0 
+        AND i.closed_at IS NULL
+        AND i.status IN ('Assigned', 'In Review')
+        AND i.initial_reviewer_due_date IS NOT NULL
+        AND DATE(i.initial_reviewer_due_date) <= ?
+        AND i.reviewer_response_at IS NULL
+        AND i.reviewer_email_sent_at IS NOT NULL
+        UNION ALL
+        SELECT 'qcr' AS court, DATE(i.qcr_due_date) AS reminder_due_date,
+               DATE(i.qcr_email_sent_at) AS reminder_sent_date, {_REMINDER_ITEM_COLUMNS}, 
+               ir.email as reviewer_email, ir.display_name as reviewer_name,
+               qcr.email as qcr_email
         FROM item i
         LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
         LEFT JOIN user qcr ON i.qcr_id = qcr.id
         WHERE i.multi_reviewer_mode = 0 
         AND i.closed_at IS NULL
-        AND i.status IN ('Assigned', 'In Review')
-        AND i.initial_reviewer_due_date IS NOT NULL
-        AND DATE(i.initial_reviewer_due_date) <= ?
-        AND i.reviewer_response_at IS NULL
-        AND i.reviewer_email_sent_at IS NOT NULL
-    ''', (today.strftime('%Y-%m-%d'),))
-    
-    for item in cursor.fetchall():
-        item = dict(item)
-        due_date = parse_date_string(item['initial_reviewer_due_date'])
-        
-        if due_date == today:
-            reminder_stage = 'due_today'
-        elif due_date < today:
-            # Send overdue reminder on the first business day after due date (skips weekends)
-            if is_overdue_reminder_day(due_date, today):
-                reminder_stage = 'overdue'
-            else:
-                continue  # Not the first business day after due date
-        else:
-            continue  # Future due date
+        AND i.status = 'In QC'
+        AND i.qcr_due_date IS NOT NULL
+        AND DATE(i.qcr_due_date) <= ?
+        AND i.qcr_response_at IS NULL
+        AND i.qcr_email_sent_at IS NOT NULL
+        AND DATE(i.qcr_email_sent_at) < ?
+    ''', (today_str, today_str, today_str))
+    
+    for row in cursor:
+        due_date = parse_date_string(row['reminder_due_date'])
+        reminder_stage = _reminder_stage(due_date, today,
+                                         late_assignment=parse_date_string(row['reminder_sent_date']) == yesterday)
+        if not reminder_stage:
+            continue  # Not the first business day after due date
+        item = dict(row)
+        role = item.pop('court')
+        del item['reminder_due_date'], item['reminder_sent_date']
         
         # Check if response file exists in local mode
-        if is_local_mode() and check_response_exists_local(item['id'], 'reviewer'):
+        if is_local_mode() and check_response_exists_local(item['id'], role, item=item,
+                                                            folder_cache=folder_cache):
             continue  # Response already exists
         
+        if role == 'qcr':
+            if item['qcr_email']:
+                result['single_reviewer'].append((item, 'qcr', due_date, reminder_stage))
+            continue
+        
         # If no reviewer_email from user table, check item_reviewers as fallback
         reviewer_email = item['reviewer_email']
         if not reviewer_email:
-            cursor.execute('''
+            fallback = conn.execute('''
                 SELECT reviewer_email, reviewer_name FROM item_reviewers
                 WHERE item_id = ? AND needs_response = 1
                 LIMIT 1
-            ''', (item['id'],))
-            fallback = cursor.fetchone()
+            ''', (item['id'],)).fetchone()
             if fallback:
                 reviewer_email = fallback['reviewer_email']
                 item['reviewer_email'] = reviewer_email
@@ -5415,62 +5415,15 @@ def get_items_needing_reminders():
         if reviewer_email:
             result['single_reviewer'].append((item, 'reviewer', due_date, reminder_stage))
     
-    # Get items where QCR hasn't responded and QCR due date is today or yesterday
-    # (Item must be in 'In QC' status, meaning reviewer has submitted)
-    # Only for items that are open (not closed) and in QCR's court
-    cursor.execute('''
-        SELECT i.*, 
-               ir.email as reviewer_email, ir.display_name as reviewer_name,
-               qcr.email as qcr_email, qcr.display_name as qcr_name
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.multi_reviewer_mode = 0 
-        AND i.closed_at IS NULL
-        AND i.status = 'In QC'
-        AND i.qcr_due_date IS NOT NULL
-        AND DATE(i.qcr_due_date) <= ?
-        AND i.qcr_response_at IS NULL
-        AND i.qcr_email_sent_at IS NOT NULL
-        AND DATE(i.qcr_email_sent_at) < ?
-    ''', (today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')))
-    
-    for item in cursor.fetchall():
-        item = dict(item)
-        due_date = parse_date_string(item['qcr_due_date'])
-        qcr_email_sent_date = parse_date_string(item['qcr_email_sent_at']) if item['qcr_email_sent_at'] else None
-        
-        if due_date == today:
-            reminder_stage = 'due_today'
-        elif due_date < today:
-            # Send overdue reminder if:
-            # 1. First business day after due date (skips weekends), OR
-            # 2. Due date passed but assignment was sent yesterday (late assignment case)
-            if is_overdue_reminder_day(due_date, today):
-                reminder_stage = 'overdue'
-            elif qcr_email_sent_date == yesterday:
-                # Assignment was sent yesterday for an already-overdue item
-                # Send one overdue reminder today
-                reminder_stage = 'overdue'
-            else:
-                continue
-        else:
-            continue
-        
-        # Check if response file exists in local mode
-        if is_local_mode() and check_response_exists_local(item['id'], 'qcr'):
-            continue
-        
-        if item['qcr_email']:
-            result['single_reviewer'].append((item, 'qcr', due_date, reminder_stage))
-    
     # =====================================================================
-    # MULTI-REVIEWER MODE - Individual Reviewers
+    # MULTI-REVIEWER MODE - Individual Reviewers and QCR
     # =====================================================================
-    # Only for items that are open (not closed) and in reviewer's court
-    cursor.execute('''
-        SELECT i.*, 
-               qcr.email as qcr_email, qcr.display_name as qcr_name
+    # Only for items that are open (not closed) and in the reviewers' or QCR's court
+    reviewer_candidates = []  # (item, due_date, reminder_stage), paired with reviewers below
+    cursor.execute(f'''
+        SELECT 'reviewer' AS court, DATE(i.initial_reviewer_due_date) AS reminder_due_date,
+               NULL AS reminder_sent_date, {_REMINDER_ITEM_COLUMNS}, 
+               qcr.email as qcr_email
         FROM item i
         LEFT JOIN user qcr ON i.qcr_id = qcr.id
         WHERE i.multi_reviewer_mode = 1 
@@ -5478,48 +5431,10 @@ def get_items_needing_reminders():
         AND i.status IN ('Assigned', 'In Review')
         AND i.initial_reviewer_due_date IS NOT NULL
         AND DATE(i.initial_reviewer_due_date) <= ?
-    ''', (today.strftime('%Y-%m-%d'),))
-    
-    for item in cursor.fetchall():
-        item = dict(item)
-        due_date = parse_date_string(item['initial_reviewer_due_date'])
-        
-        if due_date == today:
-            reminder_stage = 'due_today'
-        elif due_date < today:
-            # Send overdue reminder on the first business day after due date (skips weekends)
-            if is_overdue_reminder_day(due_date, today):
-                reminder_stage = 'overdue'
-            else:
-                continue
-        else:
-            continue
-        
-        # Get individual reviewers who haven't responded
-        cursor.execute('''
-            SELECT * FROM item_reviewers 
-            WHERE item_id = ? 
-            AND response_at IS NULL 
-            AND email_sent_at IS NOT NULL
-            AND needs_response = 1
-        ''', (item['id'],))
-        
-        for reviewer in cursor.fetchall():
-            reviewer = dict(reviewer)
-            
-            # Check if response file exists in local mode
-            if is_local_mode() and check_response_exists_local(item['id'], 'reviewer', reviewer['reviewer_name']):
-                continue
-            
-            result['multi_reviewer'].append((item, reviewer, 'reviewer', due_date, reminder_stage))
-    
-    # =====================================================================
-    # MULTI-REVIEWER MODE - QCR
-    # =====================================================================
-    # Only for items that are open (not closed) and in QCR's court
-    cursor.execute('''
-        SELECT i.*, 
-               qcr.email as qcr_email, qcr.display_name as qcr_name
+        UNION ALL
+        SELECT 'qcr' AS court, DATE(i.qcr_due_date) AS reminder_due_date,
+               DATE(i.qcr_email_sent_at) AS reminder_sent_date, {_REMINDER_ITEM_COLUMNS}, 
+               qcr.email as qcr_email
         FROM item i
         LEFT JOIN user qcr ON i.qcr_id = qcr.id
         WHERE i.multi_reviewer_mode = 1 
@@ -5530,41 +5445,114 @@ def get_items_needing_reminders():
         AND i.qcr_response_at IS NULL
         AND i.qcr_email_sent_at IS NOT NULL
         AND DATE(i.qcr_email_sent_at) < ?
-    ''', (today.strftime('%Y-%m-%d'), today.strftime('%Y-%m-%d')))
-    
-    for item in cursor.fetchall():
-        item = dict(item)
-        due_date = parse_date_string(item['qcr_due_date'])
-        qcr_email_sent_date = parse_date_string(item['qcr_email_sent_at']) if item['qcr_email_sent_at'] else None
-        
-        if due_date == today:
-            reminder_stage = 'due_today'
-        elif due_date < today:
-            # Send overdue reminder if:
-            # 1. First business day after due date (skips weekends), OR
-            # 2. Due date passed but assignment was sent yesterday (late assignment case)
-            if is_overdue_reminder_day(due_date, today):
-                reminder_stage = 'overdue'
-            elif qcr_email_sent_date == yesterday:
-                # Assignment was sent yesterday for an already-overdue item
-                # Send one overdue reminder today
-                reminder_stage = 'overdue'
-            else:
-                continue
-        else:
+    ''', (today_str, today_str, today_str))
+    
+    for row in cursor:
+        due_date = parse_date_string(row['reminder_due_date'])
+        reminder_stage = _reminder_stage(due_date, today,
+                                         late_assignment=parse_date_string(row['reminder_sent_date']) == yesterday)
+        if not reminder_stage:
             continue
+        item = dict(row)
+        role = item.pop('court')
+        del item['reminder_due_date'], item['reminder_sent_date']
         
-        # Check if response file exists in local mode
-        if is_local_mode() and check_response_exists_local(item['id'], 'qcr'):
+        if role == 'qcr':
+            # Check if response file exists in local mode
+            if is_local_mode() and check_response_exists_local(item['id'], 'qcr', item=item,
+                                                                folder_cache=folder_cache):
+                continue
+            if item['qcr_email']:
+                result['multi_reviewer_qcr'].append((item, due_date, reminder_stage))
             continue
         
-        if item['qcr_email']:
-            result['multi_reviewer_qcr'].append((item, due_date, reminder_stage))
+        reviewer_candidates.append((item, due_date, reminder_stage))
+    
+    # Get individual reviewers who haven't responded, for all candidate items at once
+    pending_reviewers_map = {}
+    for chunk in chunked([item['id'] for item, _, _ in reviewer_candidates]):
+        placeholders = ','.join('?' * len(chunk))
+        for reviewer in conn.execute(f'''
+            SELECT * FROM item_reviewers 
+            WHERE item_id IN ({placeholders}) 
+            AND response_at IS NULL 
+            AND email_sent_at IS NOT NULL
+            AND needs_response = 1
+        ''', chunk):
+            item_id = reviewer['item_id']
+            if item_id not in pending_reviewers_map:
+                pending_reviewers_map[item_id] = []
+            pending_reviewers_map[item_id].append(dict(reviewer))
+    
+    for item, due_date, reminder_stage in reviewer_candidates:
+        for reviewer in pending_reviewers_map.get(item['id'], []):
+            # Check if response file exists in local mode
+            if is_local_mode() and check_response_exists_local(item['id'], 'reviewer', reviewer['reviewer_name'],
+                                                                item=item, folder_cache=folder_cache):
+                continue
+            
+            result['multi_reviewer'].append((item, reviewer, 'reviewer', due_date, reminder_stage))
     
     conn.close()
     return result
 
-def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
+@contextmanager
+def _outlook_session():
+    """Initialize COM for this thread and yield an Outlook Application for the block."""
+    pythoncom.CoInitialize()
+    try:
+        yield win32com.client.Dispatch("Outlook.Application")
+    finally:
+        pythoncom.CoUninitialize()
+
+class OutlookBatch:
+    """Outlook Application shared by every email of a reminder run.
+    
+    The caller initializes COM on its thread. The handle is dispatched on first
+    use and dropped when it can no longer create a mail, so a restarted Outlook
+    is picked up again instead of failing the rest of the batch.
+    """
+    
+    def __init__(self):
+        self.app = None
+    
+    def get(self):
+        if self.app is None:
+            self.app = win32com.client.Dispatch("Outlook.Application")
+        return self.app
+    
+    def reset(self):
+        self.app = None
+
+def _send_mail_item(mail, subject, html_body, to):
+    """Fill in and send one HTML mail item to a single recipient."""
+    mail.Subject = subject
+    mail.HTMLBody = html_body
+    mail.To = to
+    # NO CC for reminder emails
+    mail.Send()
+
+def _send_reminder_mail(subject, html_body, to, outlook=None):
+    """Send one reminder email, through the run's OutlookBatch when given.
+    
+    If the shared handle cannot create the mail, it may belong to an Outlook
+    that has since been restarted, so Outlook is re-dispatched and the mail
+    created once more. A failure from Send() itself is raised without a retry:
+    Outlook may still release that mail, and the reminder is already logged.
+    """
+    if outlook is None:
+        with _outlook_session() as session:
+            _send_mail_item(session.CreateItem(0), subject, html_body, to)
+        return
+    try:
+        mail = outlook.get().CreateItem(0)
+    except Exception as e:
+        print(f"  [Reminder] Outlook handle failed ({e}), reconnecting")
+        outlook.reset()
+        mail = outlook.get().CreateItem(0)
+    _send_mail_item(mail, subject, html_body, to)
+
+def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage, sent_reminders=None, outlook=None):
     """Send a reminder email for single-reviewer mode.
     
     This re-sends the original assignment email but with a modified subject line.
@@ -5578,7 +5566,8 @@ def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
     # Check if this reminder has already been sent
     recipient_email = item['reviewer_email'] if role == 'reviewer' else item['qcr_email']
     due_date_str = due_date.strftime('%Y-%m-%d') if hasattr(due_date, 'strftime') else str(due_date)
-    if has_reminder_been_sent(item_id, recipient_email, role, reminder_stage, due_date=due_date_str):
+    if has_reminder_been_sent(item_id, recipient_email, role, reminder_stage, due_date=due_date_str,
+                              sent_reminders=sent_reminders):
         return {'success': True, 'skipped': True, 'reason': 'Already sent'}
     
     # Determine subject prefix
@@ -5688,14 +5677,7 @@ def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
         # Record BEFORE sending to prevent duplicates if Outlook blocks then releases the email
         record_reminder_sent(item_id, 'single_reviewer', item['reviewer_email'], 'reviewer', due_date.strftime('%Y-%m-%d'), reminder_stage)
         try:
-            pythoncom.CoInitialize()
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            mail = outlook.CreateItem(0)
-            mail.Subject = subject
-            mail.HTMLBody = html_body
-            mail.To = item['reviewer_email']
-            # NO CC for reminder emails
-            mail.Send()
+            _send_reminder_mail(subject, html_body, item['reviewer_email'], outlook)
             
             print(f"  [Reminder] Sent {reminder_stage} reminder to reviewer for item {item_id}")
             return {'success': True}
@@ -5703,8 +5685,6 @@ def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
             # Note: reminder is already recorded to prevent duplicates even if send fails
             print(f"  [Reminder] Failed to send {reminder_stage} reminder to reviewer for item {item_id}: {e}")
             return {'success': False, 'error': str(e)}
-        finally:
-            pythoncom.CoUninitialize()
     
     else:  # role == 'qcr'
         # Send reminder to QCR
@@ -5782,14 +5762,7 @@ def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
         # Record BEFORE sending to prevent duplicates if Outlook blocks then releases the email
         record_reminder_sent(item_id, 'single_reviewer', item['qcr_email'], 'qcr', due_date.strftime('%Y-%m-%d'), reminder_stage)
         try:
-            pythoncom.CoInitialize()
-            outlook = win32com.client.Dispatch("Outlook.Application")
-            mail = outlook.CreateItem(0)
-            mail.Subject = subject
-            mail.HTMLBody = html_body
-            mail.To = item['qcr_email']
-            # NO CC for reminder emails
-            mail.Send()
+            _send_reminder_mail(subject, html_body, item['qcr_email'], outlook)
             
             print(f"  [Reminder] Sent {reminder_stage} reminder to QCR for item {item_id}")
             return {'success': True}
@@ -5797,10 +5770,8 @@ def send_single_reviewer_reminder_email(item, role, due_date, reminder_stage):
             # Note: reminder is already recorded to prevent duplicates even if send fails
             print(f"  [Reminder] Failed to send {reminder_stage} reminder to QCR for item {item_id}: {e}")
             return {'success': False, 'error': str(e)}
-        finally:
-            pythoncom.CoUninitialize()
 
-def send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_stage):
+def send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_stage, sent_reminders=None, outlook=None):
     """Send a reminder email for a specific reviewer in multi-reviewer mode."""
     if not HAS_WIN32COM:
         return {'success': False, 'error': 'Outlook not available'}
@@ -5809,7 +5780,8 @@ def send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_
     
     # Check if this reminder has already been sent
     due_date_str = due_date.strftime('%Y-%m-%d') if hasattr(due_date, 'strftime') else str(due_date)
-    if has_reminder_been_sent(item_id, reviewer['reviewer_email'], role, reminder_stage, reviewer['id'], due_date=due_date_str):
+    if has_reminder_been_sent(item_id, reviewer['reviewer_email'], role, reminder_stage, reviewer['id'], due_date=due_date_str,
+                              sent_reminders=sent_reminders):
         return {'success': True, 'skipped': True, 'reason': 'Already sent'}
     
     # Determine subject prefix
@@ -5916,14 +5888,7 @@ def send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_
     # Record BEFORE sending to prevent duplicates if Outlook blocks then releases the email
     record_reminder_sent(item_id, 'multi_reviewer', reviewer['reviewer_email'], 'reviewer', due_date.strftime('%Y-%m-%d'), reminder_stage, reviewer['id'])
     try:
-        pythoncom.CoInitialize()
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        mail = outlook.CreateItem(0)
-        mail.Subject = subject
-        mail.HTMLBody = html_body
-        mail.To = reviewer['reviewer_email']
-        # NO CC for reminder emails
-        mail.Send()
+        _send_reminder_mail(subject, html_body, reviewer['reviewer_email'], outlook)
         
         print(f"  [Reminder] Sent {reminder_stage} reminder to {reviewer['reviewer_name']} for item {item_id}")
         return {'success': True}
@@ -5931,10 +5896,8 @@ def send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_
         # Note: reminder is already recorded to prevent duplicates even if send fails
         print(f"  [Reminder] Failed to send {reminder_stage} reminder to {reviewer['reviewer_name']} for item {item_id}: {e}")
         return {'success': False, 'error': str(e)}
-    finally:
-        pythoncom.CoUninitialize()
 
-def send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage):
+def send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage, sent_reminders=None, outlook=None):
     """Send a reminder email to QCR in multi-reviewer mode."""
     if not HAS_WIN32COM:
         return {'success': False, 'error': 'Outlook not available'}
@@ -5943,7 +5906,8 @@ def send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage):
     
     # Check if this reminder has already been sent
     due_date_str = due_date.strftime('%Y-%m-%d') if hasattr(due_date, 'strftime') else str(due_date)
-    if has_reminder_been_sent(item_id, item['qcr_email'], 'qcr', reminder_stage, due_date=due_date_str):
+    if has_reminder_been_sent(item_id, item['qcr_email'], 'qcr', reminder_stage, due_date=due_date_str,
+                              sent_reminders=sent_reminders):
         return {'success': True, 'skipped': True, 'reason': 'Already sent'}
     
     # Determine subject prefix
@@ -6033,14 +5997,7 @@ def send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage):
     # Record BEFORE sending to prevent duplicates if Outlook blocks then releases the email
     record_reminder_sent(item_id, 'multi_reviewer', item['qcr_email'], 'qcr', due_date.strftime('%Y-%m-%d'), reminder_stage)
     try:
-        pythoncom.CoInitialize()
-        outlook = win32com.client.Dispatch("Outlook.Application")
-        mail = outlook.CreateItem(0)
-        mail.Subject = subject
-        mail.HTMLBody = html_body
-        mail.To = item['qcr_email']
-        # NO CC for reminder emails
-        mail.Send()
+        _send_reminder_mail(subject, html_body, item['qcr_email'], outlook)
         
         print(f"  [Reminder] Sent {reminder_stage} reminder to QCR for item {item_id}")
         return {'success': True}
@@ -6048,8 +6005,6 @@ def send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage):
         # Note: reminder is already recorded to prevent duplicates even if send fails
         print(f"  [Reminder] Failed to send {reminder_stage} reminder to QCR for item {item_id}: {e}")
         return {'success': False, 'error': str(e)}
-    finally:
-        pythoncom.CoUninitialize()
 
 def process_all_reminders():
     """Process all due/overdue reminders. Called by the reminder scheduler."""
@@ -6060,6 +6015,9 @@ def process_all_reminders():
     
     items_needing_reminders = get_items_needing_reminders()
     
+    # One query for every reminder already sent to these items, instead of one per candidate
+    sent_reminders = load_sent_reminders({entry[0]['id'] for entries in items_needing_reminders.values() for entry in entries})
+    
     results = {
         'single_reviewer_sent': 0,
         'single_reviewer_skipped': 0,
@@ -6070,47 +6028,59 @@ def process_all_reminders():
         'errors': []
     }
     
-    # Process single reviewer reminders
-    for item, role, due_date, reminder_stage in items_needing_reminders['single_reviewer']:
-        try:
-            result = send_single_reviewer_reminder_email(item, role, due_date, reminder_stage)
-            if result.get('success'):
-                if result.get('skipped'):
-                    results['single_reviewer_skipped'] += 1
+    # One COM session and Outlook instance for the whole batch instead of one per email
+    outlook = None
+    batch_session = HAS_WIN32COM and any(items_needing_reminders.values())
+    if batch_session:
+        pythoncom.CoInitialize()
+        outlook = OutlookBatch()
+    try:
+        # Process single reviewer reminders
+        for item, role, due_date, reminder_stage in items_needing_reminders['single_reviewer']:
+            try:
+                result = send_single_reviewer_reminder_email(item, role, due_date, reminder_stage, sent_reminders, outlook)
+                if result.get('success'):
+                    if result.get('skipped'):
+                        results['single_reviewer_skipped'] += 1
+                    else:
+                        results['single_reviewer_sent'] += 1
                 else:
-                    results['single_reviewer_sent'] += 1
-            else:
-                results['errors'].append(f"Item {item['id']} ({role}): {result.get('error')}")
-        except Exception as e:
-            results['errors'].append(f"Item {item['id']} ({role}): {str(e)}")
-    
-    # Process multi-reviewer individual reminders
-    for item, reviewer, role, due_date, reminder_stage in items_needing_reminders['multi_reviewer']:
-        try:
-            result = send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_stage)
-            if result.get('success'):
-                if result.get('skipped'):
-                    results['multi_reviewer_skipped'] += 1
+                    results['errors'].append(f"Item {item['id']} ({role}): {result.get('error')}")
+            except Exception as e:
+                results['errors'].append(f"Item {item['id']} ({role}): {str(e)}")
+        
+        # Process multi-reviewer individual reminders
+        for item, reviewer, role, due_date, reminder_stage in items_needing_reminders['multi_reviewer']:
+            try:
+                result = send_multi_reviewer_reminder_email(item, reviewer, role, due_date, reminder_stage, sent_reminders, outlook)
+                if result.get('success'):
+                    if result.get('skipped'):
+                        results['multi_reviewer_skipped'] += 1
+                    else:
+                        results['multi_reviewer_sent'] += 1
                 else:
-                    results['multi_reviewer_sent'] += 1
-            else:
-                results['errors'].append(f"Item {item['id']} ({reviewer['reviewer_name']}): {result.get('error')}")
-        except Exception as e:
-            results['errors'].append(f"Item {item['id']} ({reviewer['reviewer_name']}): {str(e)}")
-    
-    # Process multi-reviewer QCR reminders
-    for item, due_date, reminder_stage in items_needing_reminders['multi_reviewer_qcr']:
-        try:
-            result = send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage)
-            if result.get('success'):
-                if result.get('skipped'):
-                    results['multi_reviewer_qcr_skipped'] += 1
+                    results['errors'].append(f"Item {item['id']} ({reviewer['reviewer_name']}): {result.get('error')}")
+            except Exception as e:
+                results['errors'].append(f"Item {item['id']} ({reviewer['reviewer_name']}): {str(e)}")
+        
+        # Process multi-reviewer QCR reminders
+        for item, due_date, reminder_stage in items_needing_reminders['multi_reviewer_qcr']:
+            try:
+                result = send_multi_reviewer_qcr_reminder_email(item, due_date, reminder_stage, sent_reminders, outlook)
+                if result.get('success'):
+                    if result.get('skipped'):
+                        results['multi_reviewer_qcr_skipped'] += 1
+                    else:
+                        results['multi_reviewer_qcr_sent'] += 1
                 else:
-                    results['multi_reviewer_qcr_sent'] += 1
-            else:
-                results['errors'].append(f"Item {item['id']} (QCR): {result.get('error')}")
-        except Exception as e:
-            results['errors'].append(f"Item {item['id']} (QCR): {str(e)}")
+                    results['errors'].append(f"Item {item['id']} (QCR): {result.get('error')}")
+            except Exception as e:
+                results['errors'].append(f"Item {item['id']} (QCR): {str(e)}")
+    finally:
+        if batch_session:
+            # Release the Outlook reference before tearing COM down
+            outlook.reset()
+            pythoncom.CoUninitialize()
     
     total_sent = results['single_reviewer_sent'] + results['multi_reviewer_sent'] + results['multi_reviewer_qcr_sent']
     if total_sent > 0:
@@ -6128,10 +6098,12 @@ class ReminderScheduler:
         self.interval = check_interval_seconds
         self.last_check = None
         self.last_reminder_date = None  # Track when we last processed reminders for the day
+        self._stop_event = threading.Event()
     
     def start(self):
         """Start the reminder scheduler thread."""
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self.thread.start()
         print(f"Reminder scheduler started (checking every {self.interval}s)")
@@ -6139,6 +6111,7 @@ class ReminderScheduler:
     def stop(self):
         """Stop the reminder scheduler thread."""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
         print("Reminder scheduler stopped")
@@ -6165,11 +6138,8 @@ class ReminderScheduler:
             except Exception as e:
                 print(f"  [Reminder] Scheduler error: {e}")
             
-            # Sleep in small increments so we can stop quickly
-            for _ in range(self.interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Wait for the next check; stop() ends the wait immediately
+            self._stop_event.wait(self.interval)
 
 
 # Global reminder scheduler instance
@@ -6189,6 +6159,7 @@ class EmailPoller:
         self.poll_count = 0
         self.error_count = 0
         self.last_error = None
+        self._stop_event = threading.Event()
     
     def start(self):
         """Start the polling thread."""
@@ -6197,6 +6168,7 @@ class EmailPoller:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._poll_loop, daemon=True)
         self.thread.start()
         print("Email polling started")
@@ -6204,6 +6176,7 @@ class EmailPoller:
     def stop(self):
         """Stop the polling thread."""
         self.running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
         print("Email polling stopped")
@@ -6220,12 +6193,8 @@ class EmailPoller:
                 self.last_error = str(e)
                 print(f"Email polling error: {e}")
             
-            # Wait for next poll
-            interval = CONFIG['poll_interval_minutes'] * 60
-            for _ in range(interval):
-                if not self.running:
-                    break
-                time.sleep(1)
+            # Wait for next poll; stop() ends the wait immediately
+            self._stop_event.wait(CONFIG['poll_interval_minutes'] * 60)
     
     def _poll_emails(self):
         """Poll Outlook for new emails."""
@@ -6500,7 +6469,8 @@ class EmailPoller:
                                     'new_item',
                                     f'New Revision: {title or new_identifier}',
                                     f'Contractor submitted {item_type} {new_identifier} (revision of {identifier}). Reviewers copied from original item.',
-                                    item_id=new_item_id
+                                    item_id=new_item_id,
+                                    conn=conn
                                 )
                                 
                                 print(f"  [Revision] Created NEW item {new_identifier} from closed {identifier}")
@@ -6635,7 +6605,8 @@ class EmailPoller:
                                     notification_msg,
                                     item_id=item_id,
                                     action_url=f'/api/item/{item_id}/review-update',
-                                    action_label='Review Update'
+                                    action_label='Review Update',
+                                    conn=conn
                                 )
                             except Exception as notif_err:
                                 print(f"  Warning: Could not create notification: {notif_err}")
@@ -8197,8 +8168,12 @@ def send_revision_item_emails(item_id, parent_response, admin_note=''):
         pythoncom.CoUninitialize()
 
 
-def send_qcr_assignment_email(item_id, is_revision=False, version=None):
-    """Send assignment email to the QCR with magic link or file-based form."""
+def send_qcr_assignment_email(item_id, is_revision=False, version=None, item_row=None):
+    """Send assignment email to the QCR with magic link or file-based form.
+    
+    item_row can pass in a current _fetch_item_with_users() row for the item
+    to skip looking it up again.
+    """
     if not HAS_WIN32COM:
         return {'success': False, 'error': 'Outlook not available'}
     
@@ -8206,16 +8181,7 @@ def send_qcr_assignment_email(item_id, is_revision=False, version=None):
     cursor = conn.cursor()
     
     # Get item with reviewer info
-    cursor.execute('''
-        SELECT i.*, 
-               ir.email as reviewer_email, ir.display_name as reviewer_name,
-               qcr.email as qcr_email, qcr.display_name as qcr_name
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.id = ?
-    ''', (item_id,))
-    item = cursor.fetchone()
+    item = item_row if item_row is not None else _fetch_item_with_users(cursor, item_id)
     
     if not item:
         conn.close()
@@ -9088,8 +9054,13 @@ def send_reviewer_notification_email(item_id, qc_action, qcr_notes, final_catego
         return {'success': False, 'error': str(e)}
 
 
-def send_qcr_completion_confirmation_email(item_id, qc_action, qcr_notes, final_category=None, final_text=None):
-    """Send confirmation email to both QCR and reviewer after QCR completes review."""
+def send_qcr_completion_confirmation_email(item_id, qc_action, qcr_notes, final_category=None, final_text=None,
+                                           item_row=None):
+    """Send confirmation email to both QCR and reviewer after QCR completes review.
+    
+    item_row can pass in a current _fetch_item_with_users() row for the item
+    to skip looking it up again.
+    """
     if not HAS_WIN32COM:
         return {'success': False, 'error': 'Outlook not available'}
     
@@ -9097,16 +9068,7 @@ def send_qcr_completion_confirmation_email(item_id, qc_action, qcr_notes, final_
     cursor = conn.cursor()
     
     # Get item with reviewer and QCR info
-    cursor.execute('''
-        SELECT i.*, 
-               ir.email as reviewer_email, ir.display_name as reviewer_name,
-               qcr.email as qcr_email, qcr.display_name as qcr_name
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.id = ?
-    ''', (item_id,))
-    item = cursor.fetchone()
+    item = item_row if item_row is not None else _fetch_item_with_users(cursor, item_id)
     
     if not item:
         conn.close()
@@ -9386,38 +9348,31 @@ def generate_multi_reviewer_form(item_id, reviewer_record):
     item_type = (item['type'] or '').upper()
     
     if is_multi_reviewer:
-        # Multi-reviewer: use multi-reviewer specific template (no file selection, Bluebeam focused)
-        template_path = TEMPLATES_DIR / "_MULTI_REVIEWER_RESPONSE_TEMPLATE.hta"
-        if not template_path.exists():
-            # Fallback to regular template
-            template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta"
-            if not template_path.exists():
-                template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html"
-                if not template_path.exists():
-                    return {'success': False, 'error': 'Multi-reviewer form template not found'}
+        # Multi-reviewer: use multi-reviewer specific template (no file selection, Bluebeam focused),
+        # falling back to the regular template
+        loaded = _load_template((
+            TEMPLATES_DIR / "_MULTI_REVIEWER_RESPONSE_TEMPLATE.hta",
+            TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta",
+            TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html",
+        ))
+        if not loaded:
+            return {'success': False, 'error': 'Multi-reviewer form template not found'}
     else:
         # Single reviewer: check if RFI or Submittal
         if item_type == 'RFI':
             # RFI: use RFI-specific template (no response category, different labels)
-            template_path = TEMPLATES_DIR / "_RFI_RESPONSE_FORM_TEMPLATE.hta"
-            if not template_path.exists():
+            loaded = _load_template((TEMPLATES_DIR / "_RFI_RESPONSE_FORM_TEMPLATE.hta",))
+            if not loaded:
                 return {'success': False, 'error': 'RFI form template not found'}
         else:
             # Submittal: use regular single-reviewer template (with file selection and response category)
-            template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta"
-            if not template_path.exists():
-                template_path = TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html"
-                if not template_path.exists():
-                    return {'success': False, 'error': 'Reviewer form template not found'}
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Escape special characters for JavaScript embedding
-    def js_escape(s):
-        if not s:
-            return ''
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'").replace('\n', '\\n').replace('\r', '')
+            loaded = _load_template((
+                TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.hta",
+                TEMPLATES_DIR / "_RESPONSE_FORM_TEMPLATE_v3.html",
+            ))
+            if not loaded:
+                return {'success': False, 'error': 'Reviewer form template not found'}
+    template_path, template = loaded
     
     # Escape special characters for HTML content
     def html_escape(s):
@@ -9425,25 +9380,6 @@ def generate_multi_reviewer_form(item_id, reviewer_record):
             return ''
         return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
     
-    # Replace placeholders - use reviewer info from item_reviewers record
-    html = template.replace('{{ITEM_ID}}', str(item['id']))
-    html = html.replace('{{ITEM_TYPE}}', item['type'] or '')
-    html = html.replace('{{ITEM_IDENTIFIER}}', item['identifier'] or '')
-    html = html.replace('{{ITEM_TITLE}}', js_escape(item['title']) or 'N/A')
-    html = html.replace('{{ITEM_TITLE_HTML}}', html_escape(item['title'] or 'N/A'))
-    html = html.replace('{{DATE_RECEIVED}}', item['date_received'] or 'N/A')
-    html = html.replace('{{REVIEWER_DUE_DATE}}', reviewer_due)
-    html = html.replace('{{QCR_DUE_DATE}}', qcr_due)
-    html = html.replace('{{CONTRACTOR_DUE_DATE}}', item['due_date'] or 'N/A')
-    html = html.replace('{{REVIEWER_NAME}}', js_escape(reviewer_record['reviewer_name']) or 'N/A')
-    html = html.replace('{{REVIEWER_EMAIL}}', reviewer_record['reviewer_email'] or '')
-    html = html.replace('{{TOKEN}}', reviewer_record['email_token'] or '')
-    html = html.replace('{{FOLDER_PATH}}', js_escape(item['folder_link']) or '')
-    html = html.replace('{{FOLDER_PATH_RAW}}', html_escape(item['folder_link'] or ''))
-    html = html.replace('{{RFI_QUESTION}}', js_escape(item.get('rfi_question', '') or 'N/A'))
-    html = html.replace('{{IS_RFI}}', 'true' if item_type == 'RFI' else 'false')
-    html = html.replace('{{OTHER_REVIEWERS_SECTION}}', other_reviewers_html)
-    
     # Save to Responses subfolder with reviewer-specific name
     # Use versioned folder names for reopened items (Responses R2, Responses R3, etc.)
     folder_path = Path(item['folder_link'])
@@ -9453,13 +9389,32 @@ def generate_multi_reviewer_form(item_id, reviewer_record):
     else:
         responses_folder = folder_path / "Responses"
     
-    # Add responses folder path and reopen count to template
-    html = html.replace('{{RESPONSES_FOLDER}}', js_escape(str(responses_folder)))
-    html = html.replace('{{REOPEN_COUNT}}', str(reopen_count))
+    # Replace placeholders - use reviewer info from item_reviewers record
+    values = {
+        'ITEM_ID': str(item['id']),
+        'ITEM_TYPE': item['type'] or '',
+        'ITEM_IDENTIFIER': item['identifier'] or '',
+        'ITEM_TITLE': _js_escape(item['title']) or 'N/A',
+        'ITEM_TITLE_HTML': html_escape(item['title'] or 'N/A'),
+        'DATE_RECEIVED': item['date_received'] or 'N/A',
+        'REVIEWER_DUE_DATE': reviewer_due,
+        'QCR_DUE_DATE': qcr_due,
+        'CONTRACTOR_DUE_DATE': item['due_date'] or 'N/A',
+        'REVIEWER_NAME': _js_escape(reviewer_record['reviewer_name']) or 'N/A',
+        'REVIEWER_EMAIL': reviewer_record['reviewer_email'] or '',
+        'TOKEN': reviewer_record['email_token'] or '',
+        'FOLDER_PATH': _js_escape(item['folder_link']) or '',
+        'FOLDER_PATH_RAW': html_escape(item['folder_link'] or ''),
+        'RFI_QUESTION': _js_escape(item.get('rfi_question', '') or 'N/A'),
+        'IS_RFI': 'true' if item_type == 'RFI' else 'false',
+        'OTHER_REVIEWERS_SECTION': other_reviewers_html,
+        'RESPONSES_FOLDER': _js_escape(str(responses_folder)),
+        'REOPEN_COUNT': str(reopen_count),
+    }
     
     # Create Responses subfolder if it doesn't exist
     try:
-        responses_folder.mkdir(exist_ok=True)
+        _ensure_responses_dir(responses_folder)
     except Exception as e:
         return {'success': False, 'error': f'Failed to create Responses folder: {e}'}
     
@@ -9470,8 +9425,8 @@ def generate_multi_reviewer_form(item_id, reviewer_record):
     form_path = responses_folder / f"_RESPONSE_FORM_{safe_name}.hta"
     
     try:
-        with open(form_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        with _open_response_form(form_path, responses_folder) as f:
+            template.render_to(f, values)
         return {'success': True, 'path': str(form_path)}
     except Exception as e:
         return {'success': False, 'error': f'Failed to save form: {e}'}
@@ -10065,23 +10020,15 @@ def generate_multi_reviewer_qcr_form(item_id):
     # Load appropriate template based on reviewer count
     if is_multi_reviewer:
         # Multi-reviewer: use multi-reviewer QCR template
-        template_path = TEMPLATES_DIR / "_MULTI_REVIEWER_QCR_TEMPLATE.hta"
-        if not template_path.exists():
+        loaded = _load_template((TEMPLATES_DIR / "_MULTI_REVIEWER_QCR_TEMPLATE.hta",))
+        if not loaded:
             return {'success': False, 'error': 'Multi-reviewer QCR form template not found'}
     else:
         # Single reviewer: use regular QCR template
-        template_path = TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v3.hta"
-        if not template_path.exists():
+        loaded = _load_template((TEMPLATES_DIR / "_QCR_FORM_TEMPLATE_v3.hta",))
+        if not loaded:
             return {'success': False, 'error': 'QCR form template not found'}
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-    
-    # Escape special characters for JavaScript embedding
-    def js_escape(s):
-        if not s:
-            return ''
-        return s.replace('\\', '\\\\').replace('"', '\\"').replace("'", "\\'").replace('\n', '\\n').replace('\r', '')
+    template_path, template = loaded
     
     # Escape special characters for HTML content
     def html_escape(s):
@@ -10089,8 +10036,7 @@ def generate_multi_reviewer_qcr_form(item_id):
             return ''
         return s.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
     
-    # Start with the template
-    html = template
+    values = {}
     
     if is_multi_reviewer:
         # Build multi-reviewer specific HTML sections
@@ -10161,11 +10107,13 @@ def generate_multi_reviewer_qcr_form(item_id):
         # Convert reviewers list to JSON for JavaScript
         reviewers_json = json.dumps(reviewers_json_list)
         
-        # Replace multi-reviewer specific placeholders
-        html = html.replace('{{REVIEWER_COUNT}}', str(len(reviewers)))
-        html = html.replace('{{REVIEWER_RESPONSES_HTML}}', reviewer_html)
-        html = html.replace('{{REVIEWER_CHECKBOXES_HTML}}', reviewer_checkboxes_html)
-        html = html.replace('{{REVIEWERS_JSON}}', reviewers_json)
+        # Multi-reviewer specific placeholders
+        values.update({
+            'REVIEWER_COUNT': str(len(reviewers)),
+            'REVIEWER_RESPONSES_HTML': reviewer_html,
+            'REVIEWER_CHECKBOXES_HTML': reviewer_checkboxes_html,
+            'REVIEWERS_JSON': reviewers_json,
+        })
     else:
         # Single reviewer from item_reviewers table - populate single-reviewer template fields
         r = reviewers[0]  # Get the single reviewer
@@ -10175,35 +10123,39 @@ def generate_multi_reviewer_qcr_form(item_id):
         # For single reviewer using item_reviewers, we don't have selected_files 
         # (Bluebeam-based workflow), so indicate that
         reviewer_selected_files_text = 'Files selected in Bluebeam session'
-        reviewer_selected_files_js = '[]'  # Empty array for JS
-        
-        # Replace single-reviewer specific placeholders
-        html = template.replace('{{RESPONSE_VERSION}}', '1')
-        html = template.replace('{{REVIEWER_NAME}}', r['reviewer_name'] or 'N/A')
-        html = template.replace('{{REVIEWER_RESPONSE_CATEGORY}}', reviewer_category)
-        html = html.replace('{{REVIEWER_NOTES}}', js_escape(reviewer_notes))
-        html = html.replace('{{REVIEWER_SELECTED_FILES_TEXT}}', reviewer_selected_files_text)
-        html = html.replace('{{REVIEWER_SELECTED_FILES_JS}}', reviewer_selected_files_js)
-        html = html.replace('{{REVIEWER_INTERNAL_NOTES}}', js_escape(reviewer_notes))
-        html = html.replace('{{REVIEWER_INTERNAL_NOTES_DISPLAY}}', 'block' if reviewer_notes else 'none')
-    
-    # Replace common placeholders (used by both templates)
-    html = html.replace('{{ITEM_ID}}', str(item['id']))
-    html = html.replace('{{ITEM_TYPE}}', item['type'] or '')
-    html = html.replace('{{ITEM_IDENTIFIER}}', item['identifier'] or '')
-    html = html.replace('{{ITEM_TITLE}}', js_escape(item['title']) or 'N/A')
-    html = html.replace('{{ITEM_TITLE_HTML}}', html_escape(item['title'] or 'N/A'))
-    html = html.replace('{{DATE_RECEIVED}}', format_date_for_email(item['date_received']))
-    html = html.replace('{{PRIORITY}}', item['priority'] or 'Normal')
-    html = html.replace('{{QCR_NAME}}', item['qcr_name'] or 'N/A')
-    html = html.replace('{{QCR_EMAIL}}', item['qcr_email'] or '')
-    html = html.replace('{{QCR_DUE_DATE}}', format_date_for_email(item['qcr_due_date']))
-    html = html.replace('{{CONTRACTOR_DUE_DATE}}', format_date_for_email(item['due_date']))
-    html = html.replace('{{FOLDER_PATH}}', js_escape(item['folder_link']))
-    html = html.replace('{{FOLDER_PATH_RAW}}', html_escape(item['folder_link'] or ''))
-    html = html.replace('{{RFI_QUESTION}}', js_escape(item.get('rfi_question', '') or 'N/A'))
-    html = html.replace('{{IS_RFI}}', 'true' if (item['type'] or '').upper() == 'RFI' else 'false')
-    html = html.replace('{{TOKEN}}', item['email_token_qcr'] or '')
+        reviewer_selected_files_js = _EMPTY_JSON_LIST
+        
+        # Single-reviewer specific placeholders
+        values.update({
+            'RESPONSE_VERSION': '1',
+            'REVIEWER_NAME': r['reviewer_name'] or 'N/A',
+            'REVIEWER_RESPONSE_CATEGORY': reviewer_category,
+            'REVIEWER_NOTES': _text_escape(reviewer_notes),
+            'REVIEWER_SELECTED_FILES_TEXT': reviewer_selected_files_text,
+            'REVIEWER_SELECTED_FILES_JS': reviewer_selected_files_js,
+            'REVIEWER_INTERNAL_NOTES': _text_escape(reviewer_notes),
+            'REVIEWER_INTERNAL_NOTES_DISPLAY': 'block' if reviewer_notes else 'none',
+        })
+    
+    # Common placeholders (used by both templates)
+    values.update({
+        'ITEM_ID': str(item['id']),
+        'ITEM_TYPE': item['type'] or '',
+        'ITEM_IDENTIFIER': item['identifier'] or '',
+        'ITEM_TITLE': _js_escape(item['title']) or 'N/A',
+        'ITEM_TITLE_HTML': html_escape(item['title'] or 'N/A'),
+        'DATE_RECEIVED': format_date_for_email(item['date_received']),
+        'PRIORITY': item['priority'] or 'Normal',
+        'QCR_NAME': item['qcr_name'] or 'N/A',
+        'QCR_EMAIL': item['qcr_email'] or '',
+        'QCR_DUE_DATE': format_date_for_email(item['qcr_due_date']),
+        'CONTRACTOR_DUE_DATE': format_date_for_email(item['due_date']),
+        'FOLDER_PATH': _js_escape(item['folder_link']),
+        'FOLDER_PATH_RAW': html_escape(item['folder_link'] or ''),
+        'RFI_QUESTION': _text_escape(item.get('rfi_question', '') or 'N/A'),
+        'IS_RFI': 'true' if (item['type'] or '').upper() == 'RFI' else 'false',
+        'TOKEN': item['email_token_qcr'] or '',
+    })
     
     # Save to item folder
     folder_path = Path(item['folder_link'])
@@ -10220,13 +10172,13 @@ def generate_multi_reviewer_qcr_form(item_id):
         responses_folder = folder_path / "Responses"
     
     try:
-        responses_folder.mkdir(exist_ok=True)
+        _ensure_responses_dir(responses_folder)
     except Exception as e:
         return {'success': False, 'error': f'Failed to create Responses folder: {e}'}
     
     # Add responses folder path and reopen count to template
-    html = html.replace('{{RESPONSES_FOLDER}}', js_escape(str(responses_folder)))
-    html = html.replace('{{REOPEN_COUNT}}', str(reopen_count))
+    values['RESPONSES_FOLDER'] = _js_escape(str(responses_folder))
+    values['REOPEN_COUNT'] = str(reopen_count)
     
     # Generate filename - save to responses_folder, not main folder
     safe_name = "".join(c for c in (item['qcr_name'] or 'QCR') if c.isalnum() or c in (' ', '-', '_')).strip()
@@ -10234,8 +10186,8 @@ def generate_multi_reviewer_qcr_form(item_id):
     file_path = responses_folder / file_name
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        with _open_response_form(file_path, responses_folder) as f:
+            template.render_to(f, values)
         return {'success': True, 'path': str(file_path)}
     except Exception as e:
         return {'success': False, 'error': f'Failed to write form: {e}'}
@@ -11329,12 +11281,9 @@ def api_get_items():
             
             # Check initial reviewer due date
             if item.get('initial_reviewer_due_date'):
-                try:
-                    ir_due = datetime.strptime(item['initial_reviewer_due_date'], '%Y-%m-%d').date()
-                    if ir_due <= two_days_from_now:
-                        review_due_soon = True
-                except:
-                    pass
+                ir_due = _parse_ymd(item['initial_reviewer_due_date'])
+                if ir_due and ir_due <= two_days_from_now:
+                    review_due_soon = True
         elif status == 'In QC':
             # Ball is with QCR
             qcr_name = item.get('qcr_name', '')
@@ -11346,12 +11295,9 @@ def api_get_items():
             
             # Check QCR due date
             if item.get('qcr_due_date'):
-                try:
-                    qcr_due = datetime.strptime(item['qcr_due_date'], '%Y-%m-%d').date()
-                    if qcr_due <= two_days_from_now:
-                        review_due_soon = True
-                except:
-                    pass
+                qcr_due = _parse_ymd(item['qcr_due_date'])
+                if qcr_due and qcr_due <= two_days_from_now:
+                    review_due_soon = True
         elif status == 'Ready for Response':
             ball_in_court = 'Admin'
         elif status == 'Closed':
@@ -12847,7 +12793,7 @@ def respond_reviewer_form():
     """Show reviewer response form via magic link."""
     token = request.args.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -12864,7 +12810,7 @@ def respond_reviewer_form():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     item_dict = dict(item)
     
@@ -12915,12 +12861,26 @@ def respond_reviewer_form():
             'text': item['reviewer_notes'] or item['reviewer_response_text'],
             'files': item['reviewer_selected_files']
         }
+        previous_response['text_html'] = multiline_html(previous_response['text'] or 'No notes')
         if item['reviewer_selected_files']:
             try:
                 previous_files = json.loads(item['reviewer_selected_files'])
             except:
                 pass
     
+    # Closed and finalized items share one read-only notice instead of the form
+    lock_notice = None
+    if is_closed:
+        lock_notice = {
+            'title': '🔒 This Item Has Been Closed',
+            'body': 'No further changes can be submitted. Contact the project administrator if this is unexpected.'
+        }
+    elif not can_submit:
+        lock_notice = {
+            'title': '⚠️ Submission Not Allowed',
+            'body': 'This item has been finalized in QC. Contact the project administrator if additional changes are required.'
+        }
+    
     # Get version history
     version_history = ''
     cursor.execute('''
@@ -12946,7 +12906,7 @@ def respond_reviewer_form():
         except:
             pass
     
-    return render_template_string(REVIEWER_RESPONSE_TEMPLATE, 
+    return _REVIEWER_RESPONSE_TMPL.render(
         item=item_dict,
         files=files,
         token=token,
@@ -12954,10 +12914,11 @@ def respond_reviewer_form():
         is_closed=is_closed,
         can_submit=can_submit,
         is_resubmit=is_resubmit,
-        qcr_feedback=qcr_feedback,
+        qcr_feedback_html=multiline_html(qcr_feedback),
         previous_response=previous_response,
         previous_files=previous_files,
-        version_history=version_history
+        version_history=version_history,
+        lock_notice=lock_notice
     )
 
 @app.route('/respond/reviewer', methods=['POST'])
@@ -12965,7 +12926,7 @@ def respond_reviewer_submit():
     """Handle reviewer response submission with version tracking."""
     token = request.form.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -12979,15 +12940,14 @@ def respond_reviewer_submit():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     item_id = item['id']
     
     # Check if item is closed - block all submissions
     if item['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, 
-            error='This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
+        return render_error_page('This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
     
     # Check if submission is allowed
     qcr_action = item['qcr_action']
@@ -13014,8 +12974,7 @@ def respond_reviewer_submit():
     
     if not can_submit:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, 
-            error='This item has already been finalized in QC. Please contact the project admin if additional changes are required.'), 403
+        return render_error_page('This item has already been finalized in QC. Please contact the project admin if additional changes are required.'), 403
     
     # Get form data
     response_category = request.form.get('response_category')
@@ -13118,12 +13077,12 @@ def respond_reviewer_submit():
         send_qcr_assignment_email(item_id)
     
     if is_resubmit:
-        return render_template_string(SUCCESS_TEMPLATE, 
+        return render_success_page(
             message=f'Your revised response (v{new_version}) has been submitted!',
             details='The QC Reviewer has been notified of your updated response.'
         )
     else:
-        return render_template_string(SUCCESS_TEMPLATE, 
+        return render_success_page(
             message='Your review has been submitted successfully!',
             details='The QC Reviewer has been notified and will complete the final review.'
         )
@@ -13133,7 +13092,7 @@ def respond_qcr_form():
     """Show QCR response form via magic link."""
     token = request.args.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -13150,18 +13109,17 @@ def respond_qcr_form():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     # Check if item is closed
     if item['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, 
-            error='This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
+        return render_error_page('This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
     
     # Check if already responded
     if item['qcr_response_at']:
         conn.close()
-        return render_template_string(ALREADY_RESPONDED_TEMPLATE, 
+        return render_already_responded_page(
             item=dict(item),
             response_type='qcr'
         )
@@ -13198,13 +13156,22 @@ def respond_qcr_form():
     # Get version info
     current_version = item['reviewer_response_version'] if item['reviewer_response_version'] is not None else 0
     
-    return render_template_string(QCR_RESPONSE_TEMPLATE, 
+    # Preformat history timestamps once instead of per-row template filters
+    reviewer_response_when = item['reviewer_response_at'][:16].replace('T', ' ') if item['reviewer_response_at'] else 'N/A'
+    version_rows = [{
+        'version': v['version'],
+        'when': (v['submitted_at'] or '')[:16].replace('T', ' '),
+        'category': v['response_category'] or 'N/A'
+    } for v in version_history]
+    
+    return stream_page(_QCR_RESPONSE_TMPL,
         item=dict(item),
         files=files,
         reviewer_files=reviewer_files,
         token=token,
         version=current_version,
-        version_history=[dict(v) for v in version_history] if version_history else []
+        version_history=version_rows,
+        reviewer_response_when=reviewer_response_when
     )
 
 @app.route('/respond/qcr', methods=['POST'])
@@ -13212,7 +13179,7 @@ def respond_qcr_submit():
     """Handle QCR response submission."""
     token = request.form.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -13221,18 +13188,17 @@ def respond_qcr_submit():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     # Check if item is closed - block all submissions
     if item['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, 
-            error='This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
+        return render_error_page('This item has been closed. No further changes can be submitted. Contact the project administrator if this is unexpected.'), 403
     
     # Check if already responded
     if item['qcr_response_at']:
         conn.close()
-        return render_template_string(ALREADY_RESPONDED_TEMPLATE, 
+        return render_already_responded_page(
             item=dict(item),
             response_type='qcr'
         )
@@ -13367,17 +13333,17 @@ def respond_qcr_submit():
     
     # Return appropriate success message
     if qc_action == 'Approve':
-        return render_template_string(SUCCESS_TEMPLATE, 
+        return render_success_page(
             message='Response Approved!',
             details='The reviewer has been notified. The item is now ready for closeout.'
         )
     elif qc_action == 'Modify':
-        return render_template_string(SUCCESS_TEMPLATE, 
+        return render_success_page(
             message='Response Modified and Finalized!',
             details='The reviewer has been notified of your modifications. The item is now ready for closeout.'
         )
     else:  # Send Back
-        return render_template_string(SUCCESS_TEMPLATE, 
+        return render_success_page(
             message='Item Sent Back to Reviewer',
             details='The reviewer has been notified and will receive a link to revise their response.'
         )
@@ -13989,12 +13955,27 @@ def get_item_reviewer_responses(item_id):
 # MULTI-REVIEWER MAGIC-LINK ROUTES
 # =============================================================================
 
+@lru_cache(maxsize=1024)
+def render_multi_reviewer_locked_page(item_type, identifier, reviewer_name, version, is_closed):
+    """Render the read-only multi-reviewer page for a closed or QC-finalized item.
+
+    The page only shows the item and reviewer names, so it is cached on
+    exactly those values and never needs invalidating.
+    """
+    return _MULTI_REVIEWER_RESPONSE_TMPL.render(
+        item={'type': item_type, 'identifier': identifier},
+        reviewer_name=reviewer_name,
+        version=version,
+        is_closed=is_closed,
+        can_submit=False
+    )
+
 @app.route('/respond/multi-reviewer', methods=['GET'])
 def respond_multi_reviewer_form():
     """Show multi-reviewer response form via magic link."""
     token = request.args.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -14012,7 +13993,7 @@ def respond_multi_reviewer_form():
     
     if not result:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     item_dict = dict(result)
     reviewer_id = result['id']
@@ -14033,23 +14014,35 @@ def respond_multi_reviewer_form():
     if result['response_at']:
         previous_response = {
             'category': result['response_category'],
-            'notes': result['internal_notes']
+            'notes': result['internal_notes'],
+            'notes_html': multiline_html(result['internal_notes'])
         }
     
     # Version tracking
     version = (result['response_version'] or 0) + 1 if is_resubmit else (result['response_version'] or 0)
     
+    if not can_submit:
+        conn.close()
+        return render_multi_reviewer_locked_page(
+            result['type'], result['identifier'], reviewer_name, version, is_closed
+        )
+    
     # Get all reviewers for this item to show status
     cursor.execute('''
         SELECT reviewer_name, response_at FROM item_reviewers WHERE item_id = ?
     ''', (result['item_id'],))
-    all_reviewers = [dict(r) for r in cursor.fetchall()]
-    
+    all_reviewers = cursor.fetchall()
     pending_reviewers = [r for r in all_reviewers if not r['response_at']]
     
+    # Reviewer status list, built here rather than looped over in the template
+    reviewers_list_html = Markup('<ul style="margin-top: 8px; color: #92400e;">%s</ul>') % Markup('').join(
+        Markup('<li>%s - %s</li>') % (r['reviewer_name'], '✅ Submitted' if r['response_at'] else '⏳ Pending')
+        for r in all_reviewers
+    )
+    
     conn.close()
     
-    return render_template_string(MULTI_REVIEWER_RESPONSE_TEMPLATE,
+    return _MULTI_REVIEWER_RESPONSE_TMPL.render(
         item=item_dict,
         token=token,
         reviewer_name=reviewer_name,
@@ -14057,10 +14050,10 @@ def respond_multi_reviewer_form():
         is_closed=is_closed,
         can_submit=can_submit,
         is_resubmit=is_resubmit,
-        qcr_feedback=qcr_feedback,
+        qcr_feedback_html=multiline_html(qcr_feedback),
         previous_response=previous_response,
-        all_reviewers=all_reviewers,
-        pending_reviewers=pending_reviewers
+        pending_reviewers=pending_reviewers,
+        reviewers_list_html=reviewers_list_html
     )
 
 @app.route('/respond/multi-reviewer', methods=['POST'])
@@ -14068,7 +14061,7 @@ def respond_multi_reviewer_submit():
     """Handle multi-reviewer response submission."""
     token = request.form.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -14084,19 +14077,17 @@ def respond_multi_reviewer_submit():
     
     if not reviewer:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     # Check if item is closed
     if reviewer['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, 
-            error='This item has been closed. No further changes can be submitted.'), 403
+        return render_error_page('This item has been closed. No further changes can be submitted.'), 403
     
     # Check if QCR has finalized
     if reviewer['qcr_action'] in ['Approve', 'Modify', 'Complete']:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE,
-            error='This item has been finalized. No further changes can be submitted.'), 403
+        return render_error_page('This item has been finalized. No further changes can be submitted.'), 403
     
     # Get form data
     response_category = request.form.get('response_category')
@@ -14160,7 +14151,7 @@ def respond_multi_reviewer_submit():
         if reviewer['qcr_id'] and not qcr_already_notified:
             send_multi_reviewer_qcr_email(item_id)
         
-        return render_template_string(SUCCESS_TEMPLATE,
+        return render_success_page(
             message='Your review has been submitted!',
             details='All reviewers have submitted. The QC Reviewer has been notified.'
         )
@@ -14171,7 +14162,7 @@ def respond_multi_reviewer_submit():
         conn.commit()
         conn.close()
         
-        return render_template_string(SUCCESS_TEMPLATE,
+        return render_success_page(
             message='Your review has been submitted!',
             details='Waiting for other reviewers to submit before notifying the QC Reviewer.'
         )
@@ -14181,7 +14172,7 @@ def respond_multi_qcr_form():
     """Show QCR form for multi-reviewer items."""
     token = request.args.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -14196,31 +14187,35 @@ def respond_multi_qcr_form():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     # Check if item is closed
     if item['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE,
-            error='This item has been closed.'), 403
+        return render_error_page('This item has been closed.'), 403
     
     # Check if already responded
     if item['qcr_response_at'] and item['qcr_action'] in ['Approve', 'Modify', 'Complete']:
         conn.close()
-        return render_template_string(ALREADY_RESPONDED_TEMPLATE,
+        return render_already_responded_page(
             item=dict(item),
             response_type='qcr'
         )
     
-    # Get all reviewer responses
-    reviewer_responses = get_item_reviewer_responses(item['id'])
+    # Get all reviewer responses, reduced to the fields the page displays
+    reviewer_responses = [{
+        'reviewer_name': r['reviewer_name'],
+        'internal_notes': r['internal_notes'],
+        'category_chip': r['response_category'] or 'Pending'
+    } for r in get_item_reviewer_responses(item['id'])]
     
     conn.close()
     
-    return render_template_string(MULTI_REVIEWER_QCR_TEMPLATE,
+    return stream_page(_MULTI_REVIEWER_QCR_TMPL,
         item=dict(item),
         token=token,
-        reviewer_responses=reviewer_responses
+        reviewer_responses=reviewer_responses,
+        reviewer_count=len(reviewer_responses)
     )
 
 @app.route('/respond/multi-qcr', methods=['POST'])
@@ -14228,7 +14223,7 @@ def respond_multi_qcr_submit():
     """Handle QCR response for multi-reviewer items."""
     token = request.form.get('token')
     if not token:
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Missing token'), 400
+        return render_error_page('Missing token'), 400
     
     conn = get_db()
     cursor = conn.cursor()
@@ -14242,12 +14237,11 @@ def respond_multi_qcr_submit():
     
     if not item:
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE, error='Invalid or expired token'), 404
+        return render_error_page('Invalid or expired token'), 404
     
     if item['status'] == 'Closed':
         conn.close()
-        return render_template_string(ERROR_PAGE_TEMPLATE,
-            error='This item has been closed.'), 403
+        return render_error_page('This item has been closed.'), 403
     
     # Get form data
     qc_action = request.form.get('qc_action')
@@ -14284,7 +14278,7 @@ def respond_multi_qcr_submit():
         # Send emails to all reviewers
         send_multi_reviewer_sendback_emails(item_id, sendback_notes)
         
-        return render_template_string(SUCCESS_TEMPLATE,
+        return render_success_page(
             message='Sent Back to Reviewers',
             details='All reviewers have been notified to revise their responses.'
         )
@@ -14322,7 +14316,7 @@ def respond_multi_qcr_submit():
             item_id
         )
         
-        return render_template_string(SUCCESS_TEMPLATE,
+        return render_success_page(
             message='QC Review Complete!',
             details=f'Final response category: {response_category}. The item is now ready for response.'
         )
@@ -14795,16 +14789,7 @@ def api_send_item_reminder(item_id):
     cursor = conn.cursor()
     
     # Get item with reviewer and QCR info
-    cursor.execute('''
-        SELECT i.*, 
-               ir.display_name as reviewer_name, ir.email as reviewer_email,
-               qcr.display_name as qcr_name, qcr.email as qcr_email
-        FROM item i
-        LEFT JOIN user ir ON i.initial_reviewer_id = ir.id
-        LEFT JOIN user qcr ON i.qcr_id = qcr.id
-        WHERE i.id = ?
-    ''', (item_id,))
-    item = cursor.fetchone()
+    item = _fetch_item_with_users(cursor, item_id)
     
     if not item:
         conn.close()
@@ -15000,6 +14985,14 @@ def index():
     """Serve the main dashboard."""
     return send_from_directory('static', 'index.html')
 
+@app.route('/static/<any("qcr.css", "qcr.js"):filename>')
+def serve_page_asset(filename):
+    """Serve the magic-link page stylesheet and script with long-lived cache headers."""
+    response = send_from_directory('static', filename, max_age=31536000)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
 @app.route('/<path:filename>')
 def serve_static(filename):
     """Serve static files."""
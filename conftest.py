@@ -0,0 +1,28 @@
+"""Shared pytest fixtures for the tracker test scripts."""
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app as tracker_app
+
+
+def _drain_connection_pool():
+    # Pooled connections stay bound to whichever database file opened them
+    while not tracker_app._idle_connections.empty():
+        conn = tracker_app._idle_connections.get_nowait()
+        sqlite3.Connection.close(conn)
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point the app at a fresh, fully migrated database under tmp_path."""
+    monkeypatch.setattr(tracker_app, 'DATABASE_PATH', tmp_path / 'tracker.db')
+    _drain_connection_pool()
+    tracker_app.init_db()
+    yield tracker_app.DATABASE_PATH
+    _drain_connection_pool()
@@ -5,9 +5,9 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app import get_items_needing_reminders, process_all_reminders, init_db
+from app import get_items_needing_reminders, process_all_reminders, init_db_if_needed
 
-init_db()
+init_db_if_needed()
 items = get_items_needing_reminders()
 
 print('Items needing reminders today:')
@@ -0,0 +1,199 @@
+// =============================================================================
+// QC Review Form Behaviour (magic-link response pages)
+// =============================================================================
+// Shared by the single-reviewer and multi-reviewer QC forms. Each page loads
+// this file and calls the matching initializer with its form selector.
+
+window.QCR = (function() {
+    const $ = id => document.getElementById(id);
+
+    // DOM writes are queued by key and flushed together in the next animation
+    // frame, so rapid toggles (e.g. flipping radios back and forth) collapse
+    // into a single update per key. A newer update for a key replaces the
+    // queued one and moves to the end, keeping writes in the order made.
+    const pendingUpdates = new Map();
+
+    function scheduleUpdate(key, apply) {
+        if (pendingUpdates.size === 0) {
+            requestAnimationFrame(flushUpdates);
+        }
+        pendingUpdates.delete(key);
+        pendingUpdates.set(key, apply);
+    }
+
+    function flushUpdates() {
+        const updates = [...pendingUpdates.values()];
+        pendingUpdates.clear();
+        updates.forEach(apply => apply());
+    }
+
+    // Form validation: fields carry required flags (toggled by the form
+    // handlers) and a data-error message the browser shows for missing values.
+    // textFields are trimmed before validating, since required accepts
+    // whitespace-only text. Messages are set on each submit from the fields'
+    // current state, so one never outlives the required flag it was set for.
+    function initValidation(form, textFields) {
+        function clearError(e) {
+            const field = e.target;
+            if (field.type === 'radio') {
+                form.elements[field.name].forEach(radio => radio.setCustomValidity(''));
+            } else if (field.setCustomValidity) {
+                field.setCustomValidity('');
+            }
+        }
+        form.addEventListener('input', clearError);
+        form.addEventListener('change', clearError);
+
+        form.addEventListener('submit', function(e) {
+            for (const field of textFields) {
+                if (field.required) field.value = field.value.trim();
+            }
+            for (const field of form.elements) {
+                if (!field.setCustomValidity) continue;
+                field.setCustomValidity(field.validity.valueMissing ? field.dataset.error || '' : '');
+            }
+            if (!form.checkValidity()) {
+                e.preventDefault();
+                form.reportValidity();
+            }
+        });
+    }
+
+    // Change a field's required flag, dropping any message shown under the old one
+    function setRequired(field, required) {
+        field.required = required;
+        field.setCustomValidity('');
+    }
+
+    // Single-reviewer QC form: Approve / Modify / Send Back, plus the
+    // Keep / Tweak / Revise response modes.
+    function initQCForm(options) {
+        const form = document.querySelector(options.form);
+        const reviewerText = $('reviewer_original_text')?.innerText || options.reviewerText || '';
+        const responseModeGroup = $('response-mode-group');
+        const categoryGroup = $('category-group');
+        const filesGroup = $('files-group');
+        const sendBackWarning = $('send-back-warning');
+        const notesRequiredHint = $('notes-required-hint');
+        const responseTextReadonly = $('response_text_readonly');
+        const responseTextArea = $('response_text_area');
+        const submitBtn = $('submit-btn');
+        const categorySelect = $('response_category');
+
+        // Submit button label and style for each QC action
+        const BTN_LABELS = {
+            'Approve': '✅ Approve & Complete',
+            'Modify': '✏️ Submit Modifications',
+            'Send Back': '↩️ Send Back to Reviewer'
+        };
+        const BTN_CLASS = {
+            'Approve': 'btn-approve',
+            'Modify': 'btn-modify',
+            'Send Back': 'btn-sendback'
+        };
+
+        // Each handler works out the target state first, then schedules every
+        // DOM write for the next animation frame to avoid repeated reflows.
+        function handleActionChange(action) {
+            const sendingBack = action === 'Send Back';
+            const state = sendingBack
+                // Show textarea for Send Back explanation
+                ? { editing: true, text: '', placeholder: 'Explain what revisions are needed...' }
+                // Reset to Keep mode display
+                : { editing: false, text: reviewerText, placeholder: null };
+
+            scheduleUpdate('action', () => {
+                responseModeGroup.classList.toggle('hidden', sendingBack);
+                categoryGroup.classList.toggle('hidden', sendingBack);
+                filesGroup.classList.toggle('hidden', sendingBack);
+                sendBackWarning.classList.toggle('hidden', !sendingBack);
+                notesRequiredHint.classList.toggle('hidden', !sendingBack);
+                setRequired(categorySelect, !sendingBack);
+                setRequired(responseTextArea, sendingBack);
+                submitBtn.textContent = BTN_LABELS[action];
+                submitBtn.className = 'btn ' + BTN_CLASS[action];
+                applyResponseText(state);
+            });
+        }
+
+        function handleModeChange(mode) {
+            let state;
+            if (mode === 'Keep') {
+                state = { editing: false, text: reviewerText, placeholder: null };
+            } else if (mode === 'Tweak') {
+                state = { editing: true, text: reviewerText, placeholder: null };
+            } else if (mode === 'Revise') {
+                state = { editing: true, text: '', placeholder: 'Write your new response text here...' };
+            } else {
+                return;
+            }
+            scheduleUpdate('mode', () => applyResponseText(state));
+        }
+
+        function applyResponseText(state) {
+            responseTextReadonly.classList.toggle('hidden', state.editing);
+            responseTextArea.classList.toggle('hidden', !state.editing);
+            responseTextArea.value = state.text;
+            if (state.placeholder) {
+                responseTextArea.placeholder = state.placeholder;
+            }
+        }
+
+        // One delegated listener handles both radio groups
+        form.addEventListener('change', function(e) {
+            if (e.target.name === 'qc_action') {
+                handleActionChange(e.target.value);
+            } else if (e.target.name === 'response_mode') {
+                handleModeChange(e.target.value);
+            }
+        });
+
+        initValidation(form, [responseTextArea]);
+    }
+
+    // Multi-reviewer QC form: Complete with a final response, or Send Back
+    // to all reviewers.
+    function initMultiQCForm(options) {
+        const form = document.querySelector(options.form);
+        const completeFields = $('complete-fields');
+        const sendbackFields = $('sendback-fields');
+        const sendBackWarning = $('send-back-warning');
+        const submitBtn = $('submit-btn');
+        const categorySelect = $('response_category');
+        const responseText = $('response_text');
+        const sendbackNotes = $('sendback_notes');
+
+        // Submit button label and style for each QC action
+        const BTN_LABELS = {
+            'Complete': '✅ Submit Final Response',
+            'Send Back': '↩️ Send Back to All Reviewers'
+        };
+        const BTN_CLASS = {
+            'Complete': 'btn-approve',
+            'Send Back': 'btn-sendback'
+        };
+
+        // Handle QC Action change (delegated to the form)
+        form.addEventListener('change', function(e) {
+            if (e.target.name !== 'qc_action') return;
+            const action = e.target.value;
+            const sendingBack = action === 'Send Back';
+
+            // Apply all DOM writes in one frame to avoid repeated reflows
+            scheduleUpdate('action', () => {
+                completeFields.classList.toggle('hidden', sendingBack);
+                sendbackFields.classList.toggle('hidden', !sendingBack);
+                sendBackWarning.classList.toggle('hidden', !sendingBack);
+                setRequired(categorySelect, !sendingBack);
+                setRequired(responseText, !sendingBack);
+                setRequired(sendbackNotes, sendingBack);
+                submitBtn.textContent = BTN_LABELS[action];
+                submitBtn.className = 'btn ' + BTN_CLASS[action];
+            });
+        });
+
+        initValidation(form, [responseText, sendbackNotes]);
+    }
+
+    return { initQCForm, initMultiQCForm };
+})();
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Test that form templates fill every placeholder exactly once."""
+
+import io
+import os
+import re
+import sys
+
+import pytest
+
+# Add the app directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import (
+    CompiledTemplate,
+    TEMPLATES_DIR,
+    _PLACEHOLDER_RE,
+    get_db,
+    generate_reviewer_form_html,
+    generate_qcr_form_html,
+    generate_multi_reviewer_qcr_form,
+)
+
+TEMPLATE_FILES = sorted(p for p in TEMPLATES_DIR.iterdir() if p.suffix in ('.html', '.hta'))
+
+_MARKER_RE = re.compile(r'<<VALUE:([A-Z_]+)>>')
+
+
+def _marker_values(names):
+    """One unique marker per placeholder; each also carries placeholder-like text.
+
+    If a value were scanned again after substitution, its {{ITEM_ID}} would be
+    replaced and the count of leftover placeholders would drop.
+    """
+    return {name: f'<<VALUE:{name}>>{{{{ITEM_ID}}}}' for name in names}
+
+
+@pytest.mark.parametrize('template_path', TEMPLATE_FILES, ids=lambda p: p.name)
+def test_every_placeholder_filled_once(template_path):
+    text = template_path.read_text(encoding='utf-8')
+    occurrences = _PLACEHOLDER_RE.findall(text)
+    assert occurrences, f"{template_path.name} has no placeholders"
+
+    rendered = CompiledTemplate(text).render(_marker_values(set(occurrences)))
+
+    # Each placeholder occurrence became exactly one copy of its value
+    for name in set(occurrences):
+        assert _MARKER_RE.findall(rendered).count(name) == occurrences.count(name), name
+    # Nothing is left unfilled, and value text was not filled a second time
+    assert _PLACEHOLDER_RE.findall(rendered) == ['ITEM_ID'] * len(occurrences)
+    # Template text outside the placeholders is untouched
+    assert _MARKER_RE.sub('', rendered).replace('{{ITEM_ID}}', '') == _PLACEHOLDER_RE.sub('', text)
+
+
+@pytest.mark.parametrize('template_path', TEMPLATE_FILES, ids=lambda p: p.name)
+def test_render_to_matches_render(template_path):
+    template = CompiledTemplate(template_path.read_text(encoding='utf-8'))
+    values = _marker_values(set(_PLACEHOLDER_RE.findall(template_path.read_text(encoding='utf-8'))))
+    out = io.StringIO()
+    template.render_to(out, values)
+    assert out.getvalue() == template.render(values)
+
+
+def test_unknown_placeholder_left_in_place():
+    template = CompiledTemplate('<p>{{ITEM_ID}} / {{NOT_PROVIDED}}</p>')
+    assert template.render({'ITEM_ID': '7'}) == '<p>7 / {{NOT_PROVIDED}}</p>'
+
+
+def _seed_item(folder):
+    conn = get_db()
+    conn.execute("INSERT INTO user(id, email, password_hash, display_name, role) "
+                 "VALUES (10, 'rev@example.com', 'x', 'Rev', 'user'), "
+                 "(11, 'qcr@example.com', 'x', 'Qcr', 'user')")
+    conn.execute("INSERT INTO item(id, type, bucket, identifier, title, status, folder_link, "
+                 "initial_reviewer_id, qcr_id, priority) "
+                 "VALUES (1, 'Submittal', 'ALL', 'S-001', 'Pump {{ITEM_ID}} schedule', "
+                 "'In Review', ?, 10, 11, 'Medium')", (str(folder),))
+    conn.execute("INSERT INTO item_reviewers(item_id, user_id, reviewer_name, reviewer_email, needs_response) "
+                 "VALUES (1, 10, 'Rev', 'rev@example.com', 1)")
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.parametrize('generate', [
+    generate_reviewer_form_html,
+    generate_qcr_form_html,
+    # Single reviewer in item_reviewers: fills the regular QCR template
+    generate_multi_reviewer_qcr_form,
+], ids=lambda f: f.__name__)
+def test_generated_form_has_no_unfilled_placeholders(temp_db, tmp_path, generate):
+    folder = tmp_path / 'S-001'
+    folder.mkdir()
+    _seed_item(folder)
+
+    result = generate(1)
+
+    assert result['success'], result
+    html = open(result['path'], encoding='utf-8').read()
+    # The title's literal {{ITEM_ID}} is data and must survive as written
+    assert 'Pump {{ITEM_ID}} schedule' in html
+    assert _PLACEHOLDER_RE.findall(html) == ['ITEM_ID'] * html.count('Pump {{ITEM_ID}} schedule')
+
+
+NOTE = 'First line\nSecond line\r\nThird line'
+
+
+def _seed_qcr_item(folder):
+    _seed_item(folder)
+    conn = get_db()
+    conn.execute("UPDATE item SET type = 'RFI', status = 'In QC', reviewer_notes = ?, "
+                 "reviewer_internal_notes = ?, rfi_question = ? WHERE id = 1", (NOTE, NOTE, NOTE))
+    conn.execute("UPDATE item_reviewers SET internal_notes = ? WHERE item_id = 1", (NOTE,))
+    conn.commit()
+    conn.close()
+
+
+def _element_text(html, pattern):
+    match = re.search(pattern + r'>(.*?)</', html, re.DOTALL)
+    assert match, pattern
+    return match.group(1)
+
+
+@pytest.mark.parametrize('generate', [
+    generate_qcr_form_html,
+    # Single reviewer in item_reviewers: fills the same v3 QCR template
+    generate_multi_reviewer_qcr_form,
+], ids=lambda f: f.__name__)
+def test_qcr_form_keeps_note_line_breaks(temp_db, tmp_path, generate):
+    folder = tmp_path / 'S-001'
+    folder.mkdir()
+    _seed_qcr_item(folder)
+
+    result = generate(1)
+
+    assert result['success'], result
+    html = open(result['path'], encoding='utf-8', newline='').read()
+    # These sit in the page body, and Keep mode submits reviewer_notes_display's
+    # text as the final response, so line breaks must not become a literal \n
+    for pattern in (r'id="reviewer_notes_display"', r'id="response_text_readonly"',
+                    r'<textarea id="response_text_area"[^>]*', r'id="rfi-question-text"[^>]*',
+                    r'color: #744210; white-space: pre-wrap;"'):
+        text = _element_text(html, pattern)
+        assert text.replace('\r', '') == 'First line\nSecond line\nThird line', pattern
+    assert '\\n' not in html.split('<script', 1)[0]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""Test reminder candidate selection and already-sent suppression against a seeded database."""
+
+import os
+import sys
+from datetime import datetime, date, timedelta
+
+import pytest
+
+# Add the app directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from app import (
+    _reminder_stage,
+    get_db,
+    get_items_needing_reminders,
+    has_reminder_been_sent,
+    load_sent_reminders,
+    record_reminder_sent,
+    send_single_reviewer_reminder_email,
+    send_multi_reviewer_reminder_email,
+    send_multi_reviewer_qcr_reminder_email,
+)
+
+# A Wednesday, so yesterday is a business day
+TODAY = date(2026, 3, 4)
+
+
+def day(offset):
+    return (TODAY + timedelta(days=offset)).isoformat()
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(TODAY.year, TODAY.month, TODAY.day, 9, 0, tzinfo=tz)
+
+
+# -----------------------------------------------------------------------------
+# _reminder_stage
+# -----------------------------------------------------------------------------
+
+@pytest.mark.parametrize('due_date, today, late_assignment, expected', [
+    (date(2026, 3, 4), date(2026, 3, 4), False, 'due_today'),
+    (date(2026, 3, 4), date(2026, 3, 4), True, 'due_today'),
+    (date(2026, 3, 3), date(2026, 3, 4), False, 'overdue'),
+    # Due Friday -> overdue reminder on Monday, not over the weekend
+    (date(2026, 2, 27), date(2026, 3, 2), False, 'overdue'),
+    (date(2026, 2, 27), date(2026, 2, 28), False, None),
+    (date(2026, 3, 2), date(2026, 3, 4), False, None),
+    # Assigned yesterday when already overdue: one overdue reminder today
+    (date(2026, 3, 2), date(2026, 3, 4), True, 'overdue'),
+])
+def test_reminder_stage(due_date, today, late_assignment, expected):
+    assert _reminder_stage(due_date, today, late_assignment) == expected
+
+
+# -----------------------------------------------------------------------------
+# get_items_needing_reminders
+# -----------------------------------------------------------------------------
+
+# (id, multi_reviewer_mode, status, reviewer_due, qcr_due, qcr_email_sent_at, extra columns)
+ITEMS = [
+    # Single reviewer, reviewer's court
+    (1, 0, 'Assigned', day(0), None, None, {}),
+    (2, 0, 'In Review', day(-1), None, None, {}),
+    (3, 0, 'In Review', day(-2), None, None, {}),
+    (4, 0, 'Assigned', day(0), None, None, {'reviewer_response_at': day(-1)}),
+    (5, 0, 'Assigned', day(0), None, None, {'reviewer_email_sent_at': None}),
+    (6, 0, 'In Review', day(0), None, None, {'closed_at': day(0)}),
+    # Single reviewer, QCR's court
+    (11, 0, 'In QC', None, day(0), day(-3), {}),
+    (12, 0, 'In QC', None, day(-1), day(-3), {}),
+    (13, 0, 'In QC', None, day(-2), day(-1), {}),
+    (14, 0, 'In QC', None, day(-2), day(-3), {}),
+    (15, 0, 'In QC', None, day(0), day(0), {}),
+    (16, 0, 'In QC', None, day(0), day(-3), {'qcr_response_at': day(-1)}),
+    # Multi-reviewer, reviewers' court
+    (21, 1, 'In Review', day(0), None, None, {}),
+    (22, 1, 'Assigned', day(-1), None, None, {}),
+    (23, 1, 'In Review', day(-2), None, None, {}),
+    # Multi-reviewer, QCR's court
+    (31, 1, 'In QC', None, day(0), day(-3), {}),
+    (32, 1, 'In QC', None, day(-1), day(-3), {}),
+    (33, 1, 'In QC', None, day(-2), day(-1), {}),
+    (34, 1, 'In QC', None, day(-2), day(-3), {}),
+]
+
+# (id, item_id, reviewer_email, response_at, email_sent_at, needs_response)
+ITEM_REVIEWERS = [
+    (101, 21, 'ann@example.com', None, day(-5), 1),
+    (102, 21, 'ben@example.com', day(-1), day(-5), 1),
+    (103, 21, 'cat@example.com', None, day(-5), 0),
+    (104, 21, 'dan@example.com', None, None, 1),
+    (105, 22, 'eve@example.com', None, day(-5), 1),
+    (106, 22, 'fay@example.com', None, day(-5), 1),
+    (107, 23, 'gus@example.com', None, day(-5), 1),
+]
+
+
+@pytest.fixture
+def seeded_db(temp_db, monkeypatch):
+    monkeypatch.setattr(app, 'datetime', FixedDatetime)
+    monkeypatch.setattr(app, 'is_local_mode', lambda: False)
+    conn = get_db()
+    conn.execute("INSERT INTO user(id, email, password_hash, display_name, role) "
+                 "VALUES (10, 'rev@example.com', 'x', 'Rev', 'user'), "
+                 "(11, 'qcr@example.com', 'x', 'Qcr', 'user')")
+    for item_id, multi, status, reviewer_due, qcr_due, qcr_sent, extra in ITEMS:
+        row = {
+            'id': item_id, 'type': 'Submittal', 'bucket': 'ALL', 'identifier': f'S-{item_id:03d}',
+            'title': 'Pump schedule', 'priority': 'Medium', 'status': status,
+            'multi_reviewer_mode': multi, 'initial_reviewer_id': 10, 'qcr_id': 11,
+            'initial_reviewer_due_date': reviewer_due, 'qcr_due_date': qcr_due,
+            'reviewer_email_sent_at': day(-5), 'qcr_email_sent_at': qcr_sent,
+        }
+        row.update(extra)
+        columns = ', '.join(row)
+        conn.execute(f"INSERT INTO item({columns}) VALUES ({', '.join('?' * len(row))})", tuple(row.values()))
+    for reviewer_id, item_id, email, response_at, email_sent_at, needs_response in ITEM_REVIEWERS:
+        conn.execute("INSERT INTO item_reviewers(id, item_id, reviewer_name, reviewer_email, response_at, "
+                     "email_sent_at, needs_response) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                     (reviewer_id, item_id, email.split('@')[0].title(), email, response_at,
+                      email_sent_at, needs_response))
+    conn.commit()
+    conn.close()
+    return temp_db
+
+
+def _summarize(result):
+    return {
+        'single_reviewer': sorted((item['id'], role, due.isoformat(), stage)
+                                  for item, role, due, stage in result['single_reviewer']),
+        'multi_reviewer': sorted((item['id'], reviewer['id'], role, due.isoformat(), stage)
+                                 for item, reviewer, role, due, stage in result['multi_reviewer']),
+        'multi_reviewer_qcr': sorted((item['id'], due.isoformat(), stage)
+                                     for item, due, stage in result['multi_reviewer_qcr']),
+    }
+
+
+def test_candidates_at_each_stage(seeded_db):
+    assert _summarize(get_items_needing_reminders()) == {
+        'single_reviewer': [
+            (1, 'reviewer', day(0), 'due_today'),
+            (2, 'reviewer', day(-1), 'overdue'),
+            (11, 'qcr', day(0), 'due_today'),
+            (12, 'qcr', day(-1), 'overdue'),
+            (13, 'qcr', day(-2), 'overdue'),
+        ],
+        'multi_reviewer': [
+            (21, 101, 'reviewer', day(0), 'due_today'),
+            (22, 105, 'reviewer', day(-1), 'overdue'),
+            (22, 106, 'reviewer', day(-1), 'overdue'),
+        ],
+        'multi_reviewer_qcr': [
+            (31, day(0), 'due_today'),
+            (32, day(-1), 'overdue'),
+            (33, day(-2), 'overdue'),
+        ],
+    }
+
+
+def test_candidate_rows_carry_recipients(seeded_db):
+    result = get_items_needing_reminders()
+    for item, role, _, _ in result['single_reviewer']:
+        assert item['reviewer_email'] == 'rev@example.com'
+        assert item['qcr_email'] == 'qcr@example.com'
+        assert 'court' not in item and 'reminder_due_date' not in item
+    for item, reviewer, _, _, _ in result['multi_reviewer']:
+        assert reviewer['item_id'] == item['id']
+        assert item['qcr_email'] == 'qcr@example.com'
+    for item, _, _ in result['multi_reviewer_qcr']:
+        assert item['qcr_email'] == 'qcr@example.com'
+
+
+def _record_sent(result, single_ids, reviewer_ids, qcr_ids):
+    for item, role, due, stage in result['single_reviewer']:
+        if item['id'] in single_ids:
+            email = item['reviewer_email'] if role == 'reviewer' else item['qcr_email']
+            record_reminder_sent(item['id'], 'single_reviewer', email, role, due.isoformat(), stage)
+    for item, reviewer, role, due, stage in result['multi_reviewer']:
+        if reviewer['id'] in reviewer_ids:
+            record_reminder_sent(item['id'], 'multi_reviewer', reviewer['reviewer_email'], role,
+                                 due.isoformat(), stage, reviewer['id'])
+    for item, due, stage in result['multi_reviewer_qcr']:
+        if item['id'] in qcr_ids:
+            record_reminder_sent(item['id'], 'multi_reviewer', item['qcr_email'], 'qcr', due.isoformat(), stage)
+
+
+def test_already_sent_suppression(seeded_db, monkeypatch):
+    result = get_items_needing_reminders()
+    _record_sent(result, single_ids={1, 13}, reviewer_ids={105}, qcr_ids={32})
+    # A reminder for an earlier due date does not count for the current one
+    record_reminder_sent(2, 'single_reviewer', 'rev@example.com', 'reviewer', day(-8), 'overdue')
+
+    item_ids = sorted({entry[0]['id'] for entries in result.values() for entry in entries})
+    sent_reminders = load_sent_reminders(item_ids)
+
+    def sent(item_id, email, role, stage, due, reviewer_id=None):
+        prefetched = has_reminder_been_sent(item_id, email, role, stage, reviewer_id, due_date=due.isoformat(),
+                                            sent_reminders=sent_reminders)
+        # The prefetched set answers exactly as the per-reminder query does
+        assert prefetched == has_reminder_been_sent(item_id, email, role, stage, reviewer_id,
+                                                    due_date=due.isoformat())
+        return prefetched
+
+    assert {item['id']: sent(item['id'], item[f'{role}_email'], role, stage, due)
+            for item, role, due, stage in result['single_reviewer']} == {
+        1: True, 2: False, 11: False, 12: False, 13: True}
+    assert {reviewer['id']: sent(item['id'], reviewer['reviewer_email'], role, stage, due, reviewer['id'])
+            for item, reviewer, role, due, stage in result['multi_reviewer']} == {
+        101: False, 105: True, 106: False}
+    assert {item['id']: sent(item['id'], item['qcr_email'], 'qcr', stage, due)
+            for item, due, stage in result['multi_reviewer_qcr']} == {
+        31: False, 32: True, 33: False}
+
+    # The senders skip the already-sent reminders before reaching Outlook
+    monkeypatch.setattr(app, 'HAS_WIN32COM', True)
+    for item, role, due, stage in result['single_reviewer']:
+        if item['id'] in (1, 13):
+            assert send_single_reviewer_reminder_email(item, role, due, stage, sent_reminders)['skipped']
+    for item, reviewer, role, due, stage in result['multi_reviewer']:
+        if reviewer['id'] == 105:
+            assert send_multi_reviewer_reminder_email(item, reviewer, role, due, stage, sent_reminders)['skipped']
+    for item, due, stage in result['multi_reviewer_qcr']:
+        if item['id'] == 32:
+            assert send_multi_reviewer_qcr_reminder_email(item, due, stage, sent_reminders)['skipped']
+
+
+def test_load_sent_reminders_chunks_long_id_lists(seeded_db):
+    # More ids than one IN list takes
+    record_reminder_sent(34, 'multi_reviewer', 'qcr@example.com', 'qcr', day(-2), 'overdue')
+    sent_reminders = load_sent_reminders(list(range(1, 1200)))
+    assert (34, 'qcr@example.com', 'qcr', 'overdue', day(-2)) in sent_reminders
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))
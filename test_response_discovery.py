@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Test that the single-walk response file scan finds what the per-pattern rglob scans found."""
+
+import os
+import re
+import sys
+from fnmatch import fnmatchcase
+
+import pytest
+
+# Add the app directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import app
+from app import _find_response_files
+
+FILE_NAMES = [
+    '_reviewer_response.json',
+    '_RESPONSE_20240101.json',
+    '_RESPONSE_a.b.json',
+    '_RESPONSE_.json',
+    '_RESPONSE_x.json.old',
+    '_RESPONSE_.txt',
+    '_qcr_response.json',
+    '_multi_reviewer_qcr_response.json',
+    '_multi_reviewer_response_R1.json',
+    '_multi_reviewer_response_.json',
+    '_multi_reviewer_response_processed_1.json',
+    '_multi_reviewer_response_already_processed_1.json',
+    '_multi_reviewer_response_resubmit_1.json',
+    '_multi_reviewer_response_R1_resubmit_2.json',
+    '_reviewer_response_processed_1.json',
+    '_qcr_response_processed_1.json',
+    'other.json',
+    'reviewer_response.json',
+    # Only matched where names are case-insensitive
+    '_Reviewer_Response.json',
+    '_response_lower.json',
+    '_QCR_RESPONSE.JSON',
+    '_Multi_Reviewer_Response_R2.json',
+    '_Multi_Reviewer_Response_PROCESSED_3.json',
+    '_MULTI_REVIEWER_QCR_RESPONSE.json',
+]
+
+# The patterns the scan used to rglob for, in import order
+OLD_PATTERNS = [
+    ('reviewer', '_reviewer_response.json'),
+    ('reviewer', '_RESPONSE_*.json'),
+    ('qcr', '_qcr_response.json'),
+    ('multi_reviewer', '_multi_reviewer_response_*.json'),
+    ('multi_reviewer_qcr', '_multi_reviewer_qcr_response.json'),
+]
+
+
+def old_find_response_files(base_path, ignore_case):
+    """The per-pattern rglob scans, with rglob's platform case rules made explicit."""
+    files = [os.path.join(root, name) for root, _, names in os.walk(base_path) for name in names]
+    found = []
+    for kind, pattern in OLD_PATTERNS:
+        for path in files:
+            name = os.path.basename(path)
+            if ignore_case:
+                matched = fnmatchcase(name.lower(), pattern.lower())
+            else:
+                matched = fnmatchcase(name, pattern)
+            if not matched:
+                continue
+            if kind == 'multi_reviewer' and (
+                    '_processed_' in name or '_already_processed_' in name or '_resubmit_' in name):
+                continue
+            found.append((kind, path))
+    return found
+
+
+@pytest.fixture
+def response_tree(tmp_path):
+    for item in ('S-001', 'S-002'):
+        for sub in ('', 'Responses', 'Responses/archive'):
+            folder = tmp_path / item / sub
+            folder.mkdir(parents=True, exist_ok=True)
+            for name in FILE_NAMES:
+                (folder / name).write_text('{}')
+    # A directory with a response file name is not a response
+    (tmp_path / 'S-003' / '_qcr_response.json').mkdir(parents=True)
+    return tmp_path
+
+
+def _assert_same_as_old(base_path, ignore_case):
+    expected = old_find_response_files(base_path, ignore_case)
+    found = [(kind, str(path)) for kind, path, _ in _find_response_files(base_path)]
+    # Kinds come back grouped in the old scan order
+    assert [kind for kind, _ in found] == [kind for kind, _ in expected]
+    assert sorted(found) == sorted(expected)
+    return found
+
+
+def test_matches_old_scan(response_tree, monkeypatch):
+    monkeypatch.setattr(app, '_RESPONSE_FILE_RE', re.compile(app._RESPONSE_FILE_RE.pattern))
+    found = _assert_same_as_old(response_tree, ignore_case=False)
+    names = {os.path.basename(path) for _, path in found}
+    assert names == {
+        '_reviewer_response.json', '_RESPONSE_20240101.json', '_RESPONSE_a.b.json', '_RESPONSE_.json',
+        '_qcr_response.json', '_multi_reviewer_qcr_response.json',
+        '_multi_reviewer_response_R1.json', '_multi_reviewer_response_.json',
+    }
+
+
+def test_matches_old_scan_case_insensitive_on_nt(response_tree, monkeypatch):
+    # What the module compiles when os.name == 'nt'
+    monkeypatch.setattr(app, '_RESPONSE_FILE_RE', re.compile(app._RESPONSE_FILE_RE.pattern, re.IGNORECASE))
+    found = _assert_same_as_old(response_tree, ignore_case=True)
+    kinds = {os.path.basename(path): kind for kind, path in found}
+    assert kinds['_Reviewer_Response.json'] == 'reviewer'
+    assert kinds['_response_lower.json'] == 'reviewer'
+    assert kinds['_QCR_RESPONSE.JSON'] == 'qcr'
+    assert kinds['_Multi_Reviewer_Response_R2.json'] == 'multi_reviewer'
+    assert kinds['_MULTI_REVIEWER_QCR_RESPONSE.json'] == 'multi_reviewer_qcr'
+    # The processed/resubmit exclusion was a case-sensitive substring check
+    assert kinds['_Multi_Reviewer_Response_PROCESSED_3.json'] == 'multi_reviewer'
+    assert '_multi_reviewer_response_processed_1.json' not in kinds
+
+
+def test_module_regex_follows_platform():
+    ignore_case = bool(app._RESPONSE_FILE_RE.flags & re.IGNORECASE)
+    assert ignore_case == (os.name == 'nt')
+
+
+def test_missing_base_path(tmp_path):
+    assert _find_response_files(tmp_path / 'missing') == []
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-q']))